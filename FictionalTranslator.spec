@@ -5,7 +5,7 @@ a = Analysis(
     ['src\\__main__.py'],
     pathex=[],
     binaries=[],
-    datas=[('assets', 'assets')],
+    datas=[('assets', 'assets'), ('src\\languages\\packs', 'src\\languages\\packs')],
     hiddenimports=[],
     hookspath=[],
     hooksconfig={},
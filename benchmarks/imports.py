@@ -0,0 +1,159 @@
+"""
+Import-time budget for the package's entry points.
+
+Each module is imported in a fresh interpreter run with ``python -X importtime``.
+The cumulative time of the module's own import, best of a few runs, is checked
+against its budget, and the heavy optional dependencies it must not import on
+its own are checked too::
+
+    python -m benchmarks.imports
+
+Exits with status 1 if a module is over budget or imports a forbidden module.
+"""
+
+import argparse
+import importlib.util
+import subprocess
+import sys
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+# Milliseconds of cumulative import time allowed per module, excluding
+# interpreter startup: about twice the times measured on a developer machine,
+# so an eager import of a heavy module goes over budget.
+IMPORT_BUDGETS_MS = {
+    'src.languages': 60,
+    'src.translator': 150,
+    'src.daemon': 60,
+    'src.core': 60,
+    'src.cli': 200,
+}
+# Heavy dependencies that only the code paths using them may import
+HEAVY_MODULES = ('pydantic', 'rich', 'PyQt6', 'numpy', 'pythonjsonlogger', 'asyncio', 'http.server')
+FORBIDDEN_IMPORTS = {module: HEAVY_MODULES for module in IMPORT_BUDGETS_MS}
+# Daemon clients translate without loading any language
+for _client in ('src.daemon', 'src.cli'):
+    FORBIDDEN_IMPORTS[_client] += ('src.languages',)
+# Third-party modules an entry point needs; it is skipped if they are missing
+REQUIREMENTS = {'src.cli': ('click',)}
+DEFAULT_REPEATS = 3
+
+
+def parse_importtime(output: str) -> Dict[str, int]:
+    """Parse the ``-X importtime`` report.
+
+    Args:
+        output: The interpreter's stderr.
+
+    Returns:
+        Cumulative microseconds per imported module, in import order.
+    """
+    times = {}
+    for line in output.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        fields = line[len('import time:'):].split('|')
+        if len(fields) != 3 or not fields[1].strip().isdigit():
+            # The header line
+            continue
+        times[fields[2].strip()] = int(fields[1])
+    return times
+
+
+def measure_import(module: str, repeats: int = DEFAULT_REPEATS) -> Tuple[float, Set[str]]:
+    """Measure how long importing a module takes in a fresh interpreter.
+
+    Args:
+        module: Dotted module name.
+        repeats: Number of runs; the fastest counts.
+
+    Returns:
+        The module's cumulative import time in milliseconds and every module
+        the import loaded.
+
+    Raises:
+        RuntimeError: If the import fails.
+    """
+    best = float('inf')
+    imported: Set[str] = set()
+    for _ in range(repeats):
+        process = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+            capture_output=True,
+            text=True,
+        )
+        if process.returncode != 0:
+            raise RuntimeError(f"Importing {module} failed:\n{process.stderr[-2000:]}")
+        times = parse_importtime(process.stderr)
+        best = min(best, times.get(module, 0) / 1000)
+        imported = set(times)
+    return best, imported
+
+
+def available(module: str) -> bool:
+    """Check whether an entry point's third-party requirements are installed."""
+    return all(importlib.util.find_spec(name) is not None for name in REQUIREMENTS.get(module, ()))
+
+
+def check_budgets(
+    modules: Optional[Sequence[str]] = None,
+    repeats: int = DEFAULT_REPEATS,
+    progress: Optional[Callable[[str, Optional[float]], None]] = None,
+    timed: bool = True,
+) -> List[str]:
+    """Check modules against their import-time budgets.
+
+    Modules whose requirements are missing are skipped.
+
+    Args:
+        modules: Modules from ``IMPORT_BUDGETS_MS``; defaults to all of them.
+        repeats: Runs per module.
+        progress: Called with each module and its import time in
+            milliseconds, or None if it was skipped.
+        timed: Whether to check the time budgets; if False, only the
+            forbidden imports are checked.
+
+    Returns:
+        A description of every violation.
+    """
+    violations = []
+    for module in modules or IMPORT_BUDGETS_MS:
+        if not available(module):
+            if progress is not None:
+                progress(module, None)
+            continue
+        milliseconds, imported = measure_import(module, repeats)
+        if progress is not None:
+            progress(module, milliseconds)
+        if timed and milliseconds > IMPORT_BUDGETS_MS[module]:
+            violations.append(f"{module}: {milliseconds:.1f} ms, budget {IMPORT_BUDGETS_MS[module]} ms")
+        for heavy in FORBIDDEN_IMPORTS.get(module, ()):
+            if heavy in imported:
+                violations.append(f"{module}: imports {heavy}")
+    return violations
+
+
+def _print_time(module: str, milliseconds: Optional[float]) -> None:
+    if milliseconds is None:
+        print(f"{module:<20} skipped, missing {', '.join(REQUIREMENTS[module])}", flush=True)
+    else:
+        print(f"{module:<20} {milliseconds:8.1f} ms  (budget {IMPORT_BUDGETS_MS[module]} ms)", flush=True)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Report import times from the command line.
+
+    Returns:
+        The exit status: 1 if any budget was violated, otherwise 0.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeats', type=int, default=DEFAULT_REPEATS, help='Runs per module; the fastest counts')
+    args = parser.parse_args(argv)
+
+    violations = check_budgets(repeats=args.repeats, progress=_print_time)
+    for violation in violations:
+        print(violation, file=sys.stderr)
+    return 1 if violations else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,409 @@
+"""
+Benchmark suite for the language transformers.
+
+Every language in ``LANGUAGE_TRANSFORMERS`` is timed in both directions over
+several input sizes and kinds of text. Each case reports throughput in MB/s of
+UTF-8 input and peak memory allocated while translating, measured with
+``tracemalloc`` in a separate run so it does not slow the timed runs.
+
+Results can be saved as a JSON baseline and later runs compared against it::
+
+    python -m benchmarks.suite --save benchmarks/baseline.json
+    python -m benchmarks.suite --compare benchmarks/baseline.json --threshold 0.25
+
+A comparison exits with status 1 if any case lost more than ``--threshold`` of
+its throughput or grew its peak memory by more than ``--memory-threshold``.
+Baselines are only meaningful on the machine that recorded them.
+
+``--fanout`` also times ``Translator.translate_all`` into every language against
+one ``Translator.translate`` call per language, and exits with status 1 if the
+fan-out costs more than ``--max-fanout-ratio`` of the separate calls::
+
+    python -m benchmarks.suite --fanout --max-fanout-ratio 1.0
+"""
+
+import argparse
+import gc
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
+
+from src.languages import LANGUAGE_TRANSFORMERS
+from src.languages.engine import case_variants
+from src.translator import Translator
+
+SIZES = {
+    '10B': 10,
+    '1KB': 1_000,
+    '100KB': 100_000,
+    '1MB': 1_000_000,
+    '10MB': 10_000_000,
+    '100MB': 100_000_000,
+}
+DEFAULT_SIZES = ['10B', '1KB', '100KB', '1MB']
+DIRECTIONS = ['forward', 'reverse']
+DEFAULT_THRESHOLD = 0.25
+DEFAULT_MEMORY_THRESHOLD = 0.5
+DEFAULT_MAX_FANOUT_RATIO = 1.0
+# Keep timing a case until this many seconds have passed, taking the best run
+MIN_TIME = 0.2
+MAX_REPEATS = 1000
+
+REALISTIC = (
+    "The old ranger paused at the edge of the forest, listening for the thrush "
+    "that always sang before dawn. \"We should have left yesterday,\" she said, "
+    "checking the straps of her pack. Three travellers, a cart, and 42 silver "
+    "coins: that was all the caravan could spare. Nobody spoke of what lay "
+    "beyond the ridge.\n\n"
+)
+UPPERCASE = REALISTIC.upper()
+NON_LATIN = (
+    "Приключения начинаются на рассвете. 旅は夜明けに始まる。 "
+    "ᚠᚢᚦᚨᚱᚲ ᛟᛞ — ☽ ✧ ⚔ 🐉🏰🗡️ Ωμέγα αλφα. مرحبا بالعالم\n"
+)
+CORPORA = ['realistic', 'digraphs', 'uppercase', 'non-latin']
+
+
+def digraph_text() -> str:
+    """Build adversarial text made only of digraphs.
+
+    Returns:
+        Every case spelling of every language's digraphs, once run together and
+        once separated by spaces.
+    """
+    digraphs = set()
+    for language in LANGUAGE_TRANSFORMERS:
+        digraphs.update(getattr(LANGUAGE_TRANSFORMERS[language](), 'digraph_mappings', {}))
+    spellings = sorted({variant for key in digraphs for variant in case_variants(key)})
+    return ''.join(spellings) + ' ' + ' '.join(spellings) + '\n'
+
+
+def corpus_text(corpus: str) -> str:
+    """Get the text of a corpus from ``CORPORA``."""
+    if corpus == 'digraphs':
+        return digraph_text()
+    return {'realistic': REALISTIC, 'uppercase': UPPERCASE, 'non-latin': NON_LATIN}[corpus]
+
+
+def make_text(corpus: str, size: int) -> str:
+    """Repeat a corpus to about ``size`` bytes of UTF-8.
+
+    Args:
+        corpus: Text to repeat.
+        size: Target size in bytes.
+
+    Returns:
+        Text whose UTF-8 encoding is at most ``size`` bytes and at least one
+        character long.
+    """
+    encoded = corpus.encode('utf-8')
+    repeats = size // len(encoded) + 1
+    data = (encoded * repeats)[:size]
+    return data.decode('utf-8', 'ignore') or corpus[0]
+
+
+def time_call(convert: Callable[[str], str], text: str, min_time: float = MIN_TIME) -> float:
+    """Time a conversion, returning the best of as many runs as fit in ``min_time``.
+
+    Args:
+        convert: The conversion to time.
+        text: Its input.
+        min_time: Seconds to keep repeating for.
+
+    Returns:
+        The fastest run in seconds.
+    """
+    best = float('inf')
+    deadline = time.perf_counter() + min_time
+    for _ in range(MAX_REPEATS):
+        start = time.perf_counter()
+        convert(text)
+        elapsed = time.perf_counter() - start
+        best = min(best, elapsed)
+        if start + elapsed >= deadline:
+            break
+    return best
+
+
+def peak_memory(convert: Callable[[str], str], text: str) -> int:
+    """Measure the peak memory allocated by one conversion.
+
+    Args:
+        convert: The conversion to measure.
+        text: Its input.
+
+    Returns:
+        Peak bytes allocated during the call, including the result.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        convert(text)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def case_name(language: str, direction: str, corpus: str, size: str) -> str:
+    """Build the identifier of a benchmark case."""
+    return f"{language}/{direction}/{corpus}/{size}"
+
+
+def run_suite(
+    languages: Optional[Iterable[str]] = None,
+    sizes: Sequence[str] = DEFAULT_SIZES,
+    corpora: Optional[Iterable[str]] = None,
+    min_time: float = MIN_TIME,
+    measure_memory: bool = True,
+    progress: Optional[Callable[[str, Dict], None]] = None,
+) -> Dict:
+    """Run the benchmarks.
+
+    Args:
+        languages: Languages to benchmark; defaults to every language.
+        sizes: Names of input sizes from ``SIZES``.
+        corpora: Names of texts from ``CORPORA``; defaults to all of them.
+        min_time: Seconds to spend timing each case.
+        measure_memory: Whether to measure peak memory.
+        progress: Called with each case's name and result as it finishes.
+
+    Returns:
+        A report with ``meta`` and ``results``, mapping case names to
+        ``bytes``, ``seconds``, ``throughput_mb_s`` and ``peak_bytes``.
+    """
+    languages = sorted(languages or LANGUAGE_TRANSFORMERS.keys())
+    corpora = {corpus: corpus_text(corpus) for corpus in corpora or CORPORA}
+    results: Dict[str, Dict] = {}
+    for language in languages:
+        transformer = LANGUAGE_TRANSFORMERS[language]()
+        for corpus, corpus_source in corpora.items():
+            for size in sizes:
+                source = make_text(corpus_source, SIZES[size])
+                inputs = {
+                    'forward': (transformer.transform, source),
+                    'reverse': (transformer.reverse_transform, transformer.transform(source)),
+                }
+                for direction in DIRECTIONS:
+                    convert, text = inputs[direction]
+                    size_bytes = len(text.encode('utf-8', 'surrogatepass'))
+                    seconds = time_call(convert, text, min_time)
+                    result = {
+                        'bytes': size_bytes,
+                        'seconds': seconds,
+                        'throughput_mb_s': size_bytes / seconds / 1e6 if seconds > 0 else float('inf'),
+                        'peak_bytes': peak_memory(convert, text) if measure_memory else None,
+                    }
+                    name = case_name(language, direction, corpus, size)
+                    results[name] = result
+                    if progress is not None:
+                        progress(name, result)
+    return {
+        'meta': {
+            'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'machine': platform.machine(),
+            'platform': platform.platform(),
+        },
+        'results': results,
+    }
+
+
+def run_fanout(
+    sizes: Sequence[str] = DEFAULT_SIZES,
+    corpora: Optional[Iterable[str]] = None,
+    min_time: float = MIN_TIME,
+    progress: Optional[Callable[[str, Dict], None]] = None,
+) -> Dict[str, Dict]:
+    """Time translating into every language at once against separate calls.
+
+    Args:
+        sizes: Names of input sizes from ``SIZES``.
+        corpora: Names of texts from ``CORPORA``; defaults to all of them.
+        min_time: Seconds to spend timing each way of translating.
+        progress: Called with each case's name and result as it finishes.
+
+    Returns:
+        Case names mapped to ``bytes``, the ``seconds`` of one
+        ``translate_all``, the ``separate_seconds`` of one ``translate`` per
+        language, and their ``ratio``.
+    """
+    languages = sorted(LANGUAGE_TRANSFORMERS)
+    translator = Translator()
+
+    def separate(text: str) -> List[str]:
+        return [translator.translate(text, language) for language in languages]
+
+    def fanout(text: str) -> Dict[str, str]:
+        return translator.translate_all(text, languages)
+
+    results: Dict[str, Dict] = {}
+    for corpus in corpora or CORPORA:
+        corpus_source = corpus_text(corpus)
+        for size in sizes:
+            text = make_text(corpus_source, SIZES[size])
+            seconds = time_call(fanout, text, min_time)
+            separate_seconds = time_call(separate, text, min_time)
+            result = {
+                'bytes': len(text.encode('utf-8')),
+                'seconds': seconds,
+                'separate_seconds': separate_seconds,
+                'ratio': seconds / separate_seconds if separate_seconds > 0 else float('inf'),
+            }
+            name = f"fanout/{corpus}/{size}"
+            results[name] = result
+            if progress is not None:
+                progress(name, result)
+    return results
+
+
+def check_fanout(results: Dict[str, Dict], max_ratio: float = DEFAULT_MAX_FANOUT_RATIO) -> List[str]:
+    """Find fan-out cases that cost too much against separate calls.
+
+    Args:
+        results: Results from ``run_fanout``.
+        max_ratio: Largest allowed cost of ``translate_all`` as a share of the
+            separate calls.
+
+    Returns:
+        A description of every case over the limit.
+    """
+    return [
+        f"{name}: {result['ratio']:.2f}x the separate calls, limit {max_ratio:.2f}x"
+        for name, result in results.items()
+        if result['ratio'] > max_ratio
+    ]
+
+
+def compare(
+    baseline: Dict,
+    current: Dict,
+    threshold: float = DEFAULT_THRESHOLD,
+    memory_threshold: float = DEFAULT_MEMORY_THRESHOLD,
+) -> List[str]:
+    """Find cases that regressed against a baseline.
+
+    Cases present in only one of the reports are ignored.
+
+    Args:
+        baseline: A report from ``run_suite``.
+        current: A later report.
+        threshold: Largest allowed fractional loss of throughput.
+        memory_threshold: Largest allowed fractional growth of peak memory.
+
+    Returns:
+        A description of every regression.
+    """
+    regressions = []
+    for name, result in current['results'].items():
+        before = baseline['results'].get(name)
+        if before is None:
+            continue
+        if result['throughput_mb_s'] < before['throughput_mb_s'] * (1 - threshold):
+            regressions.append(
+                f"{name}: throughput {result['throughput_mb_s']:.2f} MB/s, "
+                f"baseline {before['throughput_mb_s']:.2f} MB/s"
+            )
+        if result.get('peak_bytes') and before.get('peak_bytes') and (
+            result['peak_bytes'] > before['peak_bytes'] * (1 + memory_threshold)
+        ):
+            regressions.append(
+                f"{name}: peak memory {result['peak_bytes']} bytes, baseline {before['peak_bytes']} bytes"
+            )
+    return regressions
+
+
+def _print_result(name: str, result: Dict) -> None:
+    peak = result['peak_bytes']
+    memory = f"{peak / 1e6:10.2f} MB" if peak is not None else f"{'-':>13}"
+    print(f"{name:<45} {result['throughput_mb_s']:10.2f} MB/s {memory}", flush=True)
+
+
+def _print_fanout(name: str, result: Dict) -> None:
+    print(
+        f"{name:<45} {result['seconds'] * 1e6:10.1f} us {result['separate_seconds'] * 1e6:10.1f} us "
+        f"{result['ratio']:6.2f}x",
+        flush=True,
+    )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Run the benchmark suite from the command line.
+
+    Returns:
+        The exit status: 1 if a comparison found regressions or a fan-out case
+        went over its limit, otherwise 0.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--language', '-l', action='append', dest='languages',
+                        help='Language to benchmark; repeatable (default: all)')
+    parser.add_argument('--size', action='append', dest='sizes', choices=list(SIZES),
+                        help=f"Input size; repeatable (default: {' '.join(DEFAULT_SIZES)})")
+    parser.add_argument('--corpus', action='append', dest='corpora', choices=CORPORA,
+                        help='Kind of text; repeatable (default: all)')
+    parser.add_argument('--min-time', type=float, default=MIN_TIME,
+                        help='Seconds spent timing each case')
+    parser.add_argument('--no-memory', action='store_true', help='Skip peak memory measurement')
+    parser.add_argument('--save', metavar='PATH', help='Write the results as a JSON baseline')
+    parser.add_argument('--compare', metavar='PATH', help='Fail on regressions against a JSON baseline')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='Allowed fractional loss of throughput')
+    parser.add_argument('--memory-threshold', type=float, default=DEFAULT_MEMORY_THRESHOLD,
+                        help='Allowed fractional growth of peak memory')
+    parser.add_argument('--fanout', action='store_true',
+                        help='Also time translate_all against one translate call per language')
+    parser.add_argument('--max-fanout-ratio', type=float, default=DEFAULT_MAX_FANOUT_RATIO,
+                        help='Allowed cost of translate_all as a share of the separate calls')
+    args = parser.parse_args(argv)
+
+    unknown = [language for language in args.languages or [] if language not in LANGUAGE_TRANSFORMERS]
+    if unknown:
+        parser.error(f"unknown language: {', '.join(unknown)}")
+
+    report = run_suite(
+        languages=args.languages,
+        sizes=args.sizes or DEFAULT_SIZES,
+        corpora=args.corpora,
+        min_time=args.min_time,
+        measure_memory=not args.no_memory,
+        progress=_print_result,
+    )
+    failures = []
+    if args.fanout:
+        print(f"\n{'translate_all vs separate calls':<45} {'all':>13} {'separate':>13}", flush=True)
+        report['fanout'] = run_fanout(
+            sizes=args.sizes or DEFAULT_SIZES,
+            corpora=args.corpora,
+            min_time=args.min_time,
+            progress=_print_fanout,
+        )
+        failures = check_fanout(report['fanout'], args.max_fanout_ratio)
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+            f.write('\n')
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(baseline, report, args.threshold, args.memory_threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) against {args.compare}:", file=sys.stderr)
+            for regression in regressions:
+                print(f"  {regression}", file=sys.stderr)
+            return 1
+        print(f"\nNo regressions against {args.compare}")
+    if failures:
+        print(f"\n{len(failures)} fan-out case(s) over {args.max_fanout_ratio:.2f}x:", file=sys.stderr)
+        for failure in failures:
+            print(f"  {failure}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
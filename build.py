@@ -13,6 +13,7 @@ def build_executable():
     # Define paths
     src_dir = project_root / "src"
     assets_dir = project_root / "assets"
+    packs_dir = src_dir / "languages" / "packs"
     dist_dir = project_root / "dist"
     
     # Clean previous builds
@@ -26,6 +27,7 @@ def build_executable():
         "--onefile",  # Create a single executable
         "--windowed",  # Don't show console window on Windows
         f"--add-data={assets_dir};assets",  # Include assets directory
+        f"--add-data={packs_dir};src/languages/packs",  # Include language packs
         "--icon=assets/app_icon.ico",  # Application icon
         "--clean",  # Clean PyInstaller cache
         "--noconfirm",  # Replace output directory without confirmation
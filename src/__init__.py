@@ -1,6 +1,13 @@
 """Language translation package."""
 
-from .languages import LANGUAGE_TRANSFORMERS
-
 __version__ = '0.1.0'
-__all__ = ['LANGUAGE_TRANSFORMERS'] 
\ No newline at end of file
+__all__ = ['LANGUAGE_TRANSFORMERS']
+
+
+def __getattr__(name: str):
+    """Import the language registry on first access, so clients such as ``src.daemon`` load quickly."""
+    if name == 'LANGUAGE_TRANSFORMERS':
+        from .languages import LANGUAGE_TRANSFORMERS
+
+        return LANGUAGE_TRANSFORMERS
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,7 +1,9 @@
 """
 Main entry point for the translation application.
 """
-from src.gui import main
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    # Imported here so PyQt6 only loads when the GUI starts
+    from src.gui import main
+
+    main()
@@ -0,0 +1,323 @@
+"""
+Process-pool batch translation.
+
+Each worker process builds one language's transformer once, when it starts, and
+then translates whole batches of texts per task. Batching keeps the cost of
+pickling millions of short strings small next to the translation itself.
+
+A single large document is split at whitespace into parts that are translated
+in parallel. The encoded document and the translated parts are exchanged
+through shared memory, so neither is pickled.
+"""
+
+import math
+import os
+import re
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .languages import LANGUAGE_TRANSFORMERS
+from .languages.base import BaseTransformer
+from .languages.pack import PackTransformer
+
+# Inputs smaller than this many characters are not worth sending to a pool
+MIN_PARALLEL_CHARS = 256 * 1024
+# Documents smaller than this many characters are translated in one piece
+MIN_DOCUMENT_CHARS = 1024 * 1024
+DOCUMENT_ENCODING = 'utf-8'
+# Lone surrogates in the document survive the trip through shared memory
+DOCUMENT_ERRORS = 'surrogatepass'
+# ASCII whitespace bytes never occur inside a multi-byte UTF-8 character
+SPLIT_BYTES = b' \t\n\r\x0b\x0c'
+_SPLIT_PATTERN = re.compile(b'[' + re.escape(SPLIT_BYTES) + b']')
+# Lower-casing can grow a character's UTF-8 encoding by up to this factor
+_FOLD_CASE_GROWTH = 1.5
+# Aim for this many tasks per worker so uneven batches still balance out
+TASKS_PER_WORKER = 4
+
+_worker_transformer: Optional[BaseTransformer] = None
+_worker_transformers: Dict[str, BaseTransformer] = {}
+
+
+def _init_worker(language: str) -> None:
+    """Build the worker's transformer once, when the worker process starts."""
+    global _worker_transformer
+    _worker_transformer = LANGUAGE_TRANSFORMERS[language]()
+
+
+def _translate_batch(task: Tuple[bool, List[str]]) -> List[str]:
+    reverse, texts = task
+    if reverse:
+        return _worker_transformer.reverse_transform_many(texts)
+    return _worker_transformer.transform_many(texts)
+
+
+def _translate_shared(task: Tuple[bool, str, str, int, int, int, int]) -> Tuple[int, Optional[bytes]]:
+    """Translate one part of a document held in shared memory.
+
+    The part's translation is written to its reserved slice of the output
+    segment. It is only returned directly in the unexpected case that it does
+    not fit there.
+    """
+    reverse, input_name, output_name, start, end, output_start, output_end = task
+    convert = _worker_transformer.reverse_transform if reverse else _worker_transformer.transform
+    from multiprocessing.shared_memory import SharedMemory
+
+    source = SharedMemory(name=input_name)
+    try:
+        with source.buf[start:end] as view:
+            text = str(view, DOCUMENT_ENCODING, DOCUMENT_ERRORS)
+    finally:
+        source.close()
+
+    data = convert(text).encode(DOCUMENT_ENCODING, DOCUMENT_ERRORS)
+    if len(data) > output_end - output_start:
+        return len(data), data
+
+    target = SharedMemory(name=output_name)
+    try:
+        target.buf[output_start:output_start + len(data)] = data
+    finally:
+        target.close()
+    return len(data), None
+
+
+def split_offsets(data: bytes, parts: int) -> List[int]:
+    """Find byte offsets that split encoded text into roughly equal parts.
+
+    Each split falls just after an ASCII whitespace byte at or past the ideal
+    offset, so no character, word, digraph or code is cut in two.
+
+    Args:
+        data: UTF-8 encoded text.
+        parts: Desired number of parts.
+
+    Returns:
+        Increasing offsets starting with 0 and ending with ``len(data)``. There
+        may be fewer parts than requested if the text has little whitespace.
+    """
+    offsets = [0]
+    step = len(data) / parts
+    for i in range(1, parts):
+        target = max(int(step * i), offsets[-1])
+        match = _SPLIT_PATTERN.search(data, target)
+        if match is None:
+            break
+        if match.end() > offsets[-1]:
+            offsets.append(match.end())
+    if offsets[-1] < len(data):
+        offsets.append(len(data))
+    return offsets
+
+
+def can_split_document(transformer: BaseTransformer, reverse: bool = False) -> bool:
+    """Check whether a transformer's output is unaffected by splitting at whitespace.
+
+    Args:
+        transformer: The transformer to check.
+        reverse: Whether the document will be translated back to English.
+
+    Returns:
+        True for pack transformers whose keys contain no whitespace.
+    """
+    if not isinstance(transformer, PackTransformer):
+        return False
+    mapping = transformer.pack.reverse if reverse else transformer.pack.forward
+    split_chars = SPLIT_BYTES.decode('ascii')
+    return not any(char in key for key in mapping for char in split_chars)
+
+
+def expansion_ratio(transformer: PackTransformer, reverse: bool = False) -> float:
+    """Get an upper bound on how much translation grows UTF-8 encoded text.
+
+    Args:
+        transformer: The transformer that will translate.
+        reverse: Whether translating back to English.
+
+    Returns:
+        The largest ratio of output bytes to input bytes.
+    """
+    mapping = transformer.pack.reverse if reverse else transformer.pack.forward
+    ratio = max(
+        (len(value.encode(DOCUMENT_ENCODING)) / len(key.encode(DOCUMENT_ENCODING))
+         for key, value in mapping.items()),
+        default=1.0,
+    )
+    if transformer.pack.fold_case:
+        ratio *= _FOLD_CASE_GROWTH
+    return max(ratio, 1.0)
+
+
+def default_workers() -> int:
+    """Get the default number of worker processes.
+
+    Returns:
+        The number of CPUs available to this process.
+    """
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def choose_chunksize(count: int, workers: int) -> int:
+    """Choose how many texts to send to a worker per task.
+
+    Args:
+        count: Number of texts.
+        workers: Number of worker processes.
+
+    Returns:
+        A batch size giving each worker a few tasks.
+    """
+    return max(1, math.ceil(count / (workers * TASKS_PER_WORKER)))
+
+
+class TranslationPool:
+    """A process pool whose workers are warmed up with one language's transformer."""
+
+    def __init__(self, language: str, workers: int):
+        """Start the pool.
+
+        Args:
+            language: Language every worker loads.
+            workers: Number of worker processes.
+        """
+        self.language = language
+        self.workers = workers
+        # Imported here since multiprocessing is slow to import and only needed for pools
+        from concurrent.futures import ProcessPoolExecutor
+
+        self._executor = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(language,),
+        )
+
+    def map(self, texts: Sequence[str], reverse: bool = False, chunksize: Optional[int] = None) -> List[str]:
+        """Translate texts on the pool.
+
+        Args:
+            texts: Texts to translate.
+            reverse: Whether to translate from the language back to English.
+            chunksize: Texts per task; chosen automatically when omitted.
+
+        Returns:
+            The translations, in input order.
+        """
+        if chunksize is None:
+            chunksize = choose_chunksize(len(texts), self.workers)
+        tasks = (
+            (reverse, list(texts[start:start + chunksize]))
+            for start in range(0, len(texts), chunksize)
+        )
+        results: List[str] = []
+        for batch in self._executor.map(_translate_batch, tasks):
+            results.extend(batch)
+        return results
+
+    def translate_document(self, text: str, ratio: float, reverse: bool = False) -> str:
+        """Translate one large document in parallel through shared memory.
+
+        The caller must have checked ``can_split_document`` for the language.
+
+        Args:
+            text: The document.
+            ratio: Upper bound on output bytes per input byte, from
+                ``expansion_ratio``.
+            reverse: Whether to translate from the language back to English.
+
+        Returns:
+            The translated document.
+        """
+        data = text.encode(DOCUMENT_ENCODING, DOCUMENT_ERRORS)
+        offsets = split_offsets(data, self.workers * TASKS_PER_WORKER)
+        # Reserve an output slice per part, sized for the worst-case growth
+        output_offsets = [0]
+        for start, end in zip(offsets, offsets[1:]):
+            output_offsets.append(output_offsets[-1] + math.ceil((end - start) * ratio))
+
+        from multiprocessing.shared_memory import SharedMemory
+
+        source = SharedMemory(create=True, size=max(len(data), 1))
+        target = SharedMemory(create=True, size=max(output_offsets[-1], 1))
+        try:
+            source.buf[:len(data)] = data
+            del data
+            tasks = [
+                (reverse, source.name, target.name, start, end, output_start, output_end)
+                for start, end, output_start, output_end in zip(
+                    offsets, offsets[1:], output_offsets, output_offsets[1:]
+                )
+            ]
+            parts = []
+            for (length, overflow), output_start in zip(
+                self._executor.map(_translate_shared, tasks), output_offsets
+            ):
+                if overflow is not None:
+                    parts.append(overflow.decode(DOCUMENT_ENCODING, DOCUMENT_ERRORS))
+                    continue
+                with target.buf[output_start:output_start + length] as view:
+                    parts.append(str(view, DOCUMENT_ENCODING, DOCUMENT_ERRORS))
+            return ''.join(parts)
+        finally:
+            for segment in (source, target):
+                segment.close()
+                segment.unlink()
+
+    def shutdown(self) -> None:
+        """Stop the worker processes."""
+        self._executor.shutdown()
+
+
+def should_parallelize(texts: Sequence[str], workers: int) -> bool:
+    """Decide whether a batch is large enough to be worth a process pool.
+
+    Args:
+        texts: Texts to translate.
+        workers: Number of worker processes requested.
+
+    Returns:
+        True if the batch should be sent to a pool.
+    """
+    if workers <= 1 or len(texts) < 2:
+        return False
+    total = 0
+    for text in texts:
+        total += len(text)
+        if total >= MIN_PARALLEL_CHARS:
+            return True
+    return False
+
+
+def translate_serial(texts: Sequence[str], transformer: BaseTransformer, reverse: bool = False) -> List[str]:
+    """Translate texts in this process.
+
+    Args:
+        texts: Texts to translate.
+        transformer: The language's transformer.
+        reverse: Whether to translate from the language back to English.
+
+    Returns:
+        The translations, in input order.
+    """
+    if reverse:
+        return transformer.reverse_transform_many(texts)
+    return transformer.transform_many(texts)
+
+
+def translate_texts(language: str, reverse: bool, texts: List[str]) -> List[str]:
+    """Translate texts in a worker process of a pool shared by all languages.
+
+    Each worker builds a language's transformer the first time it needs it.
+
+    Args:
+        language: Language name.
+        reverse: Whether to translate from the language back to English.
+        texts: Texts to translate.
+
+    Returns:
+        The translations, in input order.
+    """
+    transformer = _worker_transformers.get(language)
+    if transformer is None:
+        transformer = _worker_transformers[language] = LANGUAGE_TRANSFORMERS[language]()
+    return translate_serial(texts, transformer, reverse)
@@ -0,0 +1,152 @@
+"""
+Bounded LRU cache of translations.
+"""
+
+import sys
+from collections import OrderedDict
+from threading import Lock
+from typing import Callable, Dict, Optional, Tuple
+
+from .metrics import CACHE_LOOKUPS, REGISTRY
+
+DEFAULT_MAX_ENTRIES = 10_000
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+# Longer texts are rarely repeated and would push many short entries out
+DEFAULT_MAX_TEXT_LENGTH = 4096
+# Approximate memory of the key tuple and the dictionary and list slots
+_ENTRY_OVERHEAD = 200
+
+CacheKey = Tuple[str, bool, str]
+
+
+def _entry_size(key: CacheKey, value: str) -> int:
+    return sys.getsizeof(key[0]) + sys.getsizeof(key[2]) + sys.getsizeof(value) + _ENTRY_OVERHEAD
+
+
+class TranslationCache:
+    """Thread-safe LRU cache of translations keyed by (language, reverse, text).
+
+    The least recently used entries are evicted once the cache holds more than
+    ``max_entries`` entries or more than ``max_bytes`` of estimated memory.
+    Texts longer than ``max_text_length`` are never cached.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_text_length: int = DEFAULT_MAX_TEXT_LENGTH,
+    ):
+        """Initialize an empty cache.
+
+        Args:
+            max_entries: Largest number of entries kept.
+            max_bytes: Largest estimated memory used by the entries, in bytes.
+            max_text_length: Longest text, in characters, that is cached.
+        """
+        if max_entries < 1 or max_bytes < 1:
+            raise ValueError("Cache limits must be positive")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.max_text_length = max_text_length
+        self._entries: 'OrderedDict[CacheKey, Tuple[str, int]]' = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._bypassed = 0
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_or_translate(self, language: str, reverse: bool, text: str, convert: Callable[[str], str]) -> str:
+        """Look up a translation, translating and caching it on a miss.
+
+        Args:
+            language: Language name.
+            reverse: Whether the translation is back to English.
+            text: Text to translate.
+            convert: Translates ``text`` on a miss.
+
+        Returns:
+            The translation.
+        """
+        if len(text) > self.max_text_length:
+            with self._lock:
+                self._bypassed += 1
+            if REGISTRY.enabled:
+                CACHE_LOOKUPS.inc('bypass')
+            return convert(text)
+
+        key = (language, reverse, text)
+        value = self.get(key)
+        if value is None:
+            # Translate outside the lock; two threads may both miss, which is harmless
+            value = convert(text)
+            self.put(key, value)
+        return value
+
+    def get(self, key: CacheKey) -> Optional[str]:
+        """Look up a translation, marking it as recently used.
+
+        Args:
+            key: ``(language, reverse, text)``.
+
+        Returns:
+            The cached translation, or None.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+            else:
+                self._entries.move_to_end(key)
+                self._hits += 1
+        if REGISTRY.enabled:
+            CACHE_LOOKUPS.inc('miss' if entry is None else 'hit')
+        return None if entry is None else entry[0]
+
+    def put(self, key: CacheKey, value: str) -> None:
+        """Store a translation, evicting least recently used entries as needed.
+
+        Args:
+            key: ``(language, reverse, text)``.
+            value: The translation.
+        """
+        size = _entry_size(key, value)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._entries[key] = (value, size)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self._evictions += 1
+
+    def clear(self) -> None:
+        """Remove every entry. Statistics are kept."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Get a snapshot of the cache's statistics.
+
+        Returns:
+            ``hits``, ``misses``, ``evictions``, ``bypassed`` (texts too long to
+            cache), ``entries`` and ``bytes`` (estimated memory of the entries).
+        """
+        with self._lock:
+            return {
+                'hits': self._hits,
+                'misses': self._misses,
+                'evictions': self._evictions,
+                'bypassed': self._bypassed,
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+            }
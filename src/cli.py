@@ -1,62 +1,256 @@
 """
 Command-line interface for the language translator.
+
+Only click and light modules are imported up front. The languages are imported
+when a command translates locally, so ``translate`` answered by a running
+daemon never loads them. rich is imported only to render for a terminal.
 """
+import random
+import sys
+from functools import lru_cache
+
 import click
-from rich.console import Console
-from rich.panel import Panel
-from rich.text import Text
 
-from .languages import LANGUAGE_TRANSFORMERS
+from .daemon import connect as connect_daemon, serve as serve_daemon
+from .pipeline import DEFAULT_CHUNK_SIZE
+from .verify import DEFAULT_SAMPLE_RATE, VERIFY_MODES, round_trip_matches
+
+@lru_cache(maxsize=None)
+def _console():
+    """Get the rich console, importing rich on first use."""
+    from rich.console import Console
 
-console = Console()
+    return Console()
+
+def _print_error(message: str) -> None:
+    """Print an error, in red on a terminal and as plain text on stderr otherwise."""
+    if sys.stdout.isatty():
+        from rich.markup import escape
+
+        _console().print(f"[red]{escape(message)}[/red]")
+    else:
+        click.echo(message, err=True)
 
 @click.group()
 def cli():
     """CLI for the language translation tool."""
     pass
 
+def _pipe(source: str, output: str, language: str, reverse: bool, chunk_size: int,
+          verify: str = 'off', sample_rate: float = DEFAULT_SAMPLE_RATE) -> None:
+    """Translate a file or stdin to plain output, without any rich rendering.
+
+    When verification is on, the input is translated a block of whole lines at
+    a time, and a summary of round-trip mismatches is printed to stderr.
+    """
+    from .languages import LANGUAGE_TRANSFORMERS
+    from .pipeline import line_blocks, translate_file as translate_stream_file
+    from .verify import RoundTripVerifier
+
+    if language not in LANGUAGE_TRANSFORMERS:
+        raise click.BadParameter(
+            f"Unknown language '{language}'. Available languages: {', '.join(LANGUAGE_TRANSFORMERS.keys())}",
+            param_hint="'--language'",
+        )
+
+    transformer = LANGUAGE_TRANSFORMERS[language]()
+    convert = transformer.reverse_transform_stream if reverse else transformer.transform_stream
+    verifier = RoundTripVerifier(language, reverse, verify, sample_rate)
+    if verifier.enabled:
+        convert_text = transformer.reverse_transform if reverse else transformer.transform
+        convert_partial = transformer.reverse_transform_partial if reverse else transformer.transform_partial
+
+        def verified(chunks):
+            # Text after a cut within a line that a key could still span
+            carry = ''
+            for block in line_blocks(chunks, chunk_size):
+                buffer = carry + block if carry else block
+                if buffer.endswith('\n'):
+                    translated, consumed = convert_text(buffer), len(buffer)
+                else:
+                    translated, consumed = convert_partial(buffer)
+                carry = buffer[consumed:]
+                if consumed:
+                    verifier.add(buffer[:consumed], translated)
+                    yield translated
+            if carry:
+                translated = convert_text(carry)
+                verifier.add(carry, translated)
+                yield translated
+
+        convert = verified
+
+    try:
+        translate_stream_file(source, output, convert, chunk_size=chunk_size)
+        if verifier.enabled:
+            verifier.finish()
+            click.echo(verifier.summary(), err=True)
+    except OSError as e:
+        raise click.ClickException(str(e))
+    finally:
+        verifier.close()
+
+def _translate_round_trip(text: str, language: str, socket_path, verify: bool):
+    """Translate text, and back if verifying, through a running daemon if there is one.
+
+    Returns:
+        The translation, and its round trip or None.
+
+    Raises:
+        ValueError: If the language is not supported.
+    """
+    client = connect_daemon(socket_path)
+    if client is not None:
+        try:
+            with client:
+                transformed_text = client.translate(text, language)
+                return transformed_text, client.reverse_translate(transformed_text, language) if verify else None
+        except OSError:
+            # The daemon went away; translate here instead
+            pass
+
+    from .languages import LANGUAGE_TRANSFORMERS
+
+    if language not in LANGUAGE_TRANSFORMERS:
+        raise ValueError(f"Unknown language '{language}'. Available languages: {', '.join(LANGUAGE_TRANSFORMERS.keys())}")
+    transformer = LANGUAGE_TRANSFORMERS[language]()
+    transformed_text = transformer.transform(text)
+    return transformed_text, transformer.reverse_transform(transformed_text) if verify else None
+
+_VERIFY_HELP = 'Translate the result back to check it: off, full, or a sample of lines'
+_SAMPLE_RATE_HELP = 'Share of lines checked with --verify sample'
+
 @cli.command()
 @click.argument('text')
 @click.option('--language', '-l', default='elvish', help='Target language (elvish or vybix)')
-def translate(text: str, language: str) -> None:
-    """Translate English text to the target language."""
-    if language not in LANGUAGE_TRANSFORMERS:
-        console.print(f"[red]Error: Unknown language '{language}'. Available languages: {', '.join(LANGUAGE_TRANSFORMERS.keys())}[/red]")
+@click.option('--socket', 'socket_path', default=None, type=click.Path(dir_okay=False),
+              help='Daemon socket to use if a daemon is running (default: $LANGGEN_SOCKET or a per-user path)')
+@click.option('--verify', type=click.Choice(VERIFY_MODES), default=None,
+              help=f'{_VERIFY_HELP} (default: full, or off for stdin)')
+@click.option('--sample-rate', default=DEFAULT_SAMPLE_RATE, show_default=True, type=click.FloatRange(0, 1),
+              help=_SAMPLE_RATE_HELP)
+def translate(text: str, language: str, socket_path, verify, sample_rate: float) -> None:
+    """Translate English text to the target language.
+
+    Pass - as TEXT to translate standard input to standard output. Text is
+    translated by a running daemon (see serve) when there is one.
+    """
+    if text == '-':
+        _pipe('-', '-', language, reverse=False, chunk_size=DEFAULT_CHUNK_SIZE,
+              verify=verify or 'off', sample_rate=sample_rate)
         return
 
+    verify = verify or 'full'
+    check = verify == 'full' or (verify == 'sample' and random.random() < sample_rate)
     try:
-        # Create transformer for the selected language
-        transformer_class = LANGUAGE_TRANSFORMERS[language]
-        transformer = transformer_class()
-        
-        # Transform the text
-        transformed_text = transformer.transform(text)
-        
-        # Display results
-        result = Text()
-        result.append("English: ", style="blue bold")
-        result.append(text)
-        result.append(f"\n{language.title()}: ", style="green bold")
-        result.append(transformed_text)
-        
-        # Try to reverse transform
-        reversed_text = transformer.reverse_transform(transformed_text)
+        transformed_text, reversed_text = _translate_round_trip(text, language, socket_path, check)
+    except ValueError as e:
+        _print_error(f"Error: {e}")
+        return
+    except Exception as e:
+        _print_error(f"Error during translation: {str(e)}")
+        return
+
+    if not sys.stdout.isatty():
+        # Plain lines for scripts, without loading rich
+        click.echo(f"English: {text}")
+        click.echo(f"{language.title()}: {transformed_text}")
+        if reversed_text is not None:
+            click.echo(f"Reversed: {reversed_text}")
+            if not round_trip_matches(text, reversed_text):
+                click.echo("The round trip does not match the input", err=True)
+        return
+
+    from rich.panel import Panel
+    from rich.text import Text
+
+    result = Text()
+    result.append("English: ", style="blue bold")
+    result.append(text)
+    result.append(f"\n{language.title()}: ", style="green bold")
+    result.append(transformed_text)
+    if reversed_text is not None:
         result.append("\nReversed: ", style="yellow bold")
         result.append(reversed_text)
-        
-        console.print(Panel(result, title="Translation Result", expand=True))
-    except Exception as e:
-        console.print(f"[red]Error during translation: {str(e)}[/red]")
+        if not round_trip_matches(text, reversed_text):
+            result.append("\nThe round trip does not match the input", style="red")
+
+    _console().print(Panel(result, title="Translation Result", expand=True))
+
+@cli.command('translate-file')
+@click.argument('source', type=click.Path(dir_okay=False, allow_dash=True))
+@click.option('--language', '-l', default='elvish', help='Target language')
+@click.option('--output', '-o', default='-', type=click.Path(dir_okay=False, allow_dash=True),
+              help='Output file, or - for stdout')
+@click.option('--reverse', '-r', is_flag=True, help='Translate from the language back to English')
+@click.option('--chunk-size', default=DEFAULT_CHUNK_SIZE, show_default=True, type=click.IntRange(min=1),
+              help='Bytes of input translated at a time')
+@click.option('--verify', type=click.Choice(VERIFY_MODES), default='off', show_default=True, help=_VERIFY_HELP)
+@click.option('--sample-rate', default=DEFAULT_SAMPLE_RATE, show_default=True, type=click.FloatRange(0, 1),
+              help=_SAMPLE_RATE_HELP)
+def translate_file(source: str, language: str, output: str, reverse: bool, chunk_size: int, verify: str,
+                   sample_rate: float) -> None:
+    """Translate a file, or stdin when SOURCE is -, writing plain UTF-8 text."""
+    _pipe(source, output, language, reverse, chunk_size, verify, sample_rate)
+
+@cli.command()
+@click.option('--socket', 'socket_path', default=None, type=click.Path(dir_okay=False),
+              help='Socket path (default: $LANGGEN_SOCKET or a per-user path)')
+@click.option('--metrics-port', default=None, type=click.IntRange(0, 65535),
+              help='Record metrics and serve them at http://127.0.0.1:PORT/metrics')
+def serve(socket_path, metrics_port) -> None:
+    """Keep a translator warm and answer CLI calls over a Unix-domain socket."""
+    try:
+        if metrics_port is not None:
+            from .metrics import REGISTRY, start_http_server
+
+            REGISTRY.enable()
+            start_http_server(metrics_port)
+        serve_daemon(socket_path)
+    except OSError as e:
+        raise click.ClickException(str(e))
+
+@cli.command('serve-http')
+@click.option('--host', default='127.0.0.1', show_default=True, help='Address to listen on')
+@click.option('--port', default=8080, show_default=True, type=click.IntRange(0, 65535), help='Port to listen on')
+@click.option('--max-delay', default=2.0, show_default=True, type=click.FloatRange(min=0),
+              help='Milliseconds a request waits to be batched with others')
+@click.option('--max-batch', default=256, show_default=True, type=click.IntRange(min=1),
+              help='Requests that flush a batch immediately')
+@click.option('--offload-chars', default=64 * 1024, show_default=True, type=click.IntRange(min=1),
+              help='Payloads of at least this many characters are translated in worker processes')
+@click.option('--workers', default=None, type=click.IntRange(min=1), help='Worker processes (default: CPU count)')
+@click.option('--metrics', is_flag=True, help='Record metrics and serve them at /metrics')
+def serve_http(host: str, port: int, max_delay: float, max_batch: int, offload_chars: int, workers,
+               metrics: bool) -> None:
+    """Serve translations over HTTP, micro-batching concurrent requests."""
+    from .server import run
+
+    if metrics:
+        from .metrics import REGISTRY
+
+        REGISTRY.enable()
+
+    click.echo(f"Serving translations on http://{host}:{port}", err=True)
+    run(host, port, max_delay / 1000, max_batch, offload_chars, workers)
 
 @cli.command()
 def list_languages():
     """List all available languages."""
+    from .languages import LANGUAGE_TRANSFORMERS
+
+    if not sys.stdout.isatty():
+        click.echo("\n".join(sorted(LANGUAGE_TRANSFORMERS.keys())))
+        return
+
     languages_text = "\n".join(
         f"[blue]{lang}[/blue]"
         for lang in sorted(LANGUAGE_TRANSFORMERS.keys())
     )
     
-    console.print(Panel.fit(
+    from rich.panel import Panel
+
+    _console().print(Panel.fit(
         languages_text,
         title="Available Languages",
         border_style="bright_blue"
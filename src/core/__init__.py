@@ -1,6 +1,18 @@
-"""Core package for business logic and shared functionality."""
+"""Core package for business logic and shared functionality.
 
-from .config import settings
-from .logger import setup_logging
+The submodules import pydantic and python-json-logger, so they are only
+imported when ``settings`` or ``setup_logging`` is first accessed.
+"""
 
-__all__ = ["settings", "setup_logging"] 
\ No newline at end of file
+__all__ = ["settings", "setup_logging"]
+
+
+def __getattr__(name: str):
+    """Import ``settings`` and ``setup_logging`` on first access."""
+    if name == "settings":
+        from .config import get_settings
+        return get_settings()
+    if name == "setup_logging":
+        from .logger import setup_logging
+        return setup_logging
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,5 +1,9 @@
-"""Configuration management for the application."""
+"""Configuration management for the application.
 
+Settings are validated when first used, not when this module is imported.
+"""
+
+from functools import lru_cache
 from typing import Any, Dict, Optional
 from pydantic import BaseSettings, PostgresDsn, validator
 
@@ -41,4 +45,18 @@ class Settings(BaseSettings):
         env_file = ".env"
 
 
-settings = Settings() 
\ No newline at end of file
+@lru_cache(maxsize=None)
+def get_settings() -> Settings:
+    """Get the application settings, reading them on first use.
+    
+    Returns:
+        The settings
+    """
+    return Settings()
+
+
+def __getattr__(name: str):
+    """Build ``settings`` on first access."""
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,269 @@
+"""
+Warm translation daemon over a Unix-domain socket.
+
+Loading the languages costs a fresh CLI process far more than translating a
+short text. The daemon keeps a ``Translator`` loaded in a long-running process,
+and clients forward requests to it over a Unix-domain socket.
+
+The protocol is one JSON object per line in each direction. A request is
+``{"op": "translate" | "reverse", "text": ..., "language": ...}`` or
+``{"op": "ping"}``. The reply is ``{"result": ...}`` or ``{"error": ...}``.
+A connection may carry any number of requests. Clients raise ``ValueError``
+for error replies and ``ConnectionError`` for replies that break the protocol,
+so callers can fall back to translating in-process.
+
+This module only imports the standard library at the top, and the ``src``
+package imports nothing up front, so a client costs little to load. ``DaemonClient`` keeps its connection open; a script that
+reuses one client pays a socket round trip per call instead of a process start.
+"""
+
+import json
+import os
+import socket
+import socketserver
+import tempfile
+from typing import Optional
+
+SOCKET_ENV_VAR = 'LANGGEN_SOCKET'
+ENCODING = 'utf-8'
+DEFAULT_TIMEOUT = 5.0
+
+
+def default_socket_path() -> str:
+    """Get the daemon's socket path.
+
+    Returns:
+        ``$LANGGEN_SOCKET`` if set, otherwise ``languagegenvibes.sock`` in
+        ``$XDG_RUNTIME_DIR``, or a per-user name in the temporary directory.
+    """
+    path = os.environ.get(SOCKET_ENV_VAR)
+    if path:
+        return path
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR')
+    if runtime_dir:
+        return os.path.join(runtime_dir, 'languagegenvibes.sock')
+    user = os.getuid() if hasattr(os, 'getuid') else os.getpid()
+    return os.path.join(tempfile.gettempdir(), f'languagegenvibes-{user}.sock')
+
+
+def _require_unix_sockets() -> None:
+    if not hasattr(socket, 'AF_UNIX'):
+        raise OSError("Unix-domain sockets are not supported on this platform")
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Answers requests on one client connection until it closes."""
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            reply = self.server.answer(line)
+            self.wfile.write(json.dumps(reply, ensure_ascii=False).encode(ENCODING) + b'\n')
+            self.wfile.flush()
+
+
+if hasattr(socketserver, 'ThreadingUnixStreamServer'):
+    _BaseServer = socketserver.ThreadingUnixStreamServer
+else:
+    _BaseServer = socketserver.BaseServer
+
+
+class TranslationDaemon(_BaseServer):
+    """Unix-domain socket server answering requests with a warm ``Translator``."""
+
+    daemon_threads = True
+
+    def __init__(self, path: str, translator=None):
+        """Bind the socket, replacing a stale socket file left by a dead daemon.
+
+        Args:
+            path: Socket path.
+            translator: The ``Translator`` to serve; a new one with a
+                ``TranslationCache`` is created when omitted.
+
+        Raises:
+            OSError: If another daemon is already listening on the path, or
+                the platform lacks Unix-domain sockets.
+        """
+        _require_unix_sockets()
+        if translator is None:
+            from .cache import TranslationCache
+            from .translator import Translator
+            translator = Translator(cache=TranslationCache())
+        self.translator = translator
+        self.path = path
+
+        if os.path.exists(path):
+            if is_running(path):
+                raise OSError(f"A translation daemon is already listening on {path}")
+            os.unlink(path)
+        # Only the owner may connect
+        old_umask = os.umask(0o177)
+        try:
+            super().__init__(path, _RequestHandler)
+        finally:
+            os.umask(old_umask)
+
+    def answer(self, line: bytes) -> dict:
+        """Answer one request line.
+
+        Args:
+            line: A JSON-encoded request.
+
+        Returns:
+            The reply object.
+        """
+        try:
+            request = json.loads(line)
+            op = request['op']
+            if op == 'ping':
+                return {'result': 'pong'}
+            text, language = request['text'], request['language']
+            if op == 'translate':
+                return {'result': self.translator.translate(text, language)}
+            if op == 'reverse':
+                return {'result': self.translator.reverse_translate(text, language)}
+            return {'error': f"Unknown operation: {op}"}
+        except (ValueError, KeyError, TypeError) as e:
+            return {'error': str(e) if not isinstance(e, KeyError) else f"Missing field: {e}"}
+
+    def server_close(self) -> None:
+        """Close the socket, remove the socket file and shut down the translator."""
+        super().server_close()
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+        if hasattr(self.translator, 'close'):
+            self.translator.close()
+
+
+def serve(path: Optional[str] = None) -> None:
+    """Run a translation daemon until interrupted.
+
+    Args:
+        path: Socket path; defaults to ``default_socket_path()``.
+    """
+    with TranslationDaemon(path or default_socket_path()) as daemon:
+        try:
+            daemon.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+class DaemonClient:
+    """A persistent connection to a translation daemon."""
+
+    def __init__(self, path: Optional[str] = None, timeout: float = DEFAULT_TIMEOUT):
+        """Connect to the daemon.
+
+        Args:
+            path: Socket path; defaults to ``default_socket_path()``.
+            timeout: Seconds to wait for each reply.
+
+        Raises:
+            OSError: If no daemon is listening on the path.
+        """
+        _require_unix_sockets()
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            self._socket.settimeout(timeout)
+            self._socket.connect(path or default_socket_path())
+        except OSError:
+            self._socket.close()
+            raise
+        self._file = self._socket.makefile('rwb')
+
+    def __enter__(self) -> 'DaemonClient':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the connection."""
+        self._file.close()
+        self._socket.close()
+
+    def _call(self, request: dict) -> str:
+        """Send a request and wait for its reply.
+
+        Raises:
+            ConnectionError: If the daemon closed the connection or sent a
+                reply that breaks the protocol. The connection is closed.
+            ValueError: If the daemon replied with an error.
+        """
+        self._file.write(json.dumps(request, ensure_ascii=False).encode(ENCODING) + b'\n')
+        self._file.flush()
+        line = self._file.readline()
+        if not line.endswith(b'\n'):
+            self.close()
+            raise ConnectionError("The translation daemon closed the connection")
+        try:
+            reply = json.loads(line)
+        except ValueError as e:
+            self.close()
+            raise ConnectionError(f"The translation daemon sent a malformed reply: {e}") from e
+        if isinstance(reply, dict) and 'error' in reply:
+            raise ValueError(reply['error'])
+        if not isinstance(reply, dict) or not isinstance(reply.get('result'), str):
+            self.close()
+            raise ConnectionError("The translation daemon sent a reply without a result")
+        return reply['result']
+
+    def ping(self) -> None:
+        """Check that the daemon is answering.
+
+        Raises:
+            OSError: If the daemon does not answer.
+        """
+        self._call({'op': 'ping'})
+
+    def translate(self, text: str, language: str) -> str:
+        """Translate English text through the daemon.
+
+        Raises:
+            ValueError: If the specified language is not supported.
+            OSError: If the daemon does not answer, or breaks the protocol.
+        """
+        return self._call({'op': 'translate', 'text': text, 'language': language})
+
+    def reverse_translate(self, text: str, language: str) -> str:
+        """Convert text back to English through the daemon.
+
+        Raises:
+            ValueError: If the specified language is not supported.
+            OSError: If the daemon does not answer, or breaks the protocol.
+        """
+        return self._call({'op': 'reverse', 'text': text, 'language': language})
+
+
+def is_running(path: Optional[str] = None) -> bool:
+    """Check whether a daemon is answering on a socket path.
+
+    Args:
+        path: Socket path; defaults to ``default_socket_path()``.
+
+    Returns:
+        True if a daemon answered a ping.
+    """
+    try:
+        with DaemonClient(path, timeout=1.0) as client:
+            client.ping()
+        return True
+    except OSError:
+        return False
+
+
+def connect(path: Optional[str] = None) -> Optional[DaemonClient]:
+    """Connect to a daemon if one is running.
+
+    Args:
+        path: Socket path; defaults to ``default_socket_path()``.
+
+    Returns:
+        A connected client, or None if no daemon is listening.
+    """
+    try:
+        return DaemonClient(path)
+    except OSError:
+        return None
@@ -1,7 +1,9 @@
 """GUI module for the translation application."""
-from typing import Dict, List
+from collections import OrderedDict, deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
 import sys
 import os
+import threading
 from pathlib import Path
 from PyQt6.QtWidgets import (
     QApplication,
@@ -10,16 +12,20 @@ from PyQt6.QtWidgets import (
     QVBoxLayout,
     QHBoxLayout,
     QComboBox,
+    QCheckBox,
     QTextEdit,
+    QListView,
     QPushButton,
     QLabel,
+    QProgressBar,
     QScrollArea,
     QMessageBox,
 )
-from PyQt6.QtCore import Qt, QSize
+from PyQt6.QtCore import Qt, QSize, QObject, QRunnable, QThreadPool, pyqtSignal, QAbstractListModel, QModelIndex, QTimer
 from PyQt6.QtGui import QTextCursor, QPalette, QColor, QBrush, QPixmap
 from .translator import Translator
 from .languages import get_available_languages
+from .incremental import IncrementalTranslation, OutputEdit
 
 def get_asset_path(relative_path: str) -> str:
     """Get the correct path to an asset file that works both in development and when packaged.
@@ -39,11 +45,211 @@ def get_asset_path(relative_path: str) -> str:
     
     return os.path.join(base_path, 'assets', relative_path)
 
+# Texts longer than this are translated in pieces, so a job can be cancelled
+# and report progress between them
+JOB_CHUNK_CHARS = 256 * 1024
+
+class TranslationSignals(QObject):
+    """Signals a translation job sends back to the window.
+
+    The job emits them from a pool thread; Qt queues them to the window's
+    thread, so the connected slots can update widgets.
+    """
+
+    # Job id, characters translated, total characters
+    progress = pyqtSignal(int, int, int)
+    # Job id, result
+    finished = pyqtSignal(int, str)
+    # Job id, error message
+    failed = pyqtSignal(int, str)
+
+class TranslationJob(QRunnable):
+    """Translates one text on a thread pool thread.
+
+    Cancelled jobs stop at the next piece of text and emit nothing more.
+    """
+
+    def __init__(self, job_id: int, translator: Translator, text: str, language: str, reverse: bool):
+        """Create the job.
+
+        Args:
+            job_id: Identifies the job in its signals.
+            translator: Translator to use.
+            text: Text to translate.
+            language: The fictional language.
+            reverse: Whether to translate from the language back to English.
+        """
+        super().__init__()
+        self.job_id = job_id
+        self.translator = translator
+        self.text = text
+        self.language = language
+        self.reverse = reverse
+        self.signals = TranslationSignals()
+        self._cancelled = threading.Event()
+
+    def cancel(self) -> None:
+        """Ask the job to stop; safe to call from any thread."""
+        self._cancelled.set()
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether the job was cancelled."""
+        return self._cancelled.is_set()
+
+    def run(self) -> None:
+        """Translate the text, emitting the result unless cancelled."""
+        if self.cancelled:
+            return
+        try:
+            if len(self.text) <= JOB_CHUNK_CHARS:
+                convert = self.translator.reverse_translate if self.reverse else self.translator.translate
+                result = convert(self.text, self.language)
+            else:
+                result = self._translate_in_pieces()
+        except Exception as e:
+            if not self.cancelled:
+                self.signals.failed.emit(self.job_id, str(e))
+            return
+        if not self.cancelled:
+            self.signals.finished.emit(self.job_id, result)
+
+    def _translate_in_pieces(self) -> str:
+        """Stream the text through the translator, checking for cancellation between pieces."""
+        text = self.text
+
+        def pieces():
+            for start in range(0, len(text), JOB_CHUNK_CHARS):
+                if self.cancelled:
+                    return
+                yield text[start:start + JOB_CHUNK_CHARS]
+                # Resumed once the piece has been translated
+                self.signals.progress.emit(self.job_id, min(start + JOB_CHUNK_CHARS, len(text)), len(text))
+
+        stream = self.translator.reverse_translate_stream if self.reverse else self.translator.translate_stream
+        return ''.join(stream(pieces(), self.language))
+
+# Translations kept in the chat history; older ones are dropped
+HISTORY_LIMIT = 1000
+# Characters of each text shown in a history row, which is elided to the
+# view's width anyway; copying uses the full text
+HISTORY_PREVIEW_CHARS = 300
+# Backgrounds are scaled to the window size rounded up to a multiple of this
+BACKGROUND_SIZE_BUCKET = 64
+# Scaled backgrounds kept for reuse
+BACKGROUND_CACHE_SIZE = 16
+# Milliseconds the window size must stay the same before a smooth rescale
+RESIZE_SETTLE_MS = 150
+# Milliseconds after the last keystroke before live translation catches up
+LIVE_DEBOUNCE_MS = 150
+
+def format_history_entry(entry: Dict[str, Any], limit: Optional[int] = None) -> str:
+    """Format a chat history entry the way the history shows it.
+    
+    Args:
+        entry: The entry, with ``original``, ``translated``, ``language`` and
+            optionally ``is_reverse``
+        limit: Characters of each text to include, or None for all of them.
+            A limited preview shows each text on a single line.
+        
+    Returns:
+        The entry's text
+    """
+    def clip(text: str) -> str:
+        if limit is None:
+            return text
+        preview = " ⏎ ".join(text[:limit].splitlines())
+        return preview + "…" if len(text) > limit else preview
+
+    lines = [f"[{entry['language']}]"]
+    if entry.get('is_reverse', False):
+        lines.append(f"Translated: {clip(entry['translated'])}")
+        lines.append(f"Original: {clip(entry['original'])}")
+    else:
+        lines.append(f"Original: {clip(entry['original'])}")
+        lines.append(f"Translated: {clip(entry['translated'])}")
+    return "\n".join(lines)
+
+class HistoryModel(QAbstractListModel):
+    """The chat history as a list model holding at most ``limit`` entries.
+    
+    Entries are appended one at a time, and every row previews its entry on
+    the same number of single, elided lines. The view can therefore give all
+    rows one height instead of measuring each, so adding a translation or
+    resizing the window costs the same however long the history is. Once the
+    model is full, the oldest entry is dropped.
+    """
+
+    def __init__(self, limit: int = HISTORY_LIMIT, parent: Optional[QObject] = None):
+        """Initialize an empty history.
+        
+        Args:
+            limit: Largest number of entries kept
+            parent: Parent object
+        """
+        super().__init__(parent)
+        if limit < 1:
+            raise ValueError("History limit must be positive")
+        self.limit = limit
+        self._entries: Deque[Dict[str, Any]] = deque()
+        # Formatted rows, built when a row is first shown
+        self._display: Dict[int, str] = {}
+        self._first_id = 0
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Get the number of entries."""
+        return 0 if parent.isValid() else len(self._entries)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        """Get an entry's preview text, or the entry itself for ``UserRole``."""
+        if not index.isValid() or not 0 <= index.row() < len(self._entries):
+            return None
+        entry = self._entries[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            entry_id = self._first_id + index.row()
+            text = self._display.get(entry_id)
+            if text is None:
+                text = self._display[entry_id] = format_history_entry(entry, HISTORY_PREVIEW_CHARS)
+            return text
+        if role == Qt.ItemDataRole.UserRole:
+            return entry
+        return None
+
+    def append(self, entry: Dict[str, Any]) -> None:
+        """Add an entry at the end, dropping the oldest one if the history is full."""
+        if len(self._entries) >= self.limit:
+            self.beginRemoveRows(QModelIndex(), 0, 0)
+            self._entries.popleft()
+            self._display.pop(self._first_id, None)
+            self._first_id += 1
+            self.endRemoveRows()
+        row = len(self._entries)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._entries.append(entry)
+        self.endInsertRows()
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        self.beginResetModel()
+        self._entries.clear()
+        self._display.clear()
+        self._first_id = 0
+        self.endResetModel()
+
+    def to_text(self) -> str:
+        """Format the whole history, with full texts, for copying."""
+        separator = "\n" + "-" * 50 + "\n"
+        return "".join(format_history_entry(entry) + separator for entry in self._entries)
+
 class TranslationWindow(QMainWindow):
     """Main window for the translation application."""
 
-    def __init__(self):
-        """Initialize the main window."""
+    def __init__(self, history_limit: int = HISTORY_LIMIT):
+        """Initialize the main window.
+        
+        Args:
+            history_limit: Largest number of translations kept in the chat history
+        """
         super().__init__()
         self.setWindowTitle("Fictional Language Translator")
         self.setMinimumSize(800, 600)
@@ -51,6 +257,32 @@ class TranslationWindow(QMainWindow):
         # Initialize translator
         self.translator = Translator()
         
+        # Translations run on a single pool thread, one job at a time
+        self.thread_pool = QThreadPool(self)
+        self.thread_pool.setMaxThreadCount(1)
+        self._job: Optional[TranslationJob] = None
+        self._job_id = 0
+        
+        # Decoded textures by path, and scaled ones by path, size bucket and smoothness
+        self._pixmaps: Dict[str, QPixmap] = {}
+        self._scaled_pixmaps: 'OrderedDict[Tuple[str, int, int, bool], QPixmap]' = OrderedDict()
+        self._background_key: Optional[Tuple[str, int, int, bool]] = None
+        # Rescales smoothly once resizing has settled
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(RESIZE_SETTLE_MS)
+        self._resize_timer.timeout.connect(lambda: self.update_background(self.lang_combo.currentText()))
+        
+        # Live translation state: the translated input, and edits not yet applied to it
+        self._live: Optional[IncrementalTranslation] = None
+        self._live_edits: List[Tuple[int, int, str]] = []
+        # Length of the input after the queued edits, in UTF-16 code units
+        self._live_length = 0
+        self._live_timer = QTimer(self)
+        self._live_timer.setSingleShot(True)
+        self._live_timer.setInterval(LIVE_DEBOUNCE_MS)
+        self._live_timer.timeout.connect(self._apply_live_edits)
+        
         # Create main widget and layout
         self.main_widget = QWidget()
         self.setCentralWidget(self.main_widget)
@@ -100,24 +332,39 @@ class TranslationWindow(QMainWindow):
         self.lang_combo.addItems(languages)
         lang_layout.addWidget(lang_label)
         lang_layout.addWidget(self.lang_combo)
+        self.live_check = QCheckBox("Live Translation")
+        self.live_check.setStyleSheet("color: white; font-weight: bold;")
+        lang_layout.addWidget(self.live_check)
         layout.addLayout(lang_layout)
         
         # Chat history
         history_label = QLabel("Chat History:")
         history_label.setStyleSheet("color: white; font-weight: bold;")
-        self.history_text = QTextEdit()
-        self.history_text.setReadOnly(True)
-        self.history_text.setStyleSheet("""
-            QTextEdit {
+        self.history_model = HistoryModel(history_limit, self)
+        self.history_view = QListView()
+        self.history_view.setModel(self.history_model)
+        # Rows of one fixed height, so appends and resizes do not lay out every row
+        self.history_view.setWordWrap(False)
+        self.history_view.setUniformItemSizes(True)
+        self.history_view.setLayoutMode(QListView.LayoutMode.Batched)
+        self.history_view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.history_view.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
+        self.history_view.setVerticalScrollMode(QListView.ScrollMode.ScrollPerPixel)
+        self.history_view.setStyleSheet("""
+            QListView {
                 background-color: rgba(128, 128, 128, 180);
                 border: 1px solid #A9A9A9;
                 border-radius: 5px;
                 color: white;
                 padding: 10px;
             }
+            QListView::item {
+                border-bottom: 1px solid #A9A9A9;
+                padding: 5px 0px;
+            }
         """)
         layout.addWidget(history_label)
-        layout.addWidget(self.history_text)
+        layout.addWidget(self.history_view)
         
         # Input area
         input_label = QLabel("Enter Text:")
@@ -136,6 +383,18 @@ class TranslationWindow(QMainWindow):
         layout.addWidget(input_label)
         layout.addWidget(self.input_text)
         
+        # Live translation of the input, shown in live mode
+        self.live_label = QLabel("Live Translation:")
+        self.live_label.setStyleSheet("color: white; font-weight: bold;")
+        self.live_output = QTextEdit()
+        self.live_output.setReadOnly(True)
+        self.live_output.setMaximumHeight(100)
+        self.live_output.setStyleSheet(self.input_text.styleSheet())
+        layout.addWidget(self.live_label)
+        layout.addWidget(self.live_output)
+        self.live_label.hide()
+        self.live_output.hide()
+        
         # Buttons
         button_layout = QHBoxLayout()
         button_style = """
@@ -169,33 +428,45 @@ class TranslationWindow(QMainWindow):
         button_layout.addWidget(self.clear_btn)
         layout.addLayout(button_layout)
         
+        # Busy indicator, shown while a translation runs
+        busy_layout = QHBoxLayout()
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setTextVisible(False)
+        self.progress_bar.setMaximumHeight(12)
+        self.cancel_btn = QPushButton("Cancel")
+        self.cancel_btn.setStyleSheet(button_style)
+        busy_layout.addWidget(self.progress_bar)
+        busy_layout.addWidget(self.cancel_btn)
+        layout.addLayout(busy_layout)
+        self.progress_bar.hide()
+        self.cancel_btn.hide()
+        
         # Connect signals
         self.translate_btn.clicked.connect(self.translate_text)
         self.untranslate_btn.clicked.connect(self.untranslate_text)
         self.copy_btn.clicked.connect(self.copy_history)
         self.clear_btn.clicked.connect(self.clear_all)
+        self.cancel_btn.clicked.connect(self.cancel_translation)
         self.lang_combo.currentTextChanged.connect(self.update_background)
-        
-        # Initialize chat history
-        self.chat_history: List[Dict[str, str]] = []
+        self.lang_combo.currentTextChanged.connect(self._restart_live)
+        self.live_check.toggled.connect(self.set_live_mode)
+        self.input_text.document().contentsChange.connect(self._input_changed)
         
         # Set initial background
         self.update_background(self.lang_combo.currentText())
 
-    def update_background(self, language: str) -> None:
-        """Update the background texture based on the selected language."""
-        language = language.lower()
-        if language in self.textures:
-            texture_path = get_asset_path(self.textures[language])
-            if os.path.exists(texture_path):
-                pixmap = QPixmap(texture_path)
-                # Scale the pixmap to fit the window while maintaining aspect ratio
-                scaled_pixmap = pixmap.scaled(
-                    self.size(),
-                    Qt.AspectRatioMode.KeepAspectRatioByExpanding,
-                    Qt.TransformationMode.SmoothTransformation
-                )
-                
+    def update_background(self, language: str, smooth: bool = True) -> None:
+        """Update the background texture based on the selected language.
+        
+        Args:
+            language: The selected language
+            smooth: Whether to scale with smooth filtering rather than the
+                fast transformation used while the window is being resized
+        """
+        key = self._background_cache_key(language, smooth)
+        if key is not None and key != self._background_key:
+            scaled_pixmap = self._scaled_background(key)
+            if scaled_pixmap is not None:
                 # Create a palette and set the background
                 palette = self.main_widget.palette()
                 palette.setBrush(
@@ -204,14 +475,127 @@ class TranslationWindow(QMainWindow):
                 )
                 self.main_widget.setAutoFillBackground(True)
                 self.main_widget.setPalette(palette)
+                self._background_key = key
+
+    def _background_cache_key(self, language: str, smooth: bool) -> Optional[Tuple[str, int, int, bool]]:
+        """Get the texture path and size bucket of the background for the window's size."""
+        texture = self.textures.get(language.lower())
+        if texture is None:
+            return None
+        # Scale to the size bucket, so small size changes reuse the same pixmap
+        width = -(-self.width() // BACKGROUND_SIZE_BUCKET) * BACKGROUND_SIZE_BUCKET
+        height = -(-self.height() // BACKGROUND_SIZE_BUCKET) * BACKGROUND_SIZE_BUCKET
+        return (get_asset_path(texture), width, height, smooth)
+
+    def _scaled_background(self, key: Tuple[str, int, int, bool]) -> Optional[QPixmap]:
+        """Get a texture scaled to a size bucket, decoding and scaling it only once."""
+        scaled_pixmap = self._scaled_pixmaps.get(key)
+        if scaled_pixmap is not None:
+            self._scaled_pixmaps.move_to_end(key)
+            return scaled_pixmap
+        
+        texture_path, width, height, smooth = key
+        pixmap = self._pixmaps.get(texture_path)
+        if pixmap is None:
+            if not os.path.exists(texture_path):
+                return None
+            pixmap = self._pixmaps[texture_path] = QPixmap(texture_path)
+        # Scale the pixmap to fit the window while maintaining aspect ratio
+        scaled_pixmap = pixmap.scaled(
+            QSize(width, height),
+            Qt.AspectRatioMode.KeepAspectRatioByExpanding,
+            Qt.TransformationMode.SmoothTransformation if smooth else Qt.TransformationMode.FastTransformation
+        )
+        self._scaled_pixmaps[key] = scaled_pixmap
+        if len(self._scaled_pixmaps) > BACKGROUND_CACHE_SIZE:
+            self._scaled_pixmaps.popitem(last=False)
+        return scaled_pixmap
 
     def resizeEvent(self, event) -> None:
-        """Handle window resize events to update the background scaling."""
+        """Handle window resize events to update the background scaling.
+        
+        While the window is being resized the background is rescaled with the
+        fast transformation, and smoothly once the size has settled.
+        """
         super().resizeEvent(event)
-        self.update_background(self.lang_combo.currentText())
+        language = self.lang_combo.currentText()
+        if self._background_cache_key(language, smooth=True) in self._scaled_pixmaps:
+            # A smooth version of this size is already at hand
+            self.update_background(language)
+            return
+        self.update_background(language, smooth=False)
+        self._resize_timer.start()
+
+    def set_live_mode(self, enabled: bool) -> None:
+        """Turn translation as you type on or off.
+        
+        In live mode, each edit of the input re-translates only the words
+        around it, shortly after typing pauses, and the result is spliced into
+        the live translation.
+        """
+        self._live_timer.stop()
+        self._live_edits.clear()
+        self._live = None
+        if enabled:
+            transformer = self.translator.get_transformer(self.lang_combo.currentText().lower())
+            # Qt counts document positions in UTF-16 code units
+            self._live = IncrementalTranslation(transformer, self.input_text.toPlainText(), utf16=True)
+            self._live_length = len(self._live)
+            self.live_output.setPlainText(self._live.output)
+        else:
+            self.live_output.clear()
+        self.live_label.setVisible(enabled)
+        self.live_output.setVisible(enabled)
+
+    def _restart_live(self) -> None:
+        """Translate the input from scratch after the language changed."""
+        if self._live is not None:
+            self.set_live_mode(True)
+
+    def _input_changed(self, position: int, removed: int, added: int) -> None:
+        """Queue an edit of the input for live translation."""
+        if self._live is None:
+            return
+        document = self.input_text.document()
+        # Replacing the whole text reports an edit that includes the document's
+        # final paragraph separator, one position past the end of the text
+        added = min(position + added, document.characterCount() - 1) - position
+        removed = min(removed, self._live_length - position)
+        self._live_length += added - removed
+        cursor = QTextCursor(document)
+        cursor.setPosition(position)
+        cursor.setPosition(position + added, QTextCursor.MoveMode.KeepAnchor)
+        # Selections use the Unicode paragraph separator between blocks
+        self._live_edits.append((position, removed, cursor.selectedText().replace('\u2029', '\n')))
+        self._live_timer.start()
+
+    def _apply_live_edits(self) -> None:
+        """Re-translate the queued edits and splice the results into the live translation."""
+        if self._live is None:
+            return
+        edits, self._live_edits = self._live_edits, []
+        output_edits: Optional[List[OutputEdit]] = []
+        try:
+            for edit in edits:
+                output_edits.append(self._live.apply_edit(*edit))
+        except ValueError:
+            output_edits = None
+        # The document's character count includes its final paragraph separator
+        if output_edits is None or self._live_length != self.input_text.document().characterCount() - 1:
+            # Qt reported an edit that does not line up with the text; start over
+            self.set_live_mode(True)
+            return
+        
+        cursor = QTextCursor(self.live_output.document())
+        cursor.beginEditBlock()
+        for start, removed, text in output_edits:
+            cursor.setPosition(start)
+            cursor.setPosition(start + removed, QTextCursor.MoveMode.KeepAnchor)
+            cursor.insertText(text)
+        cursor.endEditBlock()
 
     def translate_text(self) -> None:
-        """Translate the input text and update the chat history."""
+        """Start translating the input text; the chat history is updated when it finishes."""
         input_text = self.input_text.toPlainText().strip()
         if not input_text:
             QMessageBox.information(
@@ -221,32 +605,10 @@ class TranslationWindow(QMainWindow):
             )
             return
             
-        try:
-            selected_lang = self.lang_combo.currentText().lower()
-            translated_text = self.translator.translate(input_text, selected_lang)
-            
-            # Add to chat history
-            self.chat_history.append({
-                "original": input_text,
-                "translated": translated_text,
-                "language": selected_lang.title()
-            })
-            
-            # Update history display
-            self.update_history_display()
-            
-            # Clear input
-            self.input_text.clear()
-            
-        except Exception as e:
-            QMessageBox.critical(
-                self,
-                "Translation Error",
-                f"An error occurred during translation: {str(e)}"
-            )
+        self._start_job(input_text, reverse=False)
 
     def untranslate_text(self) -> None:
-        """Convert the translated text back to English."""
+        """Start converting the translated text back to English."""
         input_text = self.input_text.toPlainText().strip()
         if not input_text:
             QMessageBox.information(
@@ -256,52 +618,110 @@ class TranslationWindow(QMainWindow):
             )
             return
             
-        try:
-            selected_lang = self.lang_combo.currentText().lower()
-            original_text = self.translator.reverse_translate(input_text, selected_lang)
-            
-            # Add to chat history
-            self.chat_history.append({
-                "original": original_text,
-                "translated": input_text,
-                "language": selected_lang.title(),
+        self._start_job(input_text, reverse=True)
+
+    def _start_job(self, text: str, reverse: bool) -> None:
+        """Translate text on the thread pool, replacing any running job."""
+        if self._job is not None:
+            self._job.cancel()
+        self._job_id += 1
+        job = TranslationJob(self._job_id, self.translator, text, self.lang_combo.currentText().lower(), reverse)
+        job.signals.progress.connect(self._job_progress)
+        job.signals.finished.connect(self._job_finished)
+        job.signals.failed.connect(self._job_failed)
+        # Keep a reference so the job and its signals outlive this call
+        self._job = job
+        self._set_busy(True)
+        self.thread_pool.start(job)
+
+    def cancel_translation(self) -> None:
+        """Cancel the running translation, keeping the input text."""
+        if self._job is not None:
+            self._job.cancel()
+            self._job = None
+        self._set_busy(False)
+
+    def _set_busy(self, busy: bool) -> None:
+        """Show or hide the busy indicator and lock the input while translating."""
+        self.translate_btn.setEnabled(not busy)
+        self.untranslate_btn.setEnabled(not busy)
+        self.input_text.setReadOnly(busy)
+        # An empty range shows an indeterminate busy animation until progress arrives
+        self.progress_bar.setRange(0, 0)
+        self.progress_bar.setVisible(busy)
+        self.cancel_btn.setVisible(busy)
+
+    def _current_job(self, job_id: int) -> Optional[TranslationJob]:
+        """Get the running job if it has this id, ignoring stale signals."""
+        if self._job is not None and self._job.job_id == job_id:
+            return self._job
+        return None
+
+    def _job_progress(self, job_id: int, done: int, total: int) -> None:
+        if self._current_job(job_id) is not None:
+            self.progress_bar.setRange(0, 100)
+            self.progress_bar.setValue(done * 100 // total)
+
+    def _job_finished(self, job_id: int, result: str) -> None:
+        job = self._current_job(job_id)
+        if job is None:
+            return
+        self._job = None
+        self._set_busy(False)
+        
+        # Add to chat history
+        if job.reverse:
+            self.add_history_entry({
+                "original": result,
+                "translated": job.text,
+                "language": job.language.title(),
                 "is_reverse": True
             })
-            
-            # Update history display
-            self.update_history_display()
-            
-            # Clear input
-            self.input_text.clear()
-            
-        except Exception as e:
+        else:
+            self.add_history_entry({
+                "original": job.text,
+                "translated": result,
+                "language": job.language.title()
+            })
+        
+        # Clear input
+        self.input_text.clear()
+
+    def _job_failed(self, job_id: int, message: str) -> None:
+        job = self._current_job(job_id)
+        if job is None:
+            return
+        self._job = None
+        self._set_busy(False)
+        if job.reverse:
             QMessageBox.critical(
                 self,
                 "Untranslation Error",
-                f"An error occurred during untranslation: {str(e)}"
+                f"An error occurred during untranslation: {message}"
+            )
+        else:
+            QMessageBox.critical(
+                self,
+                "Translation Error",
+                f"An error occurred during translation: {message}"
             )
 
-    def update_history_display(self) -> None:
-        """Update the chat history display."""
-        history_text = ""
-        for entry in self.chat_history:
-            history_text += f"[{entry['language']}]\n"
-            if entry.get('is_reverse', False):
-                history_text += f"Translated: {entry['translated']}\n"
-                history_text += f"Original: {entry['original']}\n"
-            else:
-                history_text += f"Original: {entry['original']}\n"
-                history_text += f"Translated: {entry['translated']}\n"
-            history_text += "-" * 50 + "\n"
-        
-        self.history_text.setText(history_text)
-        # Scroll to bottom
-        scrollbar = self.history_text.verticalScrollBar()
-        scrollbar.setValue(scrollbar.maximum())
+    def closeEvent(self, event) -> None:
+        """Cancel any running translation and wait for its thread before closing."""
+        if self._job is not None:
+            self._job.cancel()
+            self._job = None
+        self.thread_pool.waitForDone()
+        super().closeEvent(event)
+
+    def add_history_entry(self, entry: Dict[str, Any]) -> None:
+        """Append a translation to the chat history and scroll to it."""
+        self.history_model.append(entry)
+        self.history_view.scrollToBottom()
 
     def copy_history(self) -> None:
         """Copy the chat history to clipboard."""
-        if not self.chat_history:
+        if not self.history_model.rowCount():
             QMessageBox.information(
                 self,
                 "Copy History",
@@ -309,11 +729,7 @@ class TranslationWindow(QMainWindow):
             )
             return
             
-        self.history_text.selectAll()
-        self.history_text.copy()
-        cursor = self.history_text.textCursor()
-        cursor.movePosition(QTextCursor.MoveOperation.Start)
-        self.history_text.setTextCursor(cursor)
+        QApplication.clipboard().setText(self.history_model.to_text())
         QMessageBox.information(
             self,
             "Copy History",
@@ -322,7 +738,7 @@ class TranslationWindow(QMainWindow):
 
     def clear_all(self) -> None:
         """Clear the input and chat history."""
-        if self.chat_history:
+        if self.history_model.rowCount():
             reply = QMessageBox.question(
                 self,
                 "Clear History",
@@ -333,8 +749,7 @@ class TranslationWindow(QMainWindow):
             
             if reply == QMessageBox.StandardButton.Yes:
                 self.input_text.clear()
-                self.chat_history.clear()
-                self.update_history_display()
+                self.history_model.clear()
 
 
 def main() -> None:
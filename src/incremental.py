@@ -0,0 +1,309 @@
+"""
+Incremental re-translation of text being edited.
+
+The text is kept as a list of segments, each ending with whitespace just
+before the start of a word, together with each segment's translation. No key of
+a splittable language contains whitespace, so every segment translates the
+same on its own as within the whole text. An edit re-translates only the
+segments it touches and reports where to splice the new translation into the
+existing output. The work per edit depends on the segment size, not on the
+length of the text: segment offsets are found through prefix sums of the
+segment lengths kept in a Fenwick tree, which an edit updates in a number of
+steps logarithmic in the number of segments.
+
+``IncrementalTranslation`` uses short segments for text typed in an editor.
+``DocumentTranslation`` segments large documents by paragraph and can also
+take a whole new version of the document, re-translating only the paragraphs
+that are not in the previous version.
+"""
+
+import re
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+
+from .batch import SPLIT_BYTES, can_split_document
+from .languages.base import BaseTransformer
+
+# Segments are cut at the first word start after this many characters
+SEGMENT_CHARS = 256
+# Document paragraphs longer than this are cut at word starts
+PARAGRAPH_CHARS = 64 * 1024
+# Word starts: ASCII whitespace followed by anything else
+_WORD_START = re.compile(
+    '[' + re.escape(SPLIT_BYTES.decode('ascii')) + '](?=[^' + re.escape(SPLIT_BYTES.decode('ascii')) + '])'
+)
+
+# Paragraph breaks: a newline followed by at least one more line break
+_PARAGRAPH_BREAK = re.compile(r'\n(?:[ \t\r\f\v]*\n)+')
+
+# Offset into the output, length of output replaced, replacement text
+OutputEdit = Tuple[int, int, str]
+
+
+def _utf16_length(text: str) -> int:
+    return len(text.encode('utf-16-le', 'surrogatepass')) // 2
+
+
+def _utf16_index(text: str, offset: int) -> int:
+    """Convert an offset in UTF-16 code units into an index into text."""
+    if text.isascii():
+        return offset
+    return len(text.encode('utf-16-le', 'surrogatepass')[:2 * offset].decode('utf-16-le', 'surrogatepass'))
+
+
+def split_segments(text: str, size: int = SEGMENT_CHARS) -> List[str]:
+    """Split text into segments of about ``size`` characters at word starts.
+
+    Args:
+        text: The text to split.
+        size: Length after which a segment ends at the next word start.
+
+    Returns:
+        The segments, which join back into ``text``.
+    """
+    segments = []
+    start = 0
+    while len(text) - start > size:
+        match = _WORD_START.search(text, start + size - 1)
+        if match is None:
+            break
+        segments.append(text[start:match.end()])
+        start = match.end()
+    if start < len(text) or not segments:
+        segments.append(text[start:])
+    return segments
+
+
+def split_paragraphs(text: str, size: int = PARAGRAPH_CHARS) -> List[str]:
+    """Split text after each paragraph break, and long paragraphs at word starts.
+
+    Paragraph breaks do not move when text elsewhere changes, so most
+    paragraphs of an edited document are split exactly as before.
+
+    Args:
+        text: The text to split.
+        size: Length after which a paragraph is cut at the next word start.
+
+    Returns:
+        The segments, which join back into ``text``.
+    """
+    segments: List[str] = []
+    start = 0
+    for match in _PARAGRAPH_BREAK.finditer(text):
+        segments.extend(split_segments(text[start:match.end()], size))
+        start = match.end()
+    if start < len(text) or not segments:
+        segments.extend(split_segments(text[start:], size))
+    return segments
+
+
+class _Lengths:
+    """Segment lengths and their prefix sums, kept in a Fenwick tree.
+
+    Looking up an offset and changing a length each take a number of steps
+    logarithmic in the number of segments. Adding or removing segments
+    rebuilds the tree.
+
+    Attributes:
+        total: The sum of all lengths.
+    """
+
+    def __init__(self, lengths: Iterable[int]):
+        self._lengths: List[int] = list(lengths)
+        self._build()
+
+    def _build(self) -> None:
+        self.total = sum(self._lengths)
+        tree = [0] + self._lengths
+        for i in range(1, len(tree)):
+            parent = i + (i & -i)
+            if parent < len(tree):
+                tree[parent] += tree[i]
+        self._tree = tree
+        self._top = 1 << (len(self._lengths).bit_length() - 1) if self._lengths else 0
+
+    def __getitem__(self, index: slice) -> List[int]:
+        return self._lengths[index]
+
+    def offset(self, index: int) -> int:
+        """Get the sum of the lengths before ``index``."""
+        total = 0
+        while index > 0:
+            total += self._tree[index]
+            index &= index - 1
+        return total
+
+    def find(self, offset: int) -> int:
+        """Count the segments that end at or before ``offset``."""
+        index = 0
+        step = self._top
+        while step:
+            if index + step < len(self._tree) and self._tree[index + step] <= offset:
+                index += step
+                offset -= self._tree[index]
+            step >>= 1
+        return index
+
+    def replace(self, start: int, stop: int, lengths: List[int]) -> None:
+        """Replace the lengths of segments ``start`` to ``stop``, exclusive."""
+        if len(lengths) != stop - start:
+            self._lengths[start:stop] = lengths
+            self._build()
+            return
+        self.total += sum(lengths) - sum(self._lengths[start:stop])
+        for index, length in enumerate(lengths, start):
+            change = length - self._lengths[index]
+            if change:
+                self._lengths[index] = length
+                position = index + 1
+                while position < len(self._tree):
+                    self._tree[position] += change
+                    position += position & -position
+
+
+class IncrementalTranslation:
+    """A text and its translation, kept in step as the text is edited.
+
+    Offsets are in characters, or in UTF-16 code units with ``utf16=True``,
+    which is how Qt's text documents count positions.
+
+    Attributes:
+        transformer: The transformer translating the text.
+        reverse: Whether translating from the language back to English.
+    """
+
+    def __init__(
+        self,
+        transformer: BaseTransformer,
+        text: str = '',
+        reverse: bool = False,
+        utf16: bool = False,
+    ):
+        """Translate the initial text.
+
+        Args:
+            transformer: The language's transformer.
+            text: The initial text.
+            reverse: Whether to translate from the language back to English.
+            utf16: Whether offsets are in UTF-16 code units.
+        """
+        self.transformer = transformer
+        self.reverse = reverse
+        self._convert_many: Callable[[Sequence[str]], List[str]] = (
+            transformer.reverse_transform_many if reverse else transformer.transform_many
+        )
+        self._length: Callable[[str], int] = _utf16_length if utf16 else len
+        self._index: Callable[[str, int], int] = _utf16_index if utf16 else (lambda text, offset: offset)
+        # Transformers whose keys may contain whitespace are re-translated whole
+        self._splittable = can_split_document(transformer, reverse)
+        self._sources: List[str] = []
+        self._outputs: List[str] = []
+        # Lengths in offset units, kept so edits need not measure every segment
+        self._source_lengths = _Lengths([])
+        self._output_lengths = _Lengths([])
+        self.reset(text)
+
+    @property
+    def text(self) -> str:
+        """The current text."""
+        return ''.join(self._sources)
+
+    @property
+    def output(self) -> str:
+        """The translation of the current text."""
+        return ''.join(self._outputs)
+
+    def __len__(self) -> int:
+        """Get the length of the text in offset units."""
+        return self._source_lengths.total
+
+    def _split(self, text: str) -> List[str]:
+        """Split text into segments that translate independently."""
+        return split_segments(text) if self._splittable else [text]
+
+    def reset(self, text: str) -> None:
+        """Replace the text, translating all of it."""
+        self._sources = self._split(text)
+        self._outputs = self._convert_many(self._sources)
+        self._measure()
+
+    def _measure(self) -> None:
+        """Measure every segment after the segments were replaced."""
+        self._source_lengths = _Lengths(map(self._length, self._sources))
+        self._output_lengths = _Lengths(map(self._length, self._outputs))
+
+    def apply_edit(self, position: int, removed: int, inserted: str) -> OutputEdit:
+        """Apply an edit to the text and re-translate the part it affects.
+
+        Args:
+            position: Offset of the edit.
+            removed: Length of text removed at ``position``.
+            inserted: Text inserted at ``position``.
+
+        Returns:
+            Where and how to edit the previous output so it becomes the
+            translation of the edited text: the offset, the length of output
+            to remove and the text to insert there.
+
+        Raises:
+            ValueError: If the edit lies outside the text.
+        """
+        total = self._source_lengths.total
+        if position < 0 or removed < 0 or position + removed > total:
+            raise ValueError(f"Edit at {position}+{removed} is outside the text of length {total}")
+
+        # Segments holding the edit; an edit at a segment's end belongs to the next one
+        last_index = len(self._sources) - 1
+        first = min(self._source_lengths.find(position), last_index)
+        last = min(self._source_lengths.find(position + removed), last_index)
+        span_start = self._source_lengths.offset(first)
+        span = ''.join(self._sources[first:last + 1])
+        start = self._index(span, position - span_start)
+        end = start + self._index(span[start:], removed)
+        edited = span[:start] + inserted + span[end:]
+        if len(edited) < SEGMENT_CHARS // 2 and last < last_index:
+            # Merge a small segment into the next one so deletions do not leave many tiny segments
+            last += 1
+            edited += self._sources[last]
+
+        sources = self._split(edited)
+        outputs = self._convert_many(sources)
+        output_start = self._output_lengths.offset(first)
+        output_removed = sum(self._output_lengths[first:last + 1])
+        self._sources[first:last + 1] = sources
+        self._outputs[first:last + 1] = outputs
+        self._source_lengths.replace(first, last + 1, list(map(self._length, sources)))
+        self._output_lengths.replace(first, last + 1, list(map(self._length, outputs)))
+        return output_start, output_removed, ''.join(outputs)
+
+
+class DocumentTranslation(IncrementalTranslation):
+    """A large document and its translation, kept in step as the document changes.
+
+    The document is segmented by paragraph. Besides ``apply_edit``, whose cost
+    depends on the size of the edit, ``update`` takes a whole new version of
+    the document and re-translates only the paragraphs that changed.
+    """
+
+    def _split(self, text: str) -> List[str]:
+        return split_paragraphs(text) if self._splittable else [text]
+
+    def update(self, text: str) -> str:
+        """Replace the document with a new version of it.
+
+        Paragraphs found in the previous version, looked up by their hash,
+        keep their translations; only new paragraphs are translated.
+
+        Args:
+            text: The new version of the document.
+
+        Returns:
+            The translation of the new version.
+        """
+        previous: Dict[str, str] = dict(zip(self._sources, self._outputs))
+        sources = self._split(text)
+        changed = [segment for segment in dict.fromkeys(sources) if segment not in previous]
+        previous.update(zip(changed, self._convert_many(changed)))
+        self._sources = sources
+        self._outputs = [previous[segment] for segment in sources]
+        self._measure()
+        return self.output
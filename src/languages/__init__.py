@@ -1,21 +1,10 @@
 """Language module initialization."""
 from typing import List
 
-from .elvish import ElvishTransformer
-from .cybernetic import CyberneticTransformer
-from .dwarvish import DwarvishTransformer
-from .insectoid import InsectoidTransformer
-from .celestial import CelestialTransformer
-from .necrotic import NecroticTransformer
+from .registry import BUILTIN_LANGUAGES, LanguageRegistry
 
-LANGUAGE_TRANSFORMERS = {
-    'elvish': ElvishTransformer,
-    'cybernetic': CyberneticTransformer,
-    'dwarvish': DwarvishTransformer,
-    'insectoid': InsectoidTransformer,
-    'celestial': CelestialTransformer,
-    'necrotic': NecroticTransformer,
-}
+# Transformer modules are imported on first use of a language
+LANGUAGE_TRANSFORMERS = LanguageRegistry(BUILTIN_LANGUAGES)
 
 __all__ = ['LANGUAGE_TRANSFORMERS', 'get_available_languages']
 
@@ -25,4 +14,12 @@ def get_available_languages() -> List[str]:
     Returns:
         List[str]: List of language names that can be used for translation.
     """
-    return list(LANGUAGE_TRANSFORMERS.keys()) 
\ No newline at end of file
+    return list(LANGUAGE_TRANSFORMERS.keys())
+
+
+def __getattr__(name: str):
+    """Import built-in transformer classes such as ``ElvishTransformer`` on access."""
+    for language, spec in BUILTIN_LANGUAGES.items():
+        if spec.endswith(f":{name}"):
+            return LANGUAGE_TRANSFORMERS[language]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
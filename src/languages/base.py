@@ -5,8 +5,12 @@ This module provides the base class that all language transformers should inheri
 It defines the interface that all transformers must implement.
 """
 
+import re
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+# Whitespace followed only by non-whitespace up to the end of the text
+_LAST_WHITESPACE = re.compile(r'\s(?=\S*\Z)')
 
 
 class BaseTransformer(ABC):
@@ -43,4 +47,106 @@ class BaseTransformer(ABC):
         Returns:
             The transformed text in English
         """
-        pass 
\ No newline at end of file
+        pass
+
+    def transform_many(self, texts: Sequence[str]) -> List[str]:
+        """Transform several independent texts.
+
+        Args:
+            texts: The English texts to transform.
+
+        Returns:
+            The transformed texts, in input order.
+        """
+        return [self.transform(text) for text in texts]
+
+    def reverse_transform_many(self, texts: Sequence[str]) -> List[str]:
+        """Transform several independent texts back to English.
+
+        Args:
+            texts: The texts in the target language.
+
+        Returns:
+            The English texts, in input order.
+        """
+        return [self.reverse_transform(text) for text in texts]
+
+    def transform_stream(self, chunks: Iterable[str]) -> Iterator[str]:
+        """Transform text arriving in chunks, yielding output as it is ready.
+
+        Args:
+            chunks: Pieces of English text, in order.
+
+        Yields:
+            Pieces of transformed text whose concatenation equals
+            ``transform(''.join(chunks))``.
+        """
+        return self._stream_by_words(chunks, self.transform)
+
+    def reverse_transform_stream(self, chunks: Iterable[str]) -> Iterator[str]:
+        """Transform text in the target language, arriving in chunks, back to English.
+
+        Args:
+            chunks: Pieces of text in the target language, in order.
+
+        Yields:
+            Pieces of English text whose concatenation equals
+            ``reverse_transform(''.join(chunks))``.
+        """
+        return self._stream_by_words(chunks, self.reverse_transform)
+
+    def transform_partial(self, text: str) -> Tuple[str, int]:
+        """Transform the part of a text that more text after it could not change.
+
+        Feed the rest, ``text[consumed:]``, back in front of the text that
+        follows, and transform the final rest with ``transform``.
+
+        Args:
+            text: English text that may continue.
+
+        Returns:
+            The transformation of ``text[:consumed]`` and ``consumed``.
+        """
+        return self._partial_by_words(text, self.transform)
+
+    def reverse_transform_partial(self, text: str) -> Tuple[str, int]:
+        """Transform the part of a text that more text after it could not change, back to English.
+
+        Args:
+            text: Text in the target language that may continue.
+
+        Returns:
+            The English text of ``text[:consumed]`` and ``consumed``.
+        """
+        return self._partial_by_words(text, self.reverse_transform)
+
+    @staticmethod
+    def _partial_by_words(text: str, convert: Callable[[str], str]) -> Tuple[str, int]:
+        """Convert text up to its last whitespace."""
+        match = _LAST_WHITESPACE.search(text)
+        if match is None:
+            return '', 0
+        return convert(text[:match.end()]), match.end()
+
+    @staticmethod
+    def _stream_by_words(chunks: Iterable[str], convert: Callable[[str], str]) -> Iterator[str]:
+        """Convert chunks, holding back the last partial word of each one.
+
+        This is safe for transformations that never look across whitespace.
+        Transformers that know their exact token boundaries override the
+        streaming methods with a tighter carry-over.
+        """
+        carry = ''
+        for chunk in chunks:
+            buffer = carry + chunk
+            match = _LAST_WHITESPACE.search(buffer)
+            if match is None:
+                carry = buffer
+                continue
+            carry = buffer[match.end():]
+            output = convert(buffer[:match.end()])
+            if output:
+                yield output
+        if carry:
+            yield convert(carry)
+
@@ -0,0 +1,158 @@
+"""
+Detection of the language a text was translated into.
+
+The index is built from the compiled packs. Languages that write in their own
+alphabet, such as runes or astrological symbols, are indexed by codepoint: each
+character maps to a bitset of the languages whose output contains it. Languages
+that spell their codes in ASCII are indexed by their reverse codes, matched as
+n-grams. Each language is also marked against the characters it never writes,
+e.g. the English letters it replaces, or capitals if it folds case.
+
+Only a bounded prefix of the text is sampled. Each language scores the share of
+the prefix's letters and symbols it explains, less the share it could not have
+written, and the best score wins.
+"""
+
+import re
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, List, Mapping, Optional, Pattern, Tuple
+
+from .engine import _trie_pattern
+from .pack import CompiledPack, PackTransformer
+
+# Language name that asks for the language to be detected
+AUTO_LANGUAGE = 'auto'
+# Characters sampled from the start of a text
+DETECT_PREFIX_CHARS = 4096
+# Lowest score accepted as a detection
+MIN_SCORE = 0.1
+
+
+class LanguageDetector:
+    """An index of the output alphabets and reverse codes of a set of languages.
+
+    Attributes:
+        languages: The indexed language names, in bit order.
+    """
+
+    def __init__(self, packs: Mapping[str, CompiledPack]):
+        """Build the index.
+
+        Args:
+            packs: The compiled pack of each language.
+        """
+        self.languages: List[str] = list(packs)
+        # Character -> bitset of the languages that write it as a code of its own
+        self._marks: Dict[str, int] = {}
+        # Character -> bitset of the languages that never write it
+        self._foreign: Dict[str, int] = {}
+        # Language bit, pattern matching its ASCII reverse codes and the weight of each code
+        self._codes: List[Tuple[int, Pattern, Dict[str, int]]] = []
+        alphabets = []
+        for index, pack in enumerate(packs.values()):
+            bit = 1 << index
+            written = {char for value in pack.forward.values() for char in value}
+            if pack.separator:
+                written.update(pack.separator)
+            replaced = {key for key in pack.forward if len(key) == 1}
+            if pack.fold_case:
+                replaced.update([key.upper() for key in replaced] + [chr(c) for c in range(ord('A'), ord('Z') + 1)])
+            if all(not code.isascii() for code in pack.reverse):
+                for char in written:
+                    if not char.isascii():
+                        self._marks[char] = self._marks.get(char, 0) | bit
+                foreign = replaced - written
+            else:
+                # Letters it replaces only ever appear inside its codes, so a
+                # matched code also cancels the penalty for its letters
+                weights = {code: len(code) + sum(char in replaced for char in code) for code in pack.reverse}
+                self._codes.append((bit, re.compile(_trie_pattern(pack.reverse)), weights))
+                foreign = replaced
+            for char in foreign:
+                self._foreign[char] = self._foreign.get(char, 0) | bit
+            alphabets.append(written)
+        # Nor does a language write the symbols of another that are not its own
+        for char in self._marks:
+            for index, written in enumerate(alphabets):
+                if char not in written:
+                    self._foreign[char] = self._foreign.get(char, 0) | 1 << index
+
+    def scores(self, text: str) -> Dict[str, float]:
+        """Score how well each language explains the start of a text.
+
+        Args:
+            text: The text to score.
+
+        Returns:
+            Per language, the share of the sampled letters and symbols it
+            explains less the share it could not have written, from -1 to 1.
+        """
+        prefix = text[:DETECT_PREFIX_CHARS]
+        explained = [0] * len(self.languages)
+        signal = 0
+        for char, count in Counter(prefix).items():
+            marks = self._marks.get(char, 0)
+            if not (marks or char.isalnum()):
+                continue
+            signal += count
+            foreign = self._foreign.get(char, 0)
+            for index in range(len(self.languages)):
+                if marks >> index & 1:
+                    explained[index] += count
+                elif foreign >> index & 1:
+                    explained[index] -= count
+        for bit, pattern, weights in self._codes:
+            explained[bit.bit_length() - 1] += sum(weights[code] for code in pattern.findall(prefix))
+        if not signal:
+            return dict.fromkeys(self.languages, 0.0)
+        return {language: score / signal for language, score in zip(self.languages, explained)}
+
+    def detect(self, text: str) -> Optional[str]:
+        """Detect the language a text was translated into.
+
+        Args:
+            text: The text in an unknown language.
+
+        Returns:
+            The best scoring language, or None if no language explains the
+            text well enough.
+        """
+        scores = self.scores(text)
+        language = max(scores, key=scores.get, default=None)
+        if language is None or scores[language] < MIN_SCORE:
+            return None
+        return language
+
+
+@lru_cache(maxsize=None)
+def _detector(languages: Tuple[str, ...]) -> LanguageDetector:
+    from . import LANGUAGE_TRANSFORMERS
+
+    packs = {}
+    for language in languages:
+        transformer = LANGUAGE_TRANSFORMERS[language]
+        # Only languages defined by a pack can be indexed
+        if issubclass(transformer, PackTransformer):
+            packs[language] = transformer().pack
+    return LanguageDetector(packs)
+
+
+def detect_language(text: str, languages: Optional[Tuple[str, ...]] = None) -> Optional[str]:
+    """Detect which language a text was translated into.
+
+    The index for a set of languages is built on first use and kept.
+
+    Args:
+        text: The text in an unknown language.
+        languages: Candidate language names; defaults to every registered
+            language defined by a pack.
+
+    Returns:
+        The detected language name, or None if the text matches none of them.
+    """
+    if languages is None:
+        from . import LANGUAGE_TRANSFORMERS
+
+        languages = tuple(LANGUAGE_TRANSFORMERS)
+    return _detector(tuple(language.lower() for language in languages)).detect(text)
@@ -0,0 +1,377 @@
+"""
+Compiled translation-table engine shared by the language transformers.
+
+This module turns a language's character mappings into a lookup structure that is
+built once and then translates text in a single linear pass, instead of chaining
+one ``str.replace`` call per mapping.
+"""
+
+import re
+from itertools import product
+from typing import Dict, Iterable, List, Mapping, Optional, Pattern, Sequence, Tuple, Union
+
+# Single-character tables whose highest key stays below this codepoint are stored
+# as a dense list, which ``str.translate`` indexes faster than a dict.
+DENSE_TABLE_LIMIT = 0x10000
+# Texts at least this long are translated with the NumPy backend when it is
+# installed and every character maps to exactly one character
+VECTOR_MIN_CHARS = 64 * 1024
+_UNSET = object()
+
+
+def _build_single_table(singles: Mapping[str, str]) -> Union[List, Dict[int, object]]:
+    """Build a ``str.translate`` table for single-character keys.
+
+    Args:
+        singles: Mapping from single characters to their replacement strings.
+
+    Returns:
+        A dense list indexed by codepoint when the keys allow it, otherwise a dict.
+        Values of length one are stored as codepoints, which translate faster.
+    """
+    values = {
+        ord(key): ord(value) if len(value) == 1 else value
+        for key, value in singles.items()
+    }
+    highest = max(values, default=-1)
+    if highest >= DENSE_TABLE_LIMIT:
+        return values
+
+    table: List[object] = list(range(highest + 1))
+    for codepoint, value in values.items():
+        table[codepoint] = value
+    return table
+
+
+def case_variants(key: str) -> List[str]:
+    """List every upper/lower-case spelling of a key.
+
+    Args:
+        key: The key to vary, e.g. ``'th'``.
+
+    Returns:
+        All spellings, e.g. ``['th', 'tH', 'Th', 'TH']``.
+    """
+    return [''.join(chars) for chars in product(*(dict.fromkeys((c.lower(), c.upper())) for c in key))]
+
+
+def _trie_pattern(keys: Iterable[str]) -> str:
+    """Render a set of keys as a regular expression shaped like their trie.
+
+    Sibling branches start with distinct characters, so at any position at most one
+    branch can continue and matching costs at most one step per key character. A
+    node that ends a key makes its subtree optional, which keeps the match
+    greedy: the longest key that fits wins.
+
+    Args:
+        keys: Non-empty strings to match.
+
+    Returns:
+        The pattern source.
+    """
+    trie: Dict[str, dict] = {}
+    for key in keys:
+        node = trie
+        for char in key:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def render(node: Dict[str, dict]) -> str:
+        children = sorted((char, child) for char, child in node.items() if char)
+        if not children:
+            return ''
+        if all(set(child) == {''} for _, child in children) and len(children) > 1:
+            body = '[' + ''.join(re.escape(char) for char, _ in children) + ']'
+        else:
+            branches = [re.escape(char) + render(child) for char, child in children]
+            body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        return '(?:' + body + ')?' if '' in node else body
+
+    return render(trie)
+
+
+class TranslationTable:
+    """A mapping compiled for single-pass, leftmost-longest translation.
+
+    Single-character keys are translated with ``str.translate``. Keys longer than
+    one character are found by a regular expression compiled from their trie,
+    which prefers the longest key at each position and does a bounded amount of
+    work per character; the text between two matches is translated character by
+    character.
+
+    Attributes:
+        mapping: The source-to-target mapping the table was compiled from.
+        max_key_length: Length of the longest key, or 0 for an empty table.
+    """
+
+    def __init__(self, mapping: Mapping[str, str]):
+        """Compile the table.
+
+        Args:
+            mapping: Source strings mapped to their replacements. Keys must be
+                non-empty.
+        """
+        self.mapping: Dict[str, str] = dict(mapping)
+        self.max_key_length = max(map(len, self.mapping), default=0)
+
+        singles = {k: v for k, v in self.mapping.items() if len(k) == 1}
+        self._multi = {k: v for k, v in self.mapping.items() if len(k) > 1}
+        self._singles = _build_single_table(singles) if singles else None
+        self._pattern: Optional[Pattern[str]] = None
+        if self._multi:
+            self._pattern = re.compile(_trie_pattern(self._multi))
+        # Built on first use, since importing NumPy is slow
+        self._vector = _UNSET
+
+    def _vector_table(self):
+        """Get the NumPy backend for this table, or None if it cannot be used."""
+        if self._vector is _UNSET:
+            from .vectorized import VectorTable
+            vector = VectorTable.build(self._singles) if self._singles is not None else None
+            self._vector = vector if vector is not None and vector.fixed_width else None
+        return self._vector
+
+    def _replace(self, match: 're.Match[str]') -> str:
+        return self._multi[match.group()]
+
+    def translate(self, text: str) -> str:
+        """Translate text in one pass.
+
+        Args:
+            text: The text to translate.
+
+        Returns:
+            The translated text. Characters without a mapping are kept as-is.
+        """
+        if self._pattern is None:
+            if self._singles is None:
+                return text
+            if len(text) >= VECTOR_MIN_CHARS:
+                vector = self._vector_table()
+                if vector is not None:
+                    return vector.translate(text)
+            return text.translate(self._singles)
+        if self._singles is None:
+            return self._pattern.sub(self._replace, text)
+
+        singles = self._singles
+        multi = self._multi
+        parts = []
+        position = 0
+        for match in self._pattern.finditer(text):
+            start = match.start()
+            if start > position:
+                parts.append(text[position:start].translate(singles))
+            parts.append(multi[match.group()])
+            position = match.end()
+        parts.append(text[position:].translate(singles))
+        return ''.join(parts)
+
+    def translate_partial(self, text: str) -> Tuple[str, int]:
+        """Translate the part of a text that more input could not change.
+
+        A key starting near the end of ``text`` might continue in text that has
+        not arrived yet, so translation stops before the last
+        ``max_key_length - 1`` characters unless a key already spans them. Feed
+        the unconsumed rest back in front of the next piece of text, and pass the
+        final rest to ``translate``.
+
+        Args:
+            text: The text received so far.
+
+        Returns:
+            The translation of ``text[:consumed]`` and ``consumed``.
+        """
+        if self._pattern is None:
+            return self.translate(text), len(text)
+
+        limit = len(text) - self.max_key_length + 1
+        if limit <= 0:
+            return '', 0
+
+        singles = self._singles
+        parts = []
+        position = 0
+        for match in self._pattern.finditer(text):
+            start = match.start()
+            if start >= limit:
+                break
+            if start > position:
+                segment = text[position:start]
+                parts.append(segment.translate(singles) if singles else segment)
+            parts.append(self._multi[match.group()])
+            position = match.end()
+        if position < limit:
+            segment = text[position:limit]
+            parts.append(segment.translate(singles) if singles else segment)
+            position = limit
+        return ''.join(parts), position
+
+
+def _keys_interact(a: str, b: str) -> bool:
+    """Check whether two keys could overlap in text: one contains the other, or
+    the end of one is the start of the other."""
+    if a in b or b in a:
+        return True
+    return any(a.endswith(b[:i]) or b.endswith(a[:i]) for i in range(1, min(len(a), len(b))))
+
+
+# Joins pieces of text so one str.translate call covers all of them
+_GAP_SEPARATOR = '\x00'
+# Texts shorter than this that contain keys are translated by each table on its
+# own, which measured faster than splitting them for the shared scan
+SHARED_SCAN_MIN_CHARS = 6
+# Texts at least this long are translated word by word when few words are distinct
+SHARED_WORDS_MIN_CHARS = 64 * 1024
+# Translate word by word only if the distinct words are at most this share of the text
+_SHARED_WORDS_MAX_RATIO = 0.25
+# Distinct words above this share of the first SHARED_WORDS_MIN_CHARS characters
+# mark a text whose words hardly repeat; fewer words repeat in a prefix than
+# in the whole text, so the bound is looser
+_SAMPLE_WORDS_MAX_RATIO = 0.5
+_WHITESPACE = re.compile(r'(\s+)')
+
+
+def _distinct_length(words: Iterable[str]) -> int:
+    """Count the characters of the distinct words."""
+    return sum(map(len, dict.fromkeys(words)))
+
+
+class SharedScan:
+    """Translates one text with several tables, sharing work between them.
+
+    How much is saved depends on how often the words of the text repeat. Long
+    texts are split into words, and only the distinct words are scanned and
+    translated. Each table's output is then assembled from its translations of
+    those words, which is much cheaper than translating every character when
+    words repeat, as they do in prose. Long texts whose words hardly repeat
+    gain nothing from this, and are translated by each table on its own.
+
+    Short texts are scanned once: the multi-character keys of every table are
+    matched together in a scan that splits the text into the gaps between
+    matches and the matched keys. Each table then translates all the gaps with
+    one ``str.translate`` call and maps the matched keys through a lookup
+    table; keys belonging to other tables are translated character by
+    character. If no table has a key in the text, each table only translates
+    its characters. This saves each table's own scan and per-call overhead,
+    not the work per character.
+
+    This is only equivalent to each table's own ``translate`` if another table's
+    key can never overlap one of its own keys in the text. Tables where that is
+    not the case are translated on their own instead.
+    """
+
+    def __init__(self, tables: Sequence[TranslationTable], fold_case: Optional[Sequence[bool]] = None):
+        """Prepare the shared scan.
+
+        Args:
+            tables: The tables to translate with.
+            fold_case: Per table, whether text is lower-cased before it is
+                translated, as for ``fold`` case packs.
+        """
+        self.tables = list(tables)
+        self.fold_case = list(fold_case) if fold_case is not None else [False] * len(self.tables)
+        self._joinable = not any(
+            _GAP_SEPARATOR in item
+            for table in self.tables
+            for pair in table.mapping.items()
+            for item in pair
+        )
+
+        # Multi-character keys each table matches in the original, unfolded text
+        own_keys = []
+        for table, fold in zip(self.tables, self.fold_case):
+            keys = table._multi
+            if fold:
+                keys = {
+                    variant: value for key, value in keys.items()
+                    for variant in case_variants(key) if variant.lower() == key
+                }
+            own_keys.append(keys)
+        union = set().union(*own_keys)
+        # Words can be translated one by one if no key spans two of them
+        self._by_words = self._joinable and not any(
+            _WHITESPACE.search(key) for table in self.tables for key in table._multi
+        )
+
+        # Per table, every matched key's translation, or None to translate alone
+        self._token_maps: List[Optional[Dict[str, str]]] = []
+        for table, fold, keys in zip(self.tables, self.fold_case, own_keys):
+            others = union.difference(keys)
+            if any(_keys_interact(key, other) for key in keys for other in others):
+                self._token_maps.append(None)
+                continue
+            token_map = {key: _translate_singles(table, key.lower() if fold else key) for key in others}
+            token_map.update(keys)
+            self._token_maps.append(token_map)
+        # The capturing group makes split() return the matched keys between the gaps
+        self._pattern = re.compile('(' + _trie_pattern(union) + ')') if union else None
+
+    def translate(self, text: str) -> List[str]:
+        """Translate text with every table.
+
+        Args:
+            text: The text to translate.
+
+        Returns:
+            One translation per table, in order.
+        """
+        if len(text) < SHARED_WORDS_MIN_CHARS:
+            return self._translate(text)
+        if self._by_words and _GAP_SEPARATOR not in text:
+            # Check a prefix first, so text whose words hardly repeat is not split whole
+            sample = text[:SHARED_WORDS_MIN_CHARS]
+            if _distinct_length(_WHITESPACE.split(sample)) <= len(sample) * _SAMPLE_WORDS_MAX_RATIO:
+                words = _WHITESPACE.split(text)
+                distinct = list(dict.fromkeys(words))
+                if sum(map(len, distinct)) <= len(text) * _SHARED_WORDS_MAX_RATIO:
+                    results = []
+                    for translated in self._translate(_GAP_SEPARATOR.join(distinct)):
+                        lookup = dict(zip(distinct, translated.split(_GAP_SEPARATOR)))
+                        results.append(''.join(map(lookup.__getitem__, words)))
+                    return results
+        return [self._translate_alone(i, text) for i in range(len(self.tables))]
+
+    def _translate(self, text: str) -> List[str]:
+        if self._pattern is None or not self._joinable or _GAP_SEPARATOR in text:
+            return [self._translate_alone(i, text) for i in range(len(self.tables))]
+
+        parts = self._pattern.split(text)
+        # Lower-casing never changes the length of ASCII text, so keys matched in
+        # the original text line up with the folded text
+        ascii_text = text.isascii()
+        if len(parts) == 1:
+            # No table has a key in the text, so each only translates characters
+            return [
+                _translate_singles(table, text.lower() if fold else text) if ascii_text or not fold
+                else self._translate_alone(i, text)
+                for i, (table, fold) in enumerate(zip(self.tables, self.fold_case))
+            ]
+        if len(text) < SHARED_SCAN_MIN_CHARS:
+            return [self._translate_alone(i, text) for i in range(len(self.tables))]
+        gaps = _GAP_SEPARATOR.join(parts[0::2])
+        matched = parts[1::2]
+
+        results = []
+        for i, (table, fold, token_map) in enumerate(zip(self.tables, self.fold_case, self._token_maps)):
+            if token_map is None or (fold and not ascii_text):
+                results.append(self._translate_alone(i, text))
+            elif not table._multi and not fold:
+                # Keys of other tables make no difference to this one
+                results.append(table.translate(text))
+            else:
+                output = parts[:]
+                output[0::2] = _translate_singles(table, gaps.lower() if fold else gaps).split(_GAP_SEPARATOR)
+                output[1::2] = map(token_map.__getitem__, matched)
+                results.append(''.join(output))
+        return results
+
+    def _translate_alone(self, index: int, text: str) -> str:
+        if self.fold_case[index]:
+            text = text.lower()
+        return self.tables[index].translate(text)
+
+
+def _translate_singles(table: TranslationTable, text: str) -> str:
+    """Translate text with only a table's single-character keys."""
+    return text.translate(table._singles) if table._singles is not None else text
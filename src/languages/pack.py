@@ -0,0 +1,486 @@
+"""
+Declarative language packs and their compiled lookup tables.
+
+A language pack is a JSON document describing a language's letter mappings,
+digraphs, case rules and word separator. Packs are compiled into forward and
+reverse lookup tables once per process, on first use. The tables are small, so
+compiling a pack straight from its JSON is quick, and measured faster than
+reading the tables back from an on-disk cache.
+
+Pack format::
+
+    {
+        "name": "insectoid",
+        "version": "1.0.0",
+        "description": "Chittering and clicking patterns.",
+        "case": "upper",
+        "consonants": {"b": "bzz", ...},
+        "vowels": {"a": "akk", ...},
+        "digraphs": {"th": "thkk", ...},
+        "separator": null
+    }
+
+Keys are written in lower case. The ``case`` rule decides how other spellings are
+handled:
+
+- ``upper``: upper-case letters map to the upper-cased output; a digraph spelled
+  fully in upper case does too, and any other spelling uses the plain output.
+- ``title``: as ``upper``, except a digraph spelled with only its first letter in
+  upper case upper-cases only the first output character, and decoding also
+  accepts upper-case and title-case codes.
+- ``fold``: text is lower-cased before it is translated in either direction.
+"""
+
+import hashlib
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Type, Union
+
+from .base import BaseTransformer
+from .engine import TranslationTable, case_variants
+
+PACK_DIR = Path(__file__).parent / 'packs'
+CASE_RULES = ('upper', 'title', 'fold')
+
+# Joins a batch of texts into one translation call; no pack uses it in a mapping
+BATCH_SEPARATOR = '\x00'
+# Characters before a held-back capital sigma kept as context for lower-casing it
+SIGMA_CONTEXT = 32
+
+
+class LanguagePack:
+    """A parsed, validated language pack.
+
+    Attributes:
+        name: Language name used to look the language up.
+        version: Version string of the pack's content.
+        description: Short human-readable description.
+        case: One of ``CASE_RULES``.
+        consonants: Lower-case consonant mappings.
+        vowels: Lower-case vowel mappings.
+        digraphs: Lower-case multi-letter mappings.
+        separator: Optional word separator used by the language.
+        digest: SHA-256 hex digest of the pack source.
+    """
+
+    def __init__(self, data: Dict, digest: str):
+        """Validate pack data.
+
+        Args:
+            data: The decoded JSON document.
+            digest: Content hash of the source document.
+
+        Raises:
+            ValueError: If the pack is malformed.
+        """
+        if not isinstance(data, dict):
+            raise ValueError("Language pack must be a JSON object")
+        self.name = data.get('name')
+        if not isinstance(self.name, str) or not self.name:
+            raise ValueError("Language pack needs a non-empty 'name'")
+        self.version = str(data.get('version', '0'))
+        self.description = str(data.get('description', ''))
+        self.case = data.get('case', 'upper')
+        if self.case not in CASE_RULES:
+            raise ValueError(f"Language pack '{self.name}' has unknown case rule: {self.case}")
+        self.consonants = self._mapping(data, 'consonants')
+        self.vowels = self._mapping(data, 'vowels')
+        self.digraphs = self._mapping(data, 'digraphs')
+        self.separator: Optional[str] = data.get('separator')
+        self.digest = digest
+
+    def _mapping(self, data: Dict, field: str) -> Dict[str, str]:
+        mapping = data.get(field, {})
+        if not isinstance(mapping, dict) or not all(
+            isinstance(k, str) and k and isinstance(v, str) for k, v in mapping.items()
+        ):
+            raise ValueError(f"Language pack '{self.name}' has an invalid '{field}' table")
+        return dict(mapping)
+
+    @classmethod
+    def from_file(cls, path: Union[str, Path]) -> 'LanguagePack':
+        """Load a pack from a JSON file.
+
+        Args:
+            path: Path to the pack file.
+
+        Returns:
+            The parsed pack.
+
+        Raises:
+            ValueError: If the file is not a valid pack.
+        """
+        source = Path(path).read_bytes()
+        digest = hashlib.sha256(source).hexdigest()
+        try:
+            data = json.loads(source.decode('utf-8'))
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            raise ValueError(f"Invalid language pack {path}: {e}") from e
+        return cls(data, digest)
+
+
+class CompiledPack:
+    """Lookup tables compiled from a language pack.
+
+    Attributes:
+        name: Language name.
+        version: Pack version string.
+        digest: Content hash of the pack the tables were compiled from.
+        fold_case: Whether text is lower-cased before translation.
+        separator: Optional word separator.
+        forward: English-to-language mapping, with every case spelling listed.
+        reverse: Language-to-English mapping.
+        consonants: Consonant mappings as exposed on the transformer.
+        vowels: Vowel mappings as exposed on the transformer.
+        digraphs: Digraph mappings as exposed on the transformer.
+    """
+
+    def __init__(
+        self,
+        meta: Dict,
+        fold_case: bool,
+        tables: Tuple[Dict[str, str], ...],
+    ):
+        """Wrap compiled tables.
+
+        Args:
+            meta: ``name``, ``version``, ``digest`` and ``separator`` of the pack.
+            fold_case: Whether text is lower-cased before translation.
+            tables: Forward, reverse, consonant, vowel and digraph tables.
+        """
+        self.name: str = meta['name']
+        self.version: str = meta['version']
+        self.digest: str = meta['digest']
+        self.separator: Optional[str] = meta.get('separator')
+        self.fold_case = fold_case
+        self.forward, self.reverse, self.consonants, self.vowels, self.digraphs = tables
+        self._forward_table: Optional[TranslationTable] = None
+        self._reverse_table: Optional[TranslationTable] = None
+
+    @property
+    def forward_table(self) -> TranslationTable:
+        """The compiled English-to-language table, shared by all transformers."""
+        if self._forward_table is None:
+            self._forward_table = TranslationTable(self.forward)
+        return self._forward_table
+
+    @property
+    def reverse_table(self) -> TranslationTable:
+        """The compiled language-to-English table, shared by all transformers."""
+        if self._reverse_table is None:
+            self._reverse_table = TranslationTable(self.reverse)
+        return self._reverse_table
+
+
+def _with_upper(mapping: Dict[str, str]) -> Dict[str, str]:
+    """Add upper-case keys mapping to upper-cased outputs."""
+    result = dict(mapping)
+    result.update({k.upper(): v.upper() for k, v in mapping.items()})
+    return result
+
+
+def _digraph_spellings(digraphs: Dict[str, str], case: str) -> Dict[str, str]:
+    """List the output of every case spelling of each digraph."""
+    spellings: Dict[str, str] = {}
+    for digraph, output in digraphs.items():
+        if case == 'fold':
+            spellings[digraph] = output
+            continue
+        for variant in case_variants(digraph):
+            if variant.isupper():
+                spellings[variant] = output.upper()
+            elif case == 'title' and variant[0].isupper() and variant[1:].islower():
+                spellings[variant] = output[0].upper() + output[1:]
+            else:
+                spellings[variant] = output
+    return spellings
+
+
+def _reverse_pairs(pairs: Iterable[Tuple[str, str]]) -> Dict[str, str]:
+    """Invert mappings; a later mapping to the same output wins."""
+    return {output: source for source, output in pairs}
+
+
+def compile_pack(pack: LanguagePack) -> CompiledPack:
+    """Compile a pack into forward and reverse lookup tables.
+
+    Args:
+        pack: The pack to compile.
+
+    Returns:
+        The compiled pack.
+    """
+    if pack.case == 'upper':
+        consonants, vowels = _with_upper(pack.consonants), _with_upper(pack.vowels)
+        digraphs = _with_upper(pack.digraphs)
+    else:
+        consonants, vowels, digraphs = dict(pack.consonants), dict(pack.vowels), dict(pack.digraphs)
+
+    letters = {**consonants, **vowels}
+    forward = letters if pack.case == 'fold' else _with_upper(letters)
+    forward.update(_digraph_spellings(pack.digraphs, pack.case))
+
+    reverse = _reverse_pairs([*consonants.items(), *vowels.items(), *digraphs.items()])
+    if pack.case == 'title':
+        # Longer codes first; each code keeps the first English text to claim it
+        decoding: Dict[str, str] = {}
+        for code, text in sorted(reverse.items(), key=lambda x: len(x[0]), reverse=True):
+            decoding.setdefault(code, text)
+            decoding.setdefault(code.upper(), text.upper())
+            if len(code) > 1:
+                decoding.setdefault(code[0].upper() + code[1:], text[0].upper() + text[1:])
+        reverse = decoding
+
+    meta = {
+        'name': pack.name,
+        'version': pack.version,
+        'digest': pack.digest,
+        'separator': pack.separator,
+    }
+    return CompiledPack(meta, pack.case == 'fold', (forward, reverse, consonants, vowels, digraphs))
+
+
+@lru_cache(maxsize=None)
+def load_compiled_pack(path: Union[str, Path]) -> CompiledPack:
+    """Load and compile a pack, once per process.
+
+    Transformers of one language in the same process share the compiled pack
+    and its tables.
+
+    Args:
+        path: Path to the pack file.
+
+    Returns:
+        The compiled pack.
+
+    Raises:
+        ValueError: If the pack file is malformed.
+    """
+    return compile_pack(LanguagePack.from_file(path))
+
+
+def get_pack_path(name: str) -> Path:
+    """Get the path of a built-in language pack.
+
+    Args:
+        name: Language name.
+
+    Returns:
+        Path to the pack file.
+    """
+    return PACK_DIR / f"{name}.json"
+
+
+def _fold_settled(text: str) -> Tuple[str, str]:
+    """Lower-case the part of a text whose lower case no text after it could change.
+
+    A capital sigma lower-cases to a final sigma when a cased letter comes
+    before it and none after it. So the end of the text is held back with up to
+    ``SIGMA_CONTEXT`` characters of the word before it, and from further back
+    when a capital sigma near the end is not settled yet.
+
+    Args:
+        text: Text that may continue.
+
+    Returns:
+        The lower-cased settled part, and the rest in its original case.
+    """
+    end = len(text)
+    sigma = text.rfind('Σ')
+    if sigma >= 0:
+        tail = text[max(sigma - SIGMA_CONTEXT, 0):]
+        if (tail + 'a').lower()[:-1] != tail.lower():
+            end = sigma
+    start = max(end - SIGMA_CONTEXT, 0)
+    for index in range(end - 1, start - 1, -1):
+        if text[index].isspace():
+            start = index + 1
+            break
+    folded = text.lower()
+    return (folded[:start] if len(folded) == len(text) else text[:start].lower()), text[start:]
+
+
+class PackTransformer(BaseTransformer):
+    """A transformer driven by a compiled language pack.
+
+    Subclasses set ``pack_name`` for a built-in pack or ``pack_path`` for a pack
+    file elsewhere.
+    """
+
+    pack_name: Optional[str] = None
+    pack_path: Optional[Union[str, Path]] = None
+
+    def __init__(self):
+        """Load the compiled pack and expose its mappings."""
+        path = self.pack_path if self.pack_path is not None else get_pack_path(self.pack_name)
+        self.pack = load_compiled_pack(str(path))
+        self.consonant_mappings = dict(self.pack.consonants)
+        self.vowel_mappings = dict(self.pack.vowels)
+        self.digraph_mappings = dict(self.pack.digraphs)
+        self.word_separator = self.pack.separator
+        self._forward_table = self.pack.forward_table
+        self._reverse_table = self.pack.reverse_table
+        self._can_join = not any(
+            BATCH_SEPARATOR in item
+            for mapping in (self.pack.forward, self.pack.reverse)
+            for pair in mapping.items()
+            for item in pair
+        )
+
+    @classmethod
+    def for_pack(cls, path: Union[str, Path]) -> Type['PackTransformer']:
+        """Create a transformer class for a pack file.
+
+        Args:
+            path: Path to the pack file.
+
+        Returns:
+            A ``PackTransformer`` subclass bound to the pack.
+
+        Raises:
+            ValueError: If the pack file is malformed.
+        """
+        pack = LanguagePack.from_file(path)
+        class_name = ''.join(part.title() for part in pack.name.split('_')) + 'Transformer'
+        return type(class_name, (cls,), {'pack_path': str(path), '__doc__': pack.description})
+
+    def transform(self, text: str) -> str:
+        """Transform text into the pack's language.
+
+        Args:
+            text: The input text to transform.
+
+        Returns:
+            The transformed text.
+        """
+        if not text:
+            return ""
+        if self.pack.fold_case:
+            text = text.lower()
+        return self._forward_table.translate(text)
+
+    def reverse_transform(self, text: str) -> str:
+        """Transform text in the pack's language back to English.
+
+        Args:
+            text: The text to transform back.
+
+        Returns:
+            The English text.
+        """
+        if not text:
+            return ""
+        if self.pack.fold_case:
+            text = text.lower()
+        return self._reverse_table.translate(text)
+
+    def transform_many(self, texts: Sequence[str]) -> List[str]:
+        """Transform several independent texts with a single table pass.
+
+        Args:
+            texts: The English texts to transform.
+
+        Returns:
+            The transformed texts, in input order.
+        """
+        return self._translate_many(texts, self._forward_table, self.transform)
+
+    def reverse_transform_many(self, texts: Sequence[str]) -> List[str]:
+        """Transform several independent texts back to English with a single table pass.
+
+        Args:
+            texts: The texts in the pack's language.
+
+        Returns:
+            The English texts, in input order.
+        """
+        return self._translate_many(texts, self._reverse_table, self.reverse_transform)
+
+    def _translate_many(self, texts, table, convert) -> List[str]:
+        # The separator is not part of any key, so no digraph or code can
+        # span two texts and the output splits back at the same places
+        if len(texts) < 2 or not self._can_join or any(BATCH_SEPARATOR in text for text in texts):
+            return [convert(text) for text in texts]
+        joined = BATCH_SEPARATOR.join(texts)
+        if self.pack.fold_case:
+            joined = joined.lower()
+        return table.translate(joined).split(BATCH_SEPARATOR)
+
+    def transform_stream(self, chunks: Iterable[str]) -> Iterator[str]:
+        """Transform text arriving in chunks, yielding output as it is ready.
+
+        A digraph split across two chunks is still translated as a digraph.
+
+        Args:
+            chunks: Pieces of English text, in order.
+
+        Yields:
+            Pieces of transformed text.
+        """
+        return self._stream(chunks, self._forward_table)
+
+    def reverse_transform_stream(self, chunks: Iterable[str]) -> Iterator[str]:
+        """Transform text arriving in chunks back to English.
+
+        A code split across two chunks is still decoded as one code.
+
+        Args:
+            chunks: Pieces of text in the pack's language, in order.
+
+        Yields:
+            Pieces of English text.
+        """
+        return self._stream(chunks, self._reverse_table)
+
+    def transform_partial(self, text: str) -> Tuple[str, int]:
+        """Transform the part of a text that more text after it could not change.
+
+        Only the last ``max_key_length - 1`` characters are held back, unless
+        a digraph already spans them.
+
+        Args:
+            text: English text that may continue.
+
+        Returns:
+            The transformation of ``text[:consumed]`` and ``consumed``.
+        """
+        return self._partial(text, self._forward_table, self.transform)
+
+    def reverse_transform_partial(self, text: str) -> Tuple[str, int]:
+        """Transform the part of a text that more text after it could not change, back to English.
+
+        Args:
+            text: Text in the pack's language that may continue.
+
+        Returns:
+            The English text of ``text[:consumed]`` and ``consumed``.
+        """
+        return self._partial(text, self._reverse_table, self.reverse_transform)
+
+    def _partial(self, text: str, table: TranslationTable, convert) -> Tuple[str, int]:
+        if self.pack.fold_case:
+            folded, rest = _fold_settled(text)
+            if len(folded) + len(rest) != len(text):
+                # Offsets into the folded text would not match the original
+                return self._partial_by_words(text, convert)
+            text = folded
+        return table.translate_partial(text)
+
+    def _stream(self, chunks: Iterable[str], table: TranslationTable) -> Iterator[str]:
+        # At most max_key_length - 1 characters are carried between chunks
+        carry = ''
+        # Text of a fold-case pack not yet lowered, in front of the next chunk
+        unfolded = ''
+        for chunk in chunks:
+            if self.pack.fold_case:
+                chunk, unfolded = _fold_settled(unfolded + chunk)
+            buffer = carry + chunk if carry else chunk
+            output, consumed = table.translate_partial(buffer)
+            carry = buffer[consumed:]
+            if output:
+                yield output
+        carry += unfolded.lower()
+        if carry:
+            yield table.translate(carry)
+
@@ -0,0 +1,148 @@
+"""
+Lazy registry of language transformers.
+
+Language names are known up front, but a transformer module is only imported the
+first time its class is requested. Besides the built-in languages, third-party
+packages can provide languages through the ``languagegenvibes.languages`` entry
+point group, e.g. in ``pyproject.toml``::
+
+    [project.entry-points."languagegenvibes.languages"]
+    goblin = "goblin_pack:GoblinTransformer"
+
+The entry point must name a ``BaseTransformer`` subclass. A language defined by a
+pack file can be exposed with ``PackTransformer.for_pack(path)``.
+"""
+
+import importlib
+import logging
+from threading import Lock
+from typing import Callable, Dict, Iterator, Mapping, Optional, Type, Union
+
+from .base import BaseTransformer
+
+logger = logging.getLogger(__name__)
+
+ENTRY_POINT_GROUP = 'languagegenvibes.languages'
+
+# Built-in languages as 'module:ClassName', relative to this package
+BUILTIN_LANGUAGES: Dict[str, str] = {
+    'elvish': '.elvish:ElvishTransformer',
+    'cybernetic': '.cybernetic:CyberneticTransformer',
+    'dwarvish': '.dwarvish:DwarvishTransformer',
+    'insectoid': '.insectoid:InsectoidTransformer',
+    'celestial': '.celestial:CelestialTransformer',
+    'necrotic': '.necrotic:NecroticTransformer',
+}
+
+TransformerSpec = Union[str, Type[BaseTransformer], Callable[[], Type[BaseTransformer]]]
+
+
+def _iter_entry_points():
+    """Yield the entry points registered for language transformers."""
+    # Imported here since it is slow to import and only needed to list languages
+    from importlib import metadata
+
+    entry_points = metadata.entry_points()
+    if hasattr(entry_points, 'select'):
+        return entry_points.select(group=ENTRY_POINT_GROUP)
+    # Python < 3.10 returns a dict of groups
+    return entry_points.get(ENTRY_POINT_GROUP, [])
+
+
+class LanguageRegistry(Mapping[str, Type[BaseTransformer]]):
+    """Read-only mapping of language names to transformer classes, resolved lazily.
+
+    Looking up a built-in or explicitly registered language never scans entry
+    points. Listing languages scans them once and remembers the result.
+    """
+
+    def __init__(self, builtins: Mapping[str, TransformerSpec]):
+        """Initialize the registry.
+
+        Args:
+            builtins: Language names mapped to a ``'module:Class'`` string, a
+                transformer class, or a callable returning one.
+        """
+        self._specs: Dict[str, TransformerSpec] = dict(builtins)
+        self._resolved: Dict[str, Type[BaseTransformer]] = {}
+        self._entry_points_loaded = False
+        self._lock = Lock()
+
+    def register(self, name: str, spec: TransformerSpec) -> None:
+        """Register a language, replacing any language of the same name.
+
+        Args:
+            name: Language name.
+            spec: A ``'module:Class'`` string, a transformer class, or a callable
+                returning one.
+        """
+        name = name.lower()
+        with self._lock:
+            self._specs[name] = spec
+            self._resolved.pop(name, None)
+
+    def _load_entry_points(self) -> None:
+        if self._entry_points_loaded:
+            return
+        with self._lock:
+            if self._entry_points_loaded:
+                return
+            try:
+                for entry_point in _iter_entry_points():
+                    # Built-in and explicitly registered languages take precedence
+                    self._specs.setdefault(entry_point.name.lower(), entry_point.load)
+            except Exception as e:
+                logger.warning("Could not scan language entry points: %s", e)
+            self._entry_points_loaded = True
+
+    def _resolve(self, spec: TransformerSpec) -> Type[BaseTransformer]:
+        if isinstance(spec, str):
+            module_name, _, attribute = spec.partition(':')
+            module = importlib.import_module(module_name, package=__package__)
+            return getattr(module, attribute)
+        if isinstance(spec, type):
+            return spec
+        return spec()
+
+    def _spec(self, name: str) -> Optional[TransformerSpec]:
+        spec = self._specs.get(name)
+        if spec is None and not self._entry_points_loaded:
+            self._load_entry_points()
+            spec = self._specs.get(name)
+        return spec
+
+    def __getitem__(self, name: str) -> Type[BaseTransformer]:
+        resolved = self._resolved.get(name)
+        if resolved is not None:
+            return resolved
+
+        spec = self._spec(name)
+        if spec is None:
+            raise KeyError(name)
+        transformer_class = self._resolve(spec)
+        if not (isinstance(transformer_class, type) and issubclass(transformer_class, BaseTransformer)):
+            raise TypeError(f"Language '{name}' does not provide a BaseTransformer subclass")
+        self._resolved[name] = transformer_class
+        return transformer_class
+
+    def __contains__(self, name: object) -> bool:
+        return isinstance(name, str) and self._spec(name) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        self._load_entry_points()
+        return iter(list(self._specs))
+
+    def __len__(self) -> int:
+        self._load_entry_points()
+        return len(self._specs)
+
+    def is_loaded(self, name: str) -> bool:
+        """Check whether a language's transformer class has been imported.
+
+        Args:
+            name: Language name.
+
+        Returns:
+            True if the class has already been resolved.
+        """
+        return name in self._resolved
@@ -0,0 +1,110 @@
+"""
+Optional NumPy backend for single-character translation tables.
+
+Text is viewed as an array of UCS-4 codepoints and every codepoint is mapped
+through a lookup table in one vectorized operation. When each character maps to
+exactly one character the lookup is the whole translation. When replacements
+vary in length, a cumulative sum of the replacement lengths gives each input
+character's output offset, and the output is gathered from a flat array of all
+replacements.
+
+NumPy is not a dependency. ``VectorTable.build`` returns None when NumPy is
+missing, and ``TranslationTable`` only calls in here for large inputs of
+fixed-width tables. The variable-width gather measured slower than
+``str.translate`` on large inputs, so it is only used when called directly.
+"""
+
+from typing import List, Mapping, Optional, Union
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+
+_ENCODING = 'utf-32-le' if np is None or np.little_endian else 'utf-32-be'
+# Lone surrogates survive the trip through UTF-32
+_ERRORS = 'surrogatepass'
+
+
+class VectorTable:
+    """A dense codepoint lookup table applied to whole arrays of text."""
+
+    def __init__(self, table: List[Union[int, str]]):
+        """Build the lookup arrays.
+
+        Args:
+            table: A dense ``str.translate`` table: index is the codepoint, the
+                value a codepoint or a replacement string.
+        """
+        size = len(table)
+        self.size = size
+        lengths = np.ones(size + 1, dtype=np.int64)
+        for codepoint, value in enumerate(table):
+            if isinstance(value, str):
+                lengths[codepoint] = len(value)
+        self.fixed_width = bool((lengths == 1).all())
+
+        if self.fixed_width:
+            self._lookup = np.array(
+                [value if isinstance(value, int) else ord(value) for value in table] + [0],
+                dtype=np.uint32,
+            )
+            return
+
+        # Every replacement laid end to end; index ``size`` is a one-character
+        # placeholder for codepoints beyond the table, filled in afterwards
+        pieces = [
+            np.array([value], dtype=np.uint32) if isinstance(value, int)
+            else np.frombuffer(value.encode(_ENCODING, _ERRORS), dtype=np.uint32)
+            for value in table
+        ]
+        pieces.append(np.zeros(1, dtype=np.uint32))
+        self._flat = np.concatenate(pieces)
+        self._lengths = lengths
+        self._starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+
+    @classmethod
+    def build(cls, table: Union[List, Mapping]) -> Optional['VectorTable']:
+        """Build a vector table if NumPy is installed and the table is dense.
+
+        Args:
+            table: A ``str.translate`` table.
+
+        Returns:
+            The vector table, or None.
+        """
+        if np is None or not isinstance(table, list):
+            return None
+        return cls(table)
+
+    def translate(self, text: str) -> str:
+        """Translate text.
+
+        Args:
+            text: The text to translate.
+
+        Returns:
+            The same result as ``text.translate(table)``.
+        """
+        codepoints = np.frombuffer(text.encode(_ENCODING, _ERRORS), dtype=np.uint32)
+        outside = codepoints >= self.size
+        has_outside = bool(outside.any())
+        indices = np.minimum(codepoints, self.size) if has_outside else codepoints
+
+        if self.fixed_width:
+            output = self._lookup[indices]
+            if has_outside:
+                output[outside] = codepoints[outside]
+            return output.tobytes().decode(_ENCODING, _ERRORS)
+
+        lengths = self._lengths[indices]
+        ends = np.cumsum(lengths)
+        total = int(ends[-1]) if len(ends) else 0
+        # For each output position, the input character it comes from and its
+        # position within that character's replacement
+        owners = np.repeat(np.arange(len(indices)), lengths)
+        offsets = np.arange(total) - (ends - lengths)[owners]
+        output = self._flat[self._starts[indices][owners] + offsets]
+        if has_outside:
+            output[(ends - 1)[outside]] = codepoints[outside]
+        return output.tobytes().decode(_ENCODING, _ERRORS)
@@ -0,0 +1,196 @@
+"""
+Persistent translation memory in SQLite.
+
+Translations are stored under a content hash of the language, direction,
+language version and text, so a changed language pack never returns stale
+results. The database uses write-ahead logging, so readers in other processes
+are not blocked while a batch job writes.
+"""
+
+import hashlib
+import sqlite3
+from pathlib import Path
+from threading import Lock
+from typing import Iterable, List, Optional, Sequence, Tuple, Union
+
+from .languages.base import BaseTransformer
+from .languages.pack import PackTransformer
+
+SCHEMA_VERSION = 1
+# Stay under SQLite's smallest default limit on query parameters
+MAX_QUERY_PARAMETERS = 999
+_KEY_SIZE = 16
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS translations (
+    key BLOB PRIMARY KEY,
+    translation TEXT NOT NULL
+) WITHOUT ROWID
+"""
+
+
+def language_version(transformer: BaseTransformer) -> str:
+    """Get a string that changes whenever a transformer's output may change.
+
+    Args:
+        transformer: The language's transformer.
+
+    Returns:
+        The pack's version and content hash for pack transformers, otherwise
+        the transformer's class path.
+    """
+    if isinstance(transformer, PackTransformer):
+        return f"{transformer.pack.version}+{transformer.pack.digest}"
+    cls = type(transformer)
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+def memory_key(language: str, reverse: bool, version: str, text: str) -> bytes:
+    """Hash a translation's inputs into its key.
+
+    Args:
+        language: Language name.
+        reverse: Whether the translation is back to English.
+        version: The language's ``language_version``.
+        text: Text to translate.
+
+    Returns:
+        A 16-byte key.
+    """
+    digest = hashlib.blake2b(digest_size=_KEY_SIZE)
+    digest.update(f"{language}\x00{int(reverse)}\x00{version}\x00".encode('utf-8'))
+    digest.update(text.encode('utf-8', 'surrogatepass'))
+    return digest.digest()
+
+
+def _storable(translation: str) -> Union[str, bytes]:
+    """Convert a translation SQLite cannot store as text into bytes.
+
+    SQLite text must be valid UTF-8, so a translation containing a lone
+    surrogate is stored as a blob of its ``surrogatepass`` encoding instead.
+    """
+    try:
+        translation.encode('utf-8')
+    except UnicodeEncodeError:
+        return translation.encode('utf-8', 'surrogatepass')
+    return translation
+
+
+class TranslationMemory:
+    """On-disk store of translations shared across processes and runs."""
+
+    def __init__(self, path: Union[str, Path]):
+        """Open or create the database.
+
+        Args:
+            path: Database file.
+        """
+        self.path = Path(path)
+        self._connection = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._lock = Lock()
+        with self._lock:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            # WAL stays consistent after a crash; only the last commits may be lost
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.execute(_SCHEMA)
+            self._connection.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+
+    def __enter__(self) -> 'TranslationMemory':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            self._connection.close()
+
+    def get(self, language: str, reverse: bool, version: str, text: str) -> Optional[str]:
+        """Look up one translation.
+
+        Args:
+            language: Language name.
+            reverse: Whether the translation is back to English.
+            version: The language's ``language_version``.
+            text: Text that was translated.
+
+        Returns:
+            The stored translation, or None.
+        """
+        return self.get_many(language, reverse, version, [text])[0]
+
+    def put(self, language: str, reverse: bool, version: str, text: str, translation: str) -> None:
+        """Store one translation.
+
+        Args:
+            language: Language name.
+            reverse: Whether the translation is back to English.
+            version: The language's ``language_version``.
+            text: Text that was translated.
+            translation: Its translation.
+        """
+        self.put_many(language, reverse, version, [(text, translation)])
+
+    def get_many(self, language: str, reverse: bool, version: str, texts: Sequence[str]) -> List[Optional[str]]:
+        """Look up many translations in one read transaction.
+
+        Args:
+            language: Language name.
+            reverse: Whether the translations are back to English.
+            version: The language's ``language_version``.
+            texts: Texts that were translated.
+
+        Returns:
+            The stored translation for each text, or None where there is none.
+        """
+        keys = [memory_key(language, reverse, version, text) for text in texts]
+        found = {}
+        with self._lock:
+            self._connection.execute("BEGIN")
+            try:
+                for start in range(0, len(keys), MAX_QUERY_PARAMETERS):
+                    chunk = keys[start:start + MAX_QUERY_PARAMETERS]
+                    placeholders = ','.join('?' * len(chunk))
+                    found.update(self._connection.execute(
+                        f"SELECT key, translation FROM translations WHERE key IN ({placeholders})", chunk
+                    ))
+            finally:
+                self._connection.execute("COMMIT")
+        return [
+            translation.decode('utf-8', 'surrogatepass') if isinstance(translation, bytes) else translation
+            for translation in map(found.get, keys)
+        ]
+
+    def put_many(
+        self,
+        language: str,
+        reverse: bool,
+        version: str,
+        pairs: Iterable[Tuple[str, str]],
+    ) -> None:
+        """Store many translations in one write transaction.
+
+        Args:
+            language: Language name.
+            reverse: Whether the translations are back to English.
+            version: The language's ``language_version``.
+            pairs: ``(text, translation)`` pairs.
+        """
+        rows = [(memory_key(language, reverse, version, text), translation) for text, translation in pairs]
+        if not rows:
+            return
+        try:
+            self._insert(rows)
+        except UnicodeEncodeError:
+            # The batch was rolled back; store it again with the unencodable translations as bytes
+            self._insert([(key, _storable(translation)) for key, translation in rows])
+
+    def _insert(self, rows: List[Tuple[bytes, Union[str, bytes]]]) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("BEGIN IMMEDIATE")
+            self._connection.executemany("INSERT OR REPLACE INTO translations VALUES (?, ?)", rows)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM translations").fetchone()[0]
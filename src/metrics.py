@@ -0,0 +1,319 @@
+"""
+In-process metrics with Prometheus text export.
+
+Metrics are disabled by default. Instrumented code checks ``REGISTRY.enabled``
+before measuring anything, so a disabled registry costs one attribute lookup
+per call. Enable it with ``REGISTRY.enable()`` or by setting the
+``LANGGEN_METRICS`` environment variable to ``1``.
+
+The registry renders the Prometheus text exposition format. It can be written
+to a file, e.g. for the node exporter's textfile collector, or served over HTTP
+with ``start_http_server``.
+"""
+
+import os
+import threading
+from bisect import bisect_left
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple, Union
+
+if TYPE_CHECKING:
+    from http.server import ThreadingHTTPServer
+
+METRICS_ENV_VAR = 'LANGGEN_METRICS'
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+# Seconds; translations range from microseconds for short texts to seconds for documents
+LATENCY_BUCKETS = (
+    0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005,
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(names: Sequence[str], values: LabelValues, extra: str = '') -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    """A named metric with a fixed set of label names."""
+
+    kind = ''
+
+    def __init__(self, registry: 'MetricsRegistry', name: str, documentation: str, labelnames: Sequence[str]):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = registry._lock
+
+    def _header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(_Metric):
+    """A monotonically increasing count per label combination."""
+
+    kind = 'counter'
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, *labelvalues: str, amount: float = 1) -> None:
+        """Add to the count for a label combination.
+
+        Args:
+            labelvalues: One value per label name, in order.
+            amount: Amount to add.
+        """
+        with self._lock:
+            self._values[labelvalues] = self._values.get(labelvalues, 0) + amount
+
+    def value(self, *labelvalues: str) -> float:
+        """Get the count for a label combination."""
+        return self._values.get(labelvalues, 0)
+
+    def _render(self) -> List[str]:
+        lines = self._header()
+        for labelvalues, value in sorted(self._values.items()):
+            lines.append(f"{self.name}{_format_labels(self.labelnames, labelvalues)} {_format_value(value)}")
+        return lines
+
+    def _reset(self) -> None:
+        self._values.clear()
+
+
+class Histogram(_Metric):
+    """Observations counted into cumulative buckets per label combination."""
+
+    kind = 'histogram'
+
+    def __init__(self, *args, buckets: Sequence[float] = LATENCY_BUCKETS):
+        super().__init__(*args)
+        self.buckets = tuple(sorted(buckets))
+        # Per label combination: a count per bucket plus one for +Inf, and the sum
+        self._values: Dict[LabelValues, Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, *labelvalues: str) -> None:
+        """Record an observation.
+
+        Args:
+            value: The observed value.
+            labelvalues: One value per label name, in order.
+        """
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            entry = self._values.get(labelvalues)
+            if entry is None:
+                entry = self._values[labelvalues] = ([0] * (len(self.buckets) + 1), [0.0])
+            entry[0][index] += 1
+            entry[1][0] += value
+
+    def count(self, *labelvalues: str) -> int:
+        """Get the number of observations for a label combination."""
+        entry = self._values.get(labelvalues)
+        return sum(entry[0]) if entry else 0
+
+    def _render(self) -> List[str]:
+        lines = self._header()
+        for labelvalues, (counts, total) in sorted(self._values.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += count
+                labels = _format_labels(self.labelnames, labelvalues, f'le="{_format_value(bound)}"')
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, labelvalues)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total[0])}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+    def _reset(self) -> None:
+        self._values.clear()
+
+
+class MetricsRegistry:
+    """A set of metrics that can be switched on and off and exported together."""
+
+    def __init__(self, enabled: bool = False):
+        """Initialize an empty registry.
+
+        Args:
+            enabled: Whether instrumented code should record metrics.
+        """
+        self.enabled = enabled
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def enable(self) -> None:
+        """Start recording metrics."""
+        self.enabled = True
+
+    def disable(self) -> None:
+        """Stop recording metrics. Recorded values are kept."""
+        self.enabled = False
+
+    def _add(self, metric: _Metric) -> _Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric already registered: {metric.name}")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        """Create and register a counter."""
+        return self._add(Counter(self, name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> Histogram:
+        """Create and register a histogram."""
+        return self._add(Histogram(self, name, documentation, labelnames, buckets=buckets))
+
+    def reset(self) -> None:
+        """Clear every recorded value."""
+        with self._lock:
+            for metric in self._metrics.values():
+                metric._reset()
+
+    def render(self) -> str:
+        """Render every metric in the Prometheus text exposition format.
+
+        Returns:
+            The exposition text.
+        """
+        with self._lock:
+            lines = [line for metric in self._metrics.values() for line in metric._render()]
+        return '\n'.join(lines) + '\n'
+
+    def write_file(self, path: Union[str, Path]) -> None:
+        """Write the metrics to a file, replacing it atomically.
+
+        Args:
+            path: Output path, e.g. ``translations.prom`` in a textfile
+                collector directory.
+        """
+        import tempfile
+
+        path = Path(path)
+        fd, temporary = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(self.render())
+            os.replace(temporary, path)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+
+
+def start_http_server(
+    port: int,
+    host: str = '127.0.0.1',
+    registry: Optional['MetricsRegistry'] = None,
+) -> 'ThreadingHTTPServer':
+    """Serve metrics at ``/metrics`` from a background thread.
+
+    Args:
+        port: Port to listen on; 0 picks a free port.
+        host: Address to listen on.
+        registry: Registry to serve; defaults to ``REGISTRY``.
+
+    Returns:
+        The running server; call ``shutdown()`` to stop it.
+    """
+    # Imported here since only processes serving metrics need an HTTP server
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    registry = registry or REGISTRY
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            if self.path.split('?', 1)[0] != '/metrics':
+                self.send_error(404)
+                return
+            body = registry.render().encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', CONTENT_TYPE)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args) -> None:
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name='metrics-http', daemon=True).start()
+    return server
+
+
+REGISTRY = MetricsRegistry(enabled=os.environ.get(METRICS_ENV_VAR, '') not in ('', '0'))
+
+TRANSLATIONS = REGISTRY.counter(
+    'langgen_translations_total', 'Texts translated.', ('language', 'direction'))
+TRANSLATION_ERRORS = REGISTRY.counter(
+    'langgen_translation_errors_total', 'Translation requests that failed.', ('language', 'direction'))
+BYTES_IN = REGISTRY.counter(
+    'langgen_translation_input_bytes_total', 'UTF-8 bytes of text translated.', ('language', 'direction'))
+BYTES_OUT = REGISTRY.counter(
+    'langgen_translation_output_bytes_total', 'UTF-8 bytes of translations produced.', ('language', 'direction'))
+LATENCY = REGISTRY.histogram(
+    'langgen_translation_duration_seconds', 'Time to translate one text.', ('language', 'direction'))
+BATCH_LATENCY = REGISTRY.histogram(
+    'langgen_batch_duration_seconds', 'Time to translate one batch of texts.', ('language', 'direction'))
+CACHE_LOOKUPS = REGISTRY.counter(
+    'langgen_cache_lookups_total', 'Translation cache lookups.', ('result',))
+
+
+def utf8_length(text: str) -> int:
+    """Count the UTF-8 bytes of a text, without encoding ASCII text."""
+    if text.isascii():
+        return len(text)
+    return len(text.encode('utf-8', 'surrogatepass'))
+
+
+def direction(reverse: bool) -> str:
+    """Get the ``direction`` label value."""
+    return 'reverse' if reverse else 'forward'
+
+
+def record_translation(
+    language: str,
+    reverse: bool,
+    texts: Sequence[str],
+    results: Sequence[str],
+    seconds: float,
+    batch: bool = False,
+) -> None:
+    """Record a finished translation of one or more texts.
+
+    Args:
+        language: Language name.
+        reverse: Whether the translation was back to English.
+        texts: The inputs.
+        results: The translations.
+        seconds: Time taken for all of them.
+        batch: Whether the texts were translated as one batch.
+    """
+    labels = (language, direction(reverse))
+    TRANSLATIONS.inc(*labels, amount=len(texts))
+    BYTES_IN.inc(*labels, amount=sum(map(utf8_length, texts)))
+    BYTES_OUT.inc(*labels, amount=sum(map(utf8_length, results)))
+    (BATCH_LATENCY if batch else LATENCY).observe(seconds, *labels)
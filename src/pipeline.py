@@ -0,0 +1,187 @@
+"""
+Chunked file and pipe translation.
+
+Input files are memory-mapped and decoded chunk by chunk, so a multi-gigabyte
+file never has to fit in one string. Pipes are read in large blocks instead.
+Output is written as plain UTF-8 through a large write buffer.
+"""
+
+import codecs
+import mmap
+import os
+import re
+import sys
+from contextlib import contextmanager
+from typing import BinaryIO, Callable, Iterable, Iterator, Optional, Tuple, Union
+
+DEFAULT_CHUNK_SIZE = 4 * 1024 * 1024
+DEFAULT_WRITE_BUFFER = 4 * 1024 * 1024
+ENCODING = 'utf-8'
+# Undecodable bytes survive a round trip through the pipeline unchanged
+ERRORS = 'surrogateescape'
+
+# The last run of ASCII whitespace, where a long line can be cut
+_LAST_SPACE = re.compile(r'.*[ \t\n\r\f\v]', re.DOTALL)
+
+PathOrStream = Union[str, os.PathLike, BinaryIO]
+StreamConverter = Callable[[Iterable[str]], Iterator[str]]
+
+
+def _decode_blocks(blocks: Iterable[bytes]) -> Iterator[str]:
+    """Decode byte blocks, carrying partial multi-byte characters over."""
+    decoder = codecs.getincrementaldecoder(ENCODING)(errors=ERRORS)
+    for block in blocks:
+        text = decoder.decode(block)
+        if text:
+            yield text
+    text = decoder.decode(b'', final=True)
+    if text:
+        yield text
+
+
+def _read_blocks(stream: BinaryIO, chunk_size: int) -> Iterator[bytes]:
+    while True:
+        block = stream.read(chunk_size)
+        if not block:
+            return
+        yield block
+
+
+def _mapped_blocks(mapped: mmap.mmap, chunk_size: int) -> Iterator[bytes]:
+    for offset in range(0, len(mapped), chunk_size):
+        yield mapped[offset:offset + chunk_size]
+
+
+def read_chunks(source: PathOrStream, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[str]:
+    """Read text in chunks from a file path, ``'-'`` for stdin, or a binary stream.
+
+    Regular files are memory-mapped; anything else is read in blocks.
+
+    Args:
+        source: Path to read, ``'-'`` for standard input, or an open binary stream.
+        chunk_size: Number of bytes decoded at a time.
+
+    Yields:
+        Decoded text chunks.
+    """
+    if source == '-':
+        source = sys.stdin.buffer
+    if not isinstance(source, (str, os.PathLike)):
+        yield from _decode_blocks(_read_blocks(source, chunk_size))
+        return
+
+    with open(source, 'rb') as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            # Empty files and special files cannot be mapped
+            yield from _decode_blocks(_read_blocks(f, chunk_size))
+            return
+        with mapped:
+            if hasattr(mapped, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+                mapped.madvise(mmap.MADV_SEQUENTIAL)
+            yield from _decode_blocks(_mapped_blocks(mapped, chunk_size))
+
+
+@contextmanager
+def _open_output(destination: PathOrStream, buffer_size: int):
+    if destination == '-':
+        # Bypass sys.stdout's text layer and its small buffer
+        stream = open(sys.stdout.fileno(), 'wb', buffering=buffer_size, closefd=False)
+    elif isinstance(destination, (str, os.PathLike)):
+        stream = open(destination, 'wb', buffering=buffer_size)
+    else:
+        yield destination
+        return
+    with stream:
+        yield stream
+
+
+def write_chunks(
+    chunks: Iterable[str],
+    destination: PathOrStream,
+    buffer_size: int = DEFAULT_WRITE_BUFFER,
+) -> int:
+    """Write text chunks as UTF-8 to a file path, ``'-'`` for stdout, or a binary stream.
+
+    Args:
+        chunks: Text to write, in order.
+        destination: Path to write, ``'-'`` for standard output, or an open binary
+            stream.
+        buffer_size: Size of the write buffer for paths and stdout.
+
+    Returns:
+        The number of bytes written.
+    """
+    written = 0
+    with _open_output(destination, buffer_size) as stream:
+        for chunk in chunks:
+            data = chunk.encode(ENCODING, ERRORS)
+            stream.write(data)
+            written += len(data)
+        stream.flush()
+    return written
+
+
+def line_blocks(chunks: Iterable[str], size: Optional[int] = None) -> Iterator[str]:
+    """Regroup text chunks so that every block ends with a complete line.
+
+    With a ``size``, a line longer than that is not buffered whole: it is cut
+    after the last ASCII whitespace within ``size`` characters, where no key of
+    a splittable language can span the cut, or at ``size`` characters if the
+    line has no whitespace there. A key may span a cut within a line, so
+    translate such blocks with ``transform_partial`` and carry the rest over.
+
+    Args:
+        chunks: Text in arbitrary pieces, in order.
+        size: Most characters held back waiting for the end of a line.
+
+    Yields:
+        The same text in blocks that each end with a newline, except possibly
+        the last one and lines cut at ``size``.
+    """
+    carry = ''
+    for chunk in chunks:
+        buffer = carry + chunk if carry else chunk
+        end = buffer.rfind('\n') + 1
+        if end:
+            yield buffer[:end]
+        while size is not None and len(buffer) - end > size:
+            match = _LAST_SPACE.search(buffer, end, end + size)
+            cut = match.end() if match else end + size
+            yield buffer[end:cut]
+            end = cut
+        carry = buffer[end:]
+    if carry:
+        yield carry
+
+
+def translate_file(
+    source: PathOrStream,
+    destination: PathOrStream,
+    convert: StreamConverter,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    buffer_size: int = DEFAULT_WRITE_BUFFER,
+) -> Tuple[int, int]:
+    """Translate a file or pipe to another file or pipe in bounded memory.
+
+    Args:
+        source: Path to read, ``'-'`` for standard input, or a binary stream.
+        destination: Path to write, ``'-'`` for standard output, or a binary stream.
+        convert: A streaming conversion such as ``transformer.transform_stream``.
+        chunk_size: Number of input bytes decoded at a time.
+        buffer_size: Size of the write buffer.
+
+    Returns:
+        The number of characters read and the number of bytes written.
+    """
+    characters_read = 0
+
+    def counted(chunks: Iterator[str]) -> Iterator[str]:
+        nonlocal characters_read
+        for chunk in chunks:
+            characters_read += len(chunk)
+            yield chunk
+
+    written = write_chunks(convert(counted(read_chunks(source, chunk_size))), destination, buffer_size)
+    return characters_read, written
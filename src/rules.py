@@ -0,0 +1,22 @@
+"""
+Translation rule models.
+
+This module imports pydantic, so it is only loaded when ``TranslationRule`` is
+first used.
+"""
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class TranslationRule(BaseModel):
+    """A rule for translating words or phrases.
+    
+    Attributes:
+        english: The English word or phrase
+        translation: The corresponding translation
+        context: Optional context where this translation applies
+    """
+    english: str
+    translation: str
+    context: Optional[str] = None
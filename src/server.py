@@ -0,0 +1,480 @@
+"""
+Asyncio HTTP translation service.
+
+A small HTTP/1.1 server built on the standard library. It exposes:
+
+* ``GET /health``: ``{"status": "ok"}``
+* ``GET /languages``: ``{"languages": [...]}``
+* ``POST /translate``: ``{"text": ..., "language": ...}`` to ``{"translation": ...}``
+* ``POST /reverse``: the same, translating back to English
+* ``GET /metrics``: metrics in the Prometheus text format, when enabled
+
+Small requests that arrive close together for the same language and direction
+are micro-batched: they wait up to ``max_batch_delay`` seconds and are then
+translated together with a single engine call. Large payloads, and batches that
+add up to a large payload, are translated in a process pool so the event loop
+never blocks on them. Large request bodies are decoded, and large responses
+encoded, in the same pool.
+"""
+
+import asyncio
+import json
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from http import HTTPStatus
+from time import perf_counter
+from typing import Callable, Dict, List, Optional, Tuple, TypeVar, Union
+
+from .batch import default_workers, translate_texts
+from .languages import LANGUAGE_TRANSFORMERS
+from .languages.base import BaseTransformer
+from .metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE
+from .metrics import REGISTRY, TRANSLATION_ERRORS, direction, record_translation
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8080
+DEFAULT_MAX_BATCH_DELAY = 0.002
+DEFAULT_MAX_BATCH_SIZE = 256
+# Payloads of at least this many characters are translated in the process pool
+DEFAULT_OFFLOAD_CHARS = 64 * 1024
+DEFAULT_MAX_BODY_SIZE = 64 * 1024 * 1024
+MAX_HEADER_COUNT = 100
+
+BatchKey = Tuple[str, bool]
+T = TypeVar('T')
+JSON_CONTENT_TYPE = 'application/json; charset=utf-8'
+
+
+class HTTPError(Exception):
+    """An error reported to the client with an HTTP status code."""
+
+    def __init__(self, status: HTTPStatus, message: Optional[str] = None):
+        super().__init__(message or status.phrase)
+        self.status = status
+        self.message = message or status.phrase
+
+
+def _load_request(body: bytes) -> Tuple[str, str]:
+    """Parse a translation request body into its text and language.
+
+    Raises:
+        ValueError: Describing what is wrong with the request.
+    """
+    try:
+        request = json.loads(body)
+    except ValueError:
+        raise ValueError("Request body must be JSON")
+    if not isinstance(request, dict):
+        raise ValueError("Request body must be a JSON object")
+    text, language = request.get('text'), request.get('language')
+    if not isinstance(text, str) or not isinstance(language, str):
+        raise ValueError("'text' and 'language' must be strings")
+    return text, language
+
+
+def _dump_json(payload: dict) -> bytes:
+    """Encode a response payload as UTF-8 JSON."""
+    return json.dumps(payload, ensure_ascii=False).encode('utf-8')
+
+
+class _Batch:
+    """Requests waiting to be translated together."""
+
+    __slots__ = ('texts', 'futures', 'chars', 'timer')
+
+    def __init__(self):
+        self.texts: List[str] = []
+        self.futures: List[asyncio.Future] = []
+        self.chars = 0
+        self.timer: Optional[asyncio.TimerHandle] = None
+
+
+class MicroBatcher:
+    """Collects concurrent translation requests into one engine call per language.
+
+    Must be used from a single event loop.
+    """
+
+    def __init__(
+        self,
+        max_batch_delay: float = DEFAULT_MAX_BATCH_DELAY,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        offload_chars: int = DEFAULT_OFFLOAD_CHARS,
+        workers: Optional[int] = None,
+    ):
+        """Initialize the batcher.
+
+        Args:
+            max_batch_delay: Longest time in seconds a request waits for others
+                to join its batch. Zero still batches requests that arrive in
+                the same event loop iteration.
+            max_batch_size: Number of requests that flushes a batch immediately.
+            offload_chars: Batches of at least this many characters are
+                translated in the process pool.
+            workers: Number of worker processes; defaults to the available CPUs.
+        """
+        if max_batch_delay < 0:
+            raise ValueError("max_batch_delay must not be negative")
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        self.max_batch_delay = max_batch_delay
+        self.max_batch_size = max_batch_size
+        self.offload_chars = offload_chars
+        self.workers = workers if workers is not None else default_workers()
+        self.stats: Dict[str, int] = {'requests': 0, 'batches': 0, 'offloaded': 0}
+        self._transformers: Dict[str, BaseTransformer] = {}
+        self._pending: Dict[BatchKey, _Batch] = {}
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def get_transformer(self, language: str) -> BaseTransformer:
+        """Get the transformer for a language, creating it on first use.
+
+        Raises:
+            ValueError: If the specified language is not supported.
+        """
+        transformer = self._transformers.get(language)
+        if transformer is None:
+            if language not in LANGUAGE_TRANSFORMERS:
+                raise ValueError(f"Unsupported language: {language}")
+            transformer = self._transformers[language] = LANGUAGE_TRANSFORMERS[language]()
+        return transformer
+
+    async def translate(self, text: str, language: str, reverse: bool = False) -> str:
+        """Translate one text, sharing an engine call with concurrent requests.
+
+        Args:
+            text: Text to translate.
+            language: Language name.
+            reverse: Whether to translate from the language back to English.
+
+        Returns:
+            The translation.
+
+        Raises:
+            ValueError: If the specified language is not supported.
+        """
+        language = language.lower()
+        self.get_transformer(language)
+        self.stats['requests'] += 1
+        loop = asyncio.get_running_loop()
+
+        if len(text) >= self.offload_chars:
+            # Too large to hold up a batch; send it straight to the pool
+            self.stats['batches'] += 1
+            return (await self._run_offloaded(language, reverse, [text]))[0]
+
+        key = (language, reverse)
+        batch = self._pending.get(key)
+        if batch is None:
+            batch = self._pending[key] = _Batch()
+            batch.timer = loop.call_later(self.max_batch_delay, self._flush, key, batch)
+        future = loop.create_future()
+        batch.texts.append(text)
+        batch.futures.append(future)
+        batch.chars += len(text)
+        if len(batch.texts) >= self.max_batch_size or batch.chars >= self.offload_chars:
+            self._flush(key, batch)
+        return await future
+
+    def _flush(self, key: BatchKey, batch: _Batch) -> None:
+        # A timer may fire for a batch that was already flushed by size
+        if self._pending.get(key) is not batch:
+            return
+        del self._pending[key]
+        batch.timer.cancel()
+        self.stats['batches'] += 1
+        language, reverse = key
+
+        if batch.chars >= self.offload_chars:
+            task = asyncio.ensure_future(self._run_offloaded(language, reverse, batch.texts))
+            task.add_done_callback(lambda done: self._resolve(batch.futures, done))
+            return
+
+        transformer = self._transformers[language]
+        start = perf_counter()
+        try:
+            if reverse:
+                results = transformer.reverse_transform_many(batch.texts)
+            else:
+                results = transformer.transform_many(batch.texts)
+        except Exception as e:
+            logger.exception("Translation batch failed")
+            if REGISTRY.enabled:
+                TRANSLATION_ERRORS.inc(language, direction(reverse), amount=len(batch.texts))
+            for future in batch.futures:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        if REGISTRY.enabled:
+            record_translation(language, reverse, batch.texts, results, perf_counter() - start, batch=True)
+        for future, result in zip(batch.futures, results):
+            if not future.done():
+                future.set_result(result)
+
+    @staticmethod
+    def _resolve(futures: List[asyncio.Future], done: asyncio.Future) -> None:
+        if done.cancelled() or done.exception() is not None:
+            error = done.exception() if not done.cancelled() else asyncio.CancelledError()
+            for future in futures:
+                if not future.done():
+                    future.set_exception(error)
+            return
+        for future, result in zip(futures, done.result()):
+            if not future.done():
+                future.set_result(result)
+
+    async def run_in_pool(self, function: Callable[..., T], *args) -> T:
+        """Run a picklable function in the process pool, starting the pool on first use.
+
+        Args:
+            function: A module-level function.
+            args: Its arguments.
+
+        Returns:
+            The function's result.
+        """
+        if self._executor is None:
+            # Forked workers would inherit open client sockets and keep them
+            # from closing, so start them fresh
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context('spawn'),
+            )
+        return await asyncio.get_running_loop().run_in_executor(self._executor, function, *args)
+
+    async def _run_offloaded(self, language: str, reverse: bool, texts: List[str]) -> List[str]:
+        self.stats['offloaded'] += 1
+        start = perf_counter()
+        try:
+            results = await self.run_in_pool(translate_texts, language, reverse, texts)
+        except Exception:
+            if REGISTRY.enabled:
+                TRANSLATION_ERRORS.inc(language, direction(reverse), amount=len(texts))
+            raise
+        if REGISTRY.enabled:
+            record_translation(language, reverse, texts, results, perf_counter() - start, batch=True)
+        return results
+
+    def close(self) -> None:
+        """Flush waiting requests and shut down the process pool."""
+        for key, batch in list(self._pending.items()):
+            self._flush(key, batch)
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+
+class TranslationServer:
+    """HTTP front end for a ``MicroBatcher``."""
+
+    def __init__(
+        self,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT,
+        batcher: Optional[MicroBatcher] = None,
+        max_body_size: int = DEFAULT_MAX_BODY_SIZE,
+    ):
+        """Initialize the server.
+
+        Args:
+            host: Address to listen on.
+            port: Port to listen on; 0 picks a free port.
+            batcher: Batcher translating requests; a default one is created
+                when omitted.
+            max_body_size: Largest request body accepted, in bytes.
+        """
+        self.host = host
+        self.port = port
+        self.batcher = batcher or MicroBatcher()
+        self.max_body_size = max_body_size
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self) -> None:
+        """Start listening. ``port`` is updated to the port actually bound."""
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self) -> None:
+        """Start the server if needed and serve until cancelled."""
+        if self._server is None:
+            await self.start()
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.close()
+
+    async def close(self) -> None:
+        """Stop listening and shut down the batcher."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        self.batcher.close()
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            keep_alive = True
+            while keep_alive:
+                body: Optional[bytes] = None
+                try:
+                    request_line = await self._read_line(reader, HTTPStatus.BAD_REQUEST, "Request line too long")
+                    if not request_line:
+                        break
+                    method, path, version, headers = await self._read_head(request_line, reader)
+                    keep_alive = self._keep_alive(version, headers)
+                    body = await self._read_body(headers, reader)
+                    status, payload = await self._dispatch(method, path, body)
+                except HTTPError as e:
+                    status, payload = e.status, {'error': e.message}
+                    if body is None:
+                        # The rest of the request is still unread and would be
+                        # taken for the next request
+                        keep_alive = False
+                except Exception:
+                    logger.exception("Request failed")
+                    status, payload = HTTPStatus.INTERNAL_SERVER_ERROR, {'error': 'Internal Server Error'}
+                    keep_alive = keep_alive and body is not None
+                content, content_type = await self._encode(payload)
+                self._write_response(writer, status, content, content_type, keep_alive)
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    @staticmethod
+    async def _read_line(reader: asyncio.StreamReader, status: HTTPStatus, message: Optional[str] = None) -> bytes:
+        try:
+            return await reader.readline()
+        except ValueError:
+            # The line does not fit in the reader's buffer
+            raise HTTPError(status, message)
+
+    @classmethod
+    async def _read_head(cls, request_line: bytes, reader: asyncio.StreamReader):
+        try:
+            method, path, version = request_line.decode('latin-1').split()
+        except ValueError:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Malformed request line")
+        headers: Dict[str, str] = {}
+        for _ in range(MAX_HEADER_COUNT):
+            line = await cls._read_line(reader, HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE)
+            if line in (b'\r\n', b'\n', b''):
+                return method.upper(), path.split('?', 1)[0], version.upper(), headers
+            name, separator, value = line.decode('latin-1').partition(':')
+            if not separator:
+                raise HTTPError(HTTPStatus.BAD_REQUEST, "Malformed header")
+            headers[name.strip().lower()] = value.strip()
+        raise HTTPError(HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE)
+
+    @staticmethod
+    def _keep_alive(version: str, headers: Dict[str, str]) -> bool:
+        connection = headers.get('connection', '').lower()
+        if version == 'HTTP/1.0':
+            return connection == 'keep-alive'
+        return connection != 'close'
+
+    async def _read_body(self, headers: Dict[str, str], reader: asyncio.StreamReader) -> bytes:
+        if 'transfer-encoding' in headers:
+            raise HTTPError(HTTPStatus.NOT_IMPLEMENTED, "Chunked request bodies are not supported")
+        try:
+            length = int(headers.get('content-length', '0'))
+        except ValueError:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Invalid Content-Length")
+        if length < 0:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Invalid Content-Length")
+        if length > self.max_body_size:
+            raise HTTPError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE)
+        return await reader.readexactly(length) if length else b''
+
+    async def _dispatch(self, method: str, path: str, body: bytes) -> Tuple[HTTPStatus, Union[dict, str]]:
+        if path == '/health':
+            self._require_method(method, 'GET')
+            return HTTPStatus.OK, {'status': 'ok'}
+        if path == '/languages':
+            self._require_method(method, 'GET')
+            return HTTPStatus.OK, {'languages': sorted(LANGUAGE_TRANSFORMERS.keys())}
+        if path == '/metrics':
+            self._require_method(method, 'GET')
+            return HTTPStatus.OK, REGISTRY.render()
+        if path in ('/translate', '/reverse'):
+            self._require_method(method, 'POST')
+            text, language = await self._parse_translation_request(body)
+            try:
+                translation = await self.batcher.translate(text, language, reverse=path == '/reverse')
+            except ValueError as e:
+                raise HTTPError(HTTPStatus.BAD_REQUEST, str(e))
+            return HTTPStatus.OK, {'translation': translation}
+        raise HTTPError(HTTPStatus.NOT_FOUND)
+
+    @staticmethod
+    def _require_method(method: str, allowed: str) -> None:
+        if method != allowed:
+            raise HTTPError(HTTPStatus.METHOD_NOT_ALLOWED)
+
+    async def _parse_translation_request(self, body: bytes) -> Tuple[str, str]:
+        try:
+            if len(body) >= self.batcher.offload_chars:
+                # Decoding a large body would hold up every other connection
+                return await self.batcher.run_in_pool(_load_request, body)
+            return _load_request(body)
+        except ValueError as e:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, str(e))
+
+    async def _encode(self, payload: Union[dict, str]) -> Tuple[bytes, str]:
+        if isinstance(payload, str):
+            return payload.encode('utf-8'), METRICS_CONTENT_TYPE
+        if len(payload.get('translation', '')) >= self.batcher.offload_chars:
+            return await self.batcher.run_in_pool(_dump_json, payload), JSON_CONTENT_TYPE
+        return _dump_json(payload), JSON_CONTENT_TYPE
+
+    @staticmethod
+    def _write_response(
+        writer: asyncio.StreamWriter,
+        status: HTTPStatus,
+        body: bytes,
+        content_type: str,
+        keep_alive: bool,
+    ) -> None:
+        head = (
+            f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+            "\r\n"
+        )
+        writer.write(head.encode('latin-1') + body)
+
+
+def run(
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    max_batch_delay: float = DEFAULT_MAX_BATCH_DELAY,
+    max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+    offload_chars: int = DEFAULT_OFFLOAD_CHARS,
+    workers: Optional[int] = None,
+) -> None:
+    """Run the translation service until interrupted.
+
+    Args:
+        host: Address to listen on.
+        port: Port to listen on.
+        max_batch_delay: Longest time in seconds a request waits to be batched.
+        max_batch_size: Number of requests that flushes a batch immediately.
+        offload_chars: Payloads of at least this many characters are translated
+            in the process pool.
+        workers: Number of worker processes; defaults to the available CPUs.
+    """
+    batcher = MicroBatcher(max_batch_delay, max_batch_size, offload_chars, workers)
+    server = TranslationServer(host, port, batcher)
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
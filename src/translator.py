@@ -1,35 +1,86 @@
 """
 Core translation functionality for converting English to fictional languages.
 """
-from typing import Dict, Optional
-
-from pydantic import BaseModel
+from functools import partial
+from threading import Lock
+from time import perf_counter
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
+from .batch import (
+    MIN_DOCUMENT_CHARS,
+    TranslationPool,
+    can_split_document,
+    default_workers,
+    expansion_ratio,
+    should_parallelize,
+    translate_serial,
+)
+from .cache import TranslationCache
+from .incremental import DocumentTranslation
 from .languages import LANGUAGE_TRANSFORMERS
-
-
-class TranslationRule(BaseModel):
-    """A rule for translating words or phrases.
-    
-    Attributes:
-        english: The English word or phrase
-        translation: The corresponding translation
-        context: Optional context where this translation applies
-    """
-    english: str
-    translation: str
-    context: Optional[str] = None
+from .languages.base import BaseTransformer
+from .languages.detect import AUTO_LANGUAGE, detect_language
+from .languages.engine import SharedScan
+from .languages.pack import PackTransformer
+from .memory import TranslationMemory, language_version
+from .metrics import REGISTRY, TRANSLATION_ERRORS, direction, record_translation
 
 
 class Translator:
     """Main translator class for converting English to fictional languages."""
     
-    def __init__(self):
-        """Initialize the translator with available language transformers."""
-        self.transformers = {
-            name.lower(): transformer_class()
-            for name, transformer_class in LANGUAGE_TRANSFORMERS.items()
-        }
+    def __init__(
+        self,
+        cache: Optional[TranslationCache] = None,
+        memory: Optional[TranslationMemory] = None,
+    ):
+        """Initialize the translator; transformers are created on first use.
+        
+        Args:
+            cache: Optional cache of translate() and reverse_translate() results
+            memory: Optional on-disk translation memory, consulted after the
+                cache and by the batch APIs
+        """
+        self.cache = cache
+        self.memory = memory
+        self.transformers: Dict[str, BaseTransformer] = {}
+        self._pools: Dict[Tuple[str, int], TranslationPool] = {}
+        self._pools_lock = Lock()
+        # translate_all's shared scan for each requested list of languages
+        self._fanouts: Dict[Tuple[str, ...], Tuple] = {}
+
+    def __enter__(self) -> 'Translator':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shut down any worker pools started by the batch APIs."""
+        with self._pools_lock:
+            pools, self._pools = list(self._pools.values()), {}
+        for pool in pools:
+            pool.shutdown()
+
+    def get_transformer(self, language: str) -> BaseTransformer:
+        """Get the transformer for a language, creating it on first use.
+        
+        Args:
+            language: The fictional language name
+            
+        Returns:
+            The language's transformer
+            
+        Raises:
+            ValueError: If the specified language is not supported
+        """
+        language = language.lower()
+        transformer = self.transformers.get(language)
+        if transformer is None:
+            if language not in LANGUAGE_TRANSFORMERS:
+                raise ValueError(f"Unsupported language: {language}")
+            transformer = self.transformers.setdefault(language, LANGUAGE_TRANSFORMERS[language]())
+        return transformer
     
     def translate(self, text: str, language: str) -> str:
         """Translate a full text from English to the specified fictional language.
@@ -44,31 +95,350 @@ class Translator:
         Raises:
             ValueError: If the specified language is not supported
         """
-        language = language.lower()
-        if language not in self.transformers:
-            raise ValueError(f"Unsupported language: {language}")
-            
-        return self.transformers[language].transform(text)
+        if REGISTRY.enabled:
+            return self._measured(self._translate_one, text, language, False)
+        return self._translate_one(text, language, False)
 
-    def reverse_translate(self, text: str, language: str) -> str:
+    def reverse_translate(self, text: str, language: str = AUTO_LANGUAGE) -> str:
         """Convert text from a fictional language back to English.
         
         Args:
             text: The text in the fictional language to convert back
-            language: The source fictional language
+            language: The source fictional language, or ``auto`` to detect it
+                from the start of the text
             
         Returns:
             The original English text
             
+        Raises:
+            ValueError: If the specified language is not supported, or it
+                cannot be detected
+        """
+        if language.lower() == AUTO_LANGUAGE:
+            if not text:
+                return text
+            language = self.detect_language(text)
+        if REGISTRY.enabled:
+            return self._measured(self._translate_one, text, language, True)
+        return self._translate_one(text, language, True)
+
+    def detect_language(self, text: str) -> str:
+        """Detect which fictional language a text is written in.
+        
+        Only a bounded prefix of the text is examined, against an index of
+        every language's alphabet and codes, so no language has to decode it.
+        
+        Args:
+            text: The text in an unknown fictional language
+            
+        Returns:
+            The detected language name
+            
+        Raises:
+            ValueError: If the text matches none of the languages
+        """
+        language = detect_language(text)
+        if language is None:
+            raise ValueError("Could not detect the language of the text")
+        return language
+
+    def _measured(self, translate: Callable, texts, language: str, reverse: bool, *args):
+        """Call a translation method, recording metrics about it."""
+        name = language.lower()
+        if not isinstance(texts, (str, Sequence)):
+            texts = list(texts)
+        start = perf_counter()
+        try:
+            result = translate(texts, language, reverse, *args)
+        except Exception:
+            # Keep arbitrary language names out of the label values
+            TRANSLATION_ERRORS.inc(name if name in LANGUAGE_TRANSFORMERS else 'unknown', direction(reverse))
+            raise
+        if isinstance(texts, str):
+            record_translation(name, reverse, (texts,), (result,), perf_counter() - start)
+        else:
+            record_translation(name, reverse, texts, result, perf_counter() - start, batch=True)
+        return result
+
+    def _translate_one(self, text: str, language: str, reverse: bool) -> str:
+        transformer = self.get_transformer(language)
+        language = language.lower()
+        convert = transformer.reverse_transform if reverse else transformer.transform
+        if self.memory is not None:
+            convert = partial(self._translate_remembered, language, reverse, transformer, convert)
+        if self.cache is None:
+            return convert(text)
+        return self.cache.get_or_translate(language, reverse, text, convert)
+
+    def _translate_remembered(
+        self,
+        language: str,
+        reverse: bool,
+        transformer: BaseTransformer,
+        convert: Callable[[str], str],
+        text: str,
+    ) -> str:
+        version = language_version(transformer)
+        translation = self.memory.get(language, reverse, version, text)
+        if translation is None:
+            translation = convert(text)
+            self.memory.put(language, reverse, version, text, translation)
+        return translation
+
+    def translate_all(self, text: str, languages: Optional[Iterable[str]] = None) -> Dict[str, str]:
+        """Translate one English text into several languages at once.
+        
+        Long text whose words repeat, as in prose, is split into words and each
+        distinct word is translated only once for all languages, which costs
+        much less than translating the text once per language. Long text whose
+        words hardly repeat costs about the same as separate translations.
+        Short text is scanned once for the digraphs of every language, which
+        saves each language's own scan. The languages are prepared on the
+        first call for each list of languages. The cache and the translation
+        memory are not used.
+        
+        Args:
+            text: The English text to translate
+            languages: The target fictional languages; defaults to all of them
+            
+        Returns:
+            The translations, keyed by language name
+            
+        Raises:
+            ValueError: If one of the languages is not supported
+        """
+        if languages is None:
+            languages = sorted(LANGUAGE_TRANSFORMERS)
+        requested = tuple(languages)
+        fanout = self._fanouts.get(requested)
+        if fanout is None:
+            fanout = self._fanouts.setdefault(requested, self._fanout(requested))
+        languages, packs, scan, others = fanout
+        results = dict(zip(packs, scan.translate(text))) if scan is not None else {}
+        if others:
+            for language, transformer in others:
+                results[language] = transformer.transform(text)
+            results = {language: results[language] for language in languages}
+        return results
+
+    def _fanout(self, languages: Tuple[str, ...]) -> Tuple:
+        """Prepare translate_all for a list of languages.
+
+        Returns:
+            The distinct language names, the names of those defined by packs,
+            the shared scan of the packs, and the other languages with their
+            transformers.
+        """
+        languages = tuple(dict.fromkeys(language.lower() for language in languages))
+        transformers = [self.get_transformer(language) for language in languages]
+        packs = [(language, t) for language, t in zip(languages, transformers) if isinstance(t, PackTransformer)]
+        others = [(language, t) for language, t in zip(languages, transformers) if not isinstance(t, PackTransformer)]
+        scan = SharedScan(
+            [transformer.pack.forward_table for _, transformer in packs],
+            [transformer.pack.fold_case for _, transformer in packs],
+        ) if packs else None
+        return languages, tuple(language for language, _ in packs), scan, others
+
+    def translate_stream(self, chunks: Iterable[str], language: str) -> Iterator[str]:
+        """Translate English text arriving in chunks, with bounded memory.
+        
+        Args:
+            chunks: Pieces of English text, in order
+            language: The target fictional language
+            
+        Returns:
+            An iterator over pieces of translated text
+            
+        Raises:
+            ValueError: If the specified language is not supported
+        """
+        return self.get_transformer(language).transform_stream(chunks)
+
+    def reverse_translate_stream(self, chunks: Iterable[str], language: str) -> Iterator[str]:
+        """Convert fictional text arriving in chunks back to English.
+        
+        Args:
+            chunks: Pieces of text in the fictional language, in order
+            language: The source fictional language
+            
+        Returns:
+            An iterator over pieces of English text
+            
+        Raises:
+            ValueError: If the specified language is not supported
+        """
+        return self.get_transformer(language).reverse_transform_stream(chunks)
+
+    def translate_many(
+        self,
+        texts: Iterable[str],
+        language: str,
+        workers: Optional[int] = None,
+        chunksize: Optional[int] = None,
+    ) -> List[str]:
+        """Translate many English texts, spreading large batches over processes.
+        
+        Worker processes load the language once and are kept for later calls
+        until close() is called. Small batches are translated in this process.
+        
+        Args:
+            texts: The English texts to translate
+            language: The target fictional language
+            workers: Number of worker processes; defaults to the available CPUs
+            chunksize: Texts sent to a worker per task; chosen automatically
+                when omitted
+            
+        Returns:
+            The translated texts, in input order
+            
+        Raises:
+            ValueError: If the specified language is not supported
+        """
+        if REGISTRY.enabled:
+            return self._measured(self._translate_many, texts, language, False, workers, chunksize)
+        return self._translate_many(texts, language, False, workers, chunksize)
+
+    def reverse_translate_many(
+        self,
+        texts: Iterable[str],
+        language: str,
+        workers: Optional[int] = None,
+        chunksize: Optional[int] = None,
+    ) -> List[str]:
+        """Convert many fictional texts back to English, spreading large batches over processes.
+        
+        Args:
+            texts: The texts in the fictional language
+            language: The source fictional language
+            workers: Number of worker processes; defaults to the available CPUs
+            chunksize: Texts sent to a worker per task; chosen automatically
+                when omitted
+            
+        Returns:
+            The English texts, in input order
+            
         Raises:
             ValueError: If the specified language is not supported
         """
+        if REGISTRY.enabled:
+            return self._measured(self._translate_many, texts, language, True, workers, chunksize)
+        return self._translate_many(texts, language, True, workers, chunksize)
+
+    def _translate_many(
+        self,
+        texts: Iterable[str],
+        language: str,
+        reverse: bool,
+        workers: Optional[int],
+        chunksize: Optional[int],
+    ) -> List[str]:
+        transformer = self.get_transformer(language)
         language = language.lower()
-        if language not in self.transformers:
-            raise ValueError(f"Unsupported language: {language}")
+        if not isinstance(texts, Sequence):
+            texts = list(texts)
+        if workers is None:
+            workers = default_workers()
+        if self.memory is None:
+            return self._translate_texts(texts, transformer, language, reverse, workers, chunksize)
+
+        # Only texts missing from the memory are translated, then remembered
+        version = language_version(transformer)
+        results = self.memory.get_many(language, reverse, version, texts)
+        missing = [i for i, translation in enumerate(results) if translation is None]
+        if missing:
+            missing_texts = [texts[i] for i in missing]
+            translations = self._translate_texts(missing_texts, transformer, language, reverse, workers, chunksize)
+            self.memory.put_many(language, reverse, version, zip(missing_texts, translations))
+            for i, translation in zip(missing, translations):
+                results[i] = translation
+        return results
+
+    def _translate_texts(
+        self,
+        texts: Sequence[str],
+        transformer: BaseTransformer,
+        language: str,
+        reverse: bool,
+        workers: int,
+        chunksize: Optional[int],
+    ) -> List[str]:
+        if not should_parallelize(texts, workers):
+            return translate_serial(texts, transformer, reverse)
+        return self._get_pool(language, workers).map(texts, reverse, chunksize)
+
+    def translate_document(
+        self,
+        text: str,
+        language: str,
+        reverse: bool = False,
+        workers: Optional[int] = None,
+    ) -> str:
+        """Translate one large document using several processes.
+        
+        The document is split at whitespace, the parts are translated in parallel
+        and stitched back together; the result equals translate() or
+        reverse_translate() of the whole document. Text and results travel
+        through shared memory rather than being pickled. Small documents, and
+        languages that cannot be split safely, are translated in this process.
+        
+        Args:
+            text: The document to translate
+            language: The fictional language
+            reverse: Whether to translate from the language back to English
+            workers: Number of worker processes; defaults to the available CPUs
+            
+        Returns:
+            The translated document
             
-        return self.transformers[language].reverse_transform(text)
+        Raises:
+            ValueError: If the specified language is not supported
+        """
+        transformer = self.get_transformer(language)
+        if workers is None:
+            workers = default_workers()
+        if workers <= 1 or len(text) < MIN_DOCUMENT_CHARS or not can_split_document(transformer, reverse):
+            return transformer.reverse_transform(text) if reverse else transformer.transform(text)
+
+        ratio = expansion_ratio(transformer, reverse)
+        return self._get_pool(language.lower(), workers).translate_document(text, ratio, reverse)
+
+    def open_document(self, text: str, language: str, reverse: bool = False) -> DocumentTranslation:
+        """Translate a document that will be edited, for incremental re-translation.
+        
+        The returned document keeps its source and translation segmented by
+        paragraph. Its apply_edit() re-translates only the paragraphs an edit
+        touches, and its update() re-translates only the paragraphs that differ
+        from the previous version, so a small edit of a large document costs
+        little.
+        
+        Args:
+            text: The document
+            language: The fictional language
+            reverse: Whether to translate from the language back to English
+            
+        Returns:
+            The document with its translation in ``output``
+            
+        Raises:
+            ValueError: If the specified language is not supported
+        """
+        return DocumentTranslation(self.get_transformer(language), text, reverse)
+
+    def _get_pool(self, language: str, workers: int) -> TranslationPool:
+        with self._pools_lock:
+            pool = self._pools.get((language, workers))
+            if pool is None:
+                pool = self._pools[(language, workers)] = TranslationPool(language, workers)
+            return pool
 
 
 # Special case translations are now handled by the transformer
-DEFAULT_RULES = {} 
\ No newline at end of file
+DEFAULT_RULES = {}
+
+
+def __getattr__(name: str):
+    """Import ``TranslationRule``, and with it pydantic, on first access."""
+    if name == 'TranslationRule':
+        from .rules import TranslationRule
+        return TranslationRule
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
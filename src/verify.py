@@ -0,0 +1,212 @@
+"""
+Round-trip verification of translations.
+
+A translation is verified by translating it back and comparing the result with
+the original text. The comparison ignores case, since languages that fold case
+cannot restore it. Verification is either off, run on every line, or run on a
+random sample of lines. Large inputs are checked in worker processes while the
+translation carries on. The translation machinery is imported on first use, so
+the CLI can read this module's options without loading any language.
+"""
+
+import random
+from collections import deque
+from typing import TYPE_CHECKING, Deque, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future, ProcessPoolExecutor
+
+VERIFY_MODES = ('off', 'full', 'sample')
+DEFAULT_SAMPLE_RATE = 0.1
+# Characters of pending translations checked as one task, as
+# batch.MIN_PARALLEL_CHARS; repeated so the CLI can import this module cheaply
+MIN_PARALLEL_CHARS = 256 * 1024
+# Mismatches kept to show in the summary
+MAX_EXAMPLES = 5
+# Tasks waiting per worker before the translation waits for the checks
+MAX_PENDING_TASKS = 2
+
+# Line number, original text and its translation
+Line = Tuple[int, str, str]
+
+
+def round_trip_matches(original: str, round_trip: str) -> bool:
+    """Compare a text with its round trip, ignoring case."""
+    return original.casefold() == round_trip.casefold()
+
+
+def _check_lines(language: str, reverse: bool, lines: List[Line]) -> List[Line]:
+    """Translate lines back and return the ones that did not survive the round trip.
+
+    Returns:
+        Line number, original text and round trip of every mismatch.
+    """
+    from .batch import translate_texts
+
+    back = translate_texts(language, not reverse, [translated for _, _, translated in lines])
+    return [
+        (number, original, round_trip)
+        for (number, original, _), round_trip in zip(lines, back)
+        if not round_trip_matches(original, round_trip)
+    ]
+
+
+class RoundTripVerifier:
+    """Checks translations line by line by translating them back.
+
+    Feed it each block of original text with its translation as the blocks are
+    translated, then call ``finish`` for the results.
+
+    Attributes:
+        lines: Number of lines seen.
+        checked: Number of lines verified.
+        mismatches: Number of verified lines whose round trip differed.
+        examples: Line number, original text and round trip of the first
+            mismatches, in line order.
+    """
+
+    def __init__(
+        self,
+        language: str,
+        reverse: bool = False,
+        mode: str = 'full',
+        sample_rate: float = DEFAULT_SAMPLE_RATE,
+        workers: Optional[int] = None,
+        seed: Optional[int] = None,
+    ):
+        """Initialize the verifier.
+
+        Args:
+            language: Language name.
+            reverse: Whether the translations are from the language back to
+                English.
+            mode: One of ``VERIFY_MODES``.
+            sample_rate: Share of lines verified in ``sample`` mode, from 0 to 1.
+            workers: Number of worker processes; defaults to the available
+                CPUs. With one worker, lines are checked in this process.
+            seed: Seed for choosing sampled lines.
+
+        Raises:
+            ValueError: If the mode or sample rate is invalid.
+        """
+        if mode not in VERIFY_MODES:
+            raise ValueError(f"Unknown verify mode: {mode}")
+        if not 0 <= sample_rate <= 1:
+            raise ValueError("Sample rate must be between 0 and 1")
+        self.language = language
+        self.reverse = reverse
+        self.mode = mode
+        self.sample_rate = sample_rate if mode == 'sample' else float(mode == 'full')
+        if workers is None:
+            from .batch import default_workers
+
+            workers = default_workers()
+        self.workers = workers
+        self.lines = 0
+        self.checked = 0
+        self.mismatches = 0
+        self.examples: List[Line] = []
+        self._random = random.Random(seed)
+        self._pending: List[Line] = []
+        self._pending_chars = 0
+        self._open_line = False
+        self._executor: Optional['ProcessPoolExecutor'] = None
+        self._futures: Deque['Future'] = deque()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether any lines are verified."""
+        return self.sample_rate > 0
+
+    def add(self, original: str, translated: str) -> None:
+        """Queue a block of text and its translation for verification.
+
+        Lines are matched up by their position in the block. If the
+        translation has a different number of lines, the block is verified as
+        one unit numbered by its first line. A block that does not end with a
+        newline, such as part of a long line, is continued by the next block.
+
+        Args:
+            original: The original text.
+            translated: Its translation.
+        """
+        if not original:
+            return
+        original_lines = original.split('\n')
+        translated_lines = translated.split('\n')
+        if original.endswith('\n') and translated.endswith('\n'):
+            # The empty string after the last newline is not a line
+            original_lines.pop()
+            translated_lines.pop()
+        if len(original_lines) != len(translated_lines):
+            original_lines, translated_lines = [original], [translated]
+
+        # A block cut from a long line continues the previous block's last line
+        continued = self._open_line
+        number = self.lines - continued
+        self.lines = number + len(original_lines)
+        self._open_line = not original.endswith('\n')
+        if not self.enabled:
+            return
+        sample = self.sample_rate < 1
+        for offset, (line, translation) in enumerate(zip(original_lines, translated_lines)):
+            if sample and self._random.random() >= self.sample_rate:
+                continue
+            self._pending.append((number + offset + 1, line, translation))
+            self._pending_chars += len(translation)
+            # Each part of a cut line is checked, but the line counts once
+            self.checked += not (continued and offset == 0)
+        if self._pending_chars >= MIN_PARALLEL_CHARS:
+            self._flush(parallel=self.workers > 1)
+
+    def _flush(self, parallel: bool) -> None:
+        lines, self._pending, self._pending_chars = self._pending, [], 0
+        if not lines:
+            return
+        if not parallel:
+            self._record(_check_lines(self.language, self.reverse, lines))
+            return
+        if self._executor is None:
+            from concurrent.futures import ProcessPoolExecutor
+
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        while len(self._futures) >= self.workers * MAX_PENDING_TASKS:
+            self._record(self._futures.popleft().result())
+        self._futures.append(self._executor.submit(_check_lines, self.language, self.reverse, lines))
+
+    def _record(self, mismatches: List[Line]) -> None:
+        self.mismatches += len(mismatches)
+        self.examples.extend(mismatches[:MAX_EXAMPLES - len(self.examples)])
+
+    def finish(self) -> None:
+        """Verify the remaining lines and wait for every check to complete."""
+        # Leftovers go to the pool only if it is already running
+        self._flush(parallel=self._executor is not None)
+        try:
+            while self._futures:
+                self._record(self._futures.popleft().result())
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Stop the worker processes, abandoning unfinished checks."""
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+        self._futures.clear()
+
+    def summary(self) -> str:
+        """Describe the results of a finished verification.
+
+        Returns:
+            The number of lines verified and mismatched, followed by the first
+            mismatches.
+        """
+        if not self.enabled:
+            return "Round trip not verified"
+        text = f"Round trip verified {self.checked} of {self.lines} lines: {self.mismatches} mismatched"
+        for number, original, round_trip in self.examples:
+            text += f"\n  line {number}: {original!r} came back as {round_trip!r}"
+        if self.mismatches > len(self.examples):
+            text += f"\n  ... and {self.mismatches - len(self.examples)} more"
+        return text
@@ -0,0 +1,128 @@
+"""Test suite for process-pool batch translation."""
+
+import pytest
+from src import batch
+from src.batch import (
+    TranslationPool,
+    can_split_document,
+    choose_chunksize,
+    expansion_ratio,
+    should_parallelize,
+    split_offsets,
+)
+from src.languages import LANGUAGE_TRANSFORMERS
+
+TEXTS = [f"Text number {i}: the thing shall ring" for i in range(500)]
+
+
+@pytest.fixture(scope="module")
+def insectoid_pool():
+    """A small pool warmed up with the Insectoid transformer."""
+    pool = TranslationPool("insectoid", workers=2)
+    yield pool
+    pool.shutdown()
+
+
+@pytest.mark.parametrize("chunksize", [None, 1, 7, 10000])
+def test_pool_preserves_order(insectoid_pool, chunksize):
+    """Test that results come back in input order for any batch size."""
+    transformer = LANGUAGE_TRANSFORMERS["insectoid"]()
+    expected = [transformer.transform(text) for text in TEXTS]
+    assert insectoid_pool.map(TEXTS, chunksize=chunksize) == expected
+    assert insectoid_pool.map(expected, reverse=True, chunksize=chunksize) == [
+        transformer.reverse_transform(text) for text in expected
+    ]
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+@pytest.mark.parametrize("language_name", LANGUAGE_TRANSFORMERS.keys())
+def test_document_matches_whole_translation(language_name, reverse):
+    """Test that a document split across workers is stitched back exactly."""
+    transformer = LANGUAGE_TRANSFORMERS[language_name]()
+    document = "The Thing shall PHASE through ᚦ runes, 😀 and\ttabs\n" * 400 + "\ud800 lone"
+    if reverse:
+        document = transformer.transform(document)
+    expected = transformer.reverse_transform(document) if reverse else transformer.transform(document)
+
+    assert can_split_document(transformer, reverse)
+    pool = TranslationPool(language_name, workers=2)
+    try:
+        ratio = expansion_ratio(transformer, reverse)
+        assert pool.translate_document(document, ratio, reverse) == expected
+    finally:
+        pool.shutdown()
+
+
+def test_split_offsets():
+    """Test that splits land just after whitespace and cover the whole input."""
+    data = "ab cd\tef\ngh ᚦᚦᚦᚦ ij".encode("utf-8")
+    offsets = split_offsets(data, 4)
+    assert offsets[0] == 0 and offsets[-1] == len(data)
+    assert offsets == sorted(set(offsets))
+    assert all(data[offset - 1:offset] in b" \t\n" for offset in offsets[1:-1])
+    assert split_offsets(b"nowhitespace", 4) == [0, 12]
+
+
+def test_choose_chunksize():
+    """Test that each worker gets a few sizeable tasks."""
+    assert choose_chunksize(1_000_000, 8) == 31250
+    assert choose_chunksize(3, 8) == 1
+
+
+def test_should_parallelize(monkeypatch):
+    """Test that small batches stay in process."""
+    monkeypatch.setattr(batch, "MIN_PARALLEL_CHARS", 100)
+    assert not should_parallelize(["x" * 1000] * 10, workers=1)
+    assert not should_parallelize(["short"] * 10, workers=4)
+    assert should_parallelize(["x" * 60] * 2, workers=4)
+
+
+def test_translator_translate_many():
+    """Test the Translator batch API end to end."""
+    from src.translator import Translator
+
+    with Translator() as translator:
+        expected = [translator.translate(text, "Cybernetic") for text in TEXTS]
+        assert translator.translate_many(iter(TEXTS), "Cybernetic", workers=1) == expected
+        assert translator.reverse_translate_many(expected, "cybernetic", workers=1) == [
+            translator.reverse_translate(text, "cybernetic") for text in expected
+        ]
+        with pytest.raises(ValueError):
+            translator.translate_many(TEXTS, "klingon")
+
+
+def test_translator_translate_all():
+    """Test that translate_all matches translating into each language."""
+    from src.translator import Translator
+
+    text = "The three Shy thieves"
+    translator = Translator()
+    results = translator.translate_all(text)
+    assert list(results) == sorted(LANGUAGE_TRANSFORMERS)
+    assert results == {language: translator.translate(text, language) for language in LANGUAGE_TRANSFORMERS}
+    assert list(translator.translate_all(text, ["Elvish", "dwarvish"])) == ["elvish", "dwarvish"]
+    for short in ["", "Hello", "The t", "ΣΟΦΙΑ"]:
+        assert translator.translate_all(short) == {
+            language: translator.translate(short, language) for language in LANGUAGE_TRANSFORMERS
+        }
+    with pytest.raises(ValueError):
+        translator.translate_all(text, ["klingon"])
+
+
+def test_translator_translate_all_other_transformers():
+    """Test that languages not defined by packs keep their requested order."""
+    from src.languages.base import BaseTransformer
+    from src.translator import Translator
+
+    class ShoutTransformer(BaseTransformer):
+        def transform(self, text: str) -> str:
+            return text.upper()
+
+        def reverse_transform(self, text: str) -> str:
+            return text.lower()
+
+    translator = Translator()
+    translator.transformers["shout"] = ShoutTransformer()
+    results = translator.translate_all("the thing", ["shout", "elvish"])
+    assert results == {"shout": "THE THING", "elvish": translator.translate("the thing", "elvish")}
+    assert list(results) == ["shout", "elvish"]
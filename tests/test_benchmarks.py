@@ -0,0 +1,61 @@
+"""Test suite for the benchmark harness."""
+
+import json
+
+from benchmarks.suite import check_fanout, compare, main, make_text, run_fanout, run_suite
+
+
+def test_make_text_size():
+    """Test that generated inputs fit the requested size in UTF-8."""
+    for size in (10, 1000):
+        text = make_text("ᚠᚢᚦ runes 🐉 ", size)
+        assert 0 < len(text.encode('utf-8')) <= size
+
+
+def test_run_suite_covers_both_directions():
+    """Test that a small run reports throughput and memory for every case."""
+    report = run_suite(languages=['elvish'], sizes=['10B'], min_time=0)
+    assert len(report['results']) == 2 * 4
+    for result in report['results'].values():
+        assert result['throughput_mb_s'] > 0
+        assert result['peak_bytes'] >= 0
+
+
+def test_compare_flags_regressions():
+    """Test the throughput and memory thresholds."""
+    baseline = {'results': {
+        'a': {'throughput_mb_s': 100.0, 'peak_bytes': 1000},
+        'b': {'throughput_mb_s': 100.0, 'peak_bytes': 1000},
+    }}
+    current = {'results': {
+        'a': {'throughput_mb_s': 80.0, 'peak_bytes': 1400},
+        'b': {'throughput_mb_s': 50.0, 'peak_bytes': 2000},
+        'new': {'throughput_mb_s': 1.0, 'peak_bytes': 1},
+    }}
+    regressions = compare(baseline, current, threshold=0.25, memory_threshold=0.5)
+    assert len(regressions) == 2
+    assert all(regression.startswith('b:') for regression in regressions)
+
+
+def test_main_saves_and_gates(tmp_path, capsys):
+    """Test saving a baseline and failing against an impossible one."""
+    baseline = tmp_path / 'baseline.json'
+    args = ['-l', 'necrotic', '--size', '10B', '--corpus', 'realistic', '--min-time', '0']
+    assert main(args + ['--save', str(baseline)]) == 0
+
+    report = json.loads(baseline.read_text())
+    for result in report['results'].values():
+        result['throughput_mb_s'] *= 1000
+    baseline.write_text(json.dumps(report))
+    assert main(args + ['--compare', str(baseline), '--no-memory']) == 1
+    assert 'regression' in capsys.readouterr().err
+
+
+def test_fanout_against_separate_calls():
+    """Test that translate_all is timed against one call per language."""
+    results = run_fanout(sizes=['10B'], corpora=['realistic'], min_time=0)
+    assert list(results) == ['fanout/realistic/10B']
+    result = results['fanout/realistic/10B']
+    assert result['ratio'] == result['seconds'] / result['separate_seconds']
+    assert check_fanout(results, max_ratio=float('inf')) == []
+    assert len(check_fanout(results, max_ratio=0)) == 1
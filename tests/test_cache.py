@@ -0,0 +1,83 @@
+"""Test suite for the translation cache."""
+
+import threading
+
+import pytest
+from src.cache import TranslationCache
+
+
+def test_hits_and_misses():
+    """Test that repeated texts are translated once."""
+    cache = TranslationCache()
+    calls = []
+
+    def convert(text):
+        calls.append(text)
+        return text.upper()
+
+    for text in ["hi", "hi", "bye", "hi"]:
+        assert cache.get_or_translate('elvish', False, text, convert) == text.upper()
+    # Direction and language are part of the key
+    cache.get_or_translate('elvish', True, "hi", convert)
+    cache.get_or_translate('dwarvish', False, "hi", convert)
+
+    assert calls == ["hi", "bye", "hi", "hi"]
+    stats = cache.stats()
+    assert (stats['hits'], stats['misses'], stats['entries']) == (2, 4, 4)
+
+
+def test_evicts_least_recently_used():
+    """Test eviction by entry count in least recently used order."""
+    cache = TranslationCache(max_entries=2)
+    cache.put(('elvish', False, 'a'), 'A')
+    cache.put(('elvish', False, 'b'), 'B')
+    cache.get(('elvish', False, 'a'))
+    cache.put(('elvish', False, 'c'), 'C')
+
+    assert cache.get(('elvish', False, 'b')) is None
+    assert cache.get(('elvish', False, 'a')) == 'A'
+    assert cache.stats()['evictions'] == 1
+
+
+def test_byte_limit_and_bypass():
+    """Test eviction by memory and that long texts skip the cache."""
+    cache = TranslationCache(max_bytes=4000, max_text_length=100)
+    for i in range(50):
+        cache.get_or_translate('elvish', False, f"text {i}", str.upper)
+    stats = cache.stats()
+    assert 0 < stats['bytes'] <= 4000
+    assert stats['evictions'] == 50 - stats['entries']
+
+    cache.get_or_translate('elvish', False, "x" * 101, str.upper)
+    assert cache.stats()['bypassed'] == 1
+    assert ('elvish', False, "x" * 101) not in cache._entries
+
+
+def test_thread_safety():
+    """Test concurrent use keeps the entry and byte accounting consistent."""
+    cache = TranslationCache(max_entries=64)
+
+    def work(offset):
+        for i in range(2000):
+            cache.get_or_translate('elvish', False, str((i * 7 + offset) % 100), str.upper)
+
+    threads = [threading.Thread(target=work, args=(n,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stats = cache.stats()
+    assert stats['hits'] + stats['misses'] == 8000
+    assert stats['entries'] == len(cache) <= 64
+    assert stats['bytes'] == sum(size for _, size in cache._entries.values())
+
+
+def test_translator_uses_cache():
+    """Test that Translator results are cached per language and direction."""
+    translator_module = pytest.importorskip("src.translator")
+    translator = translator_module.Translator(cache=TranslationCache())
+    first = translator.translate("Hello there", "Elvish")
+    assert translator.translate("Hello there", "elvish") == first
+    assert translator.reverse_translate(first, "elvish") == translator.reverse_translate(first, "elvish")
+    assert translator.cache.stats()['hits'] == 2
@@ -0,0 +1,105 @@
+"""Test suite for the warm translation daemon."""
+
+import socket
+import threading
+
+import pytest
+from src.daemon import DaemonClient, TranslationDaemon, connect, default_socket_path, is_running
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, 'AF_UNIX'), reason="needs Unix-domain sockets")
+
+
+def test_no_daemon(tmp_path):
+    """Test that clients fall back cleanly when nothing is listening."""
+    path = str(tmp_path / 'missing.sock')
+    assert connect(path) is None
+    assert not is_running(path)
+
+
+def test_socket_path_from_environment(monkeypatch):
+    """Test that LANGGEN_SOCKET overrides the default socket path."""
+    monkeypatch.setenv('LANGGEN_SOCKET', '/run/custom.sock')
+    assert default_socket_path() == '/run/custom.sock'
+
+
+@pytest.fixture
+def daemon(tmp_path):
+    translator_module = pytest.importorskip("src.translator")
+    path = str(tmp_path / 'daemon.sock')
+    # A socket file left behind by a daemon that died is replaced
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(path)
+    stale.close()
+
+    server = TranslationDaemon(path, translator_module.Translator())
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+def test_round_trip(daemon):
+    """Test translating over one connection, matching the in-process translator."""
+    with DaemonClient(daemon.path) as client:
+        for language in ('elvish', 'cybernetic', 'dwarvish'):
+            expected = daemon.translator.translate("The thief\nsaid hi", language)
+            assert client.translate("The thief\nsaid hi", language) == expected
+            assert client.reverse_translate(expected, language) == daemon.translator.reverse_translate(expected, language)
+        with pytest.raises(ValueError, match="Unsupported language"):
+            client.translate("x", "klingon")
+        # The connection stays usable after an error
+        client.ping()
+
+
+def test_second_daemon_refused(daemon):
+    """Test that a live daemon's socket is not taken over."""
+    with pytest.raises(OSError, match="already listening"):
+        TranslationDaemon(daemon.path, daemon.translator)
+
+
+@pytest.fixture
+def broken_daemon(tmp_path):
+    """A socket that answers every request line with a canned reply, then hangs up."""
+    path = str(tmp_path / 'broken.sock')
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(path)
+    listener.listen()
+    replies = []
+
+    def answer():
+        while True:
+            try:
+                connection, _ = listener.accept()
+            except OSError:
+                return
+            with connection, connection.makefile('rb') as requests:
+                requests.readline()
+                connection.sendall(replies[0])
+
+    thread = threading.Thread(target=answer, daemon=True)
+    thread.start()
+    yield path, replies
+    listener.close()
+
+
+@pytest.mark.parametrize("reply", [b'not json\n', b'{"result": "trunc', b'{}\n', b'[1]\n', b'\xff\n'])
+def test_protocol_errors_are_connection_errors(broken_daemon, reply):
+    """Test that broken replies are told apart from errors the daemon reports."""
+    path, replies = broken_daemon
+    replies.append(reply)
+    with DaemonClient(path) as client:
+        with pytest.raises(ConnectionError):
+            client.translate("the thief", "elvish")
+
+
+def test_cli_falls_back_on_a_broken_daemon(broken_daemon):
+    """Test that the CLI translates in-process when the daemon breaks the protocol."""
+    from src.cli import _translate_round_trip
+    from src.translator import Translator
+
+    path, replies = broken_daemon
+    replies.append(b'{"result": 1}\n')
+    expected = Translator().translate("the thief", "elvish")
+    assert _translate_round_trip("the thief", "elvish", path, verify=False) == (expected, None)
@@ -0,0 +1,58 @@
+"""Test suite for detecting the language of translated text."""
+
+import pytest
+from src.languages import LANGUAGE_TRANSFORMERS
+from src.languages.detect import DETECT_PREFIX_CHARS, detect_language
+from src.translator import Translator
+
+TEXTS = [
+    "The quick brown fox jumps over the lazy dog",
+    "Hello world",
+    "Mixed case TeXt with 123 numbers!",
+    "She sells sea shells by the sea shore.\nThe shells she sells are surely seashells.",
+]
+
+
+@pytest.mark.parametrize("language", sorted(LANGUAGE_TRANSFORMERS))
+@pytest.mark.parametrize("text", TEXTS)
+def test_detects_every_language(language, text):
+    """Test that translations are attributed to the language they are in."""
+    assert detect_language(LANGUAGE_TRANSFORMERS[language]().transform(text)) == language
+
+
+@pytest.mark.parametrize("text", TEXTS + ["", "1234 !?", "def main():\n    return 0\n"])
+def test_english_is_not_detected(text):
+    """Test that untranslated text matches no language."""
+    assert detect_language(text) is None
+
+
+def test_only_a_prefix_is_sampled():
+    """Test that text after the sampled prefix does not affect detection."""
+    elvish = LANGUAGE_TRANSFORMERS['elvish']().transform("a long text " * DETECT_PREFIX_CHARS)
+    celestial = LANGUAGE_TRANSFORMERS['celestial']().transform("other words " * DETECT_PREFIX_CHARS)
+    assert detect_language(elvish[:DETECT_PREFIX_CHARS] + celestial) == 'elvish'
+
+
+def test_candidate_languages():
+    """Test that detection can be limited to some languages."""
+    translated = LANGUAGE_TRANSFORMERS['dwarvish']().transform("Hello world")
+    assert detect_language(translated, ('Dwarvish', 'elvish')) == 'dwarvish'
+    assert detect_language(translated, ('celestial', 'necrotic')) is None
+
+
+@pytest.mark.parametrize("language", sorted(LANGUAGE_TRANSFORMERS))
+def test_reverse_translate_auto(language):
+    """Test that automatic reverse translation matches naming the language."""
+    translator = Translator()
+    translated = translator.translate(TEXTS[0], language)
+    assert translator.detect_language(translated) == language
+    assert translator.reverse_translate(translated) == translator.reverse_translate(translated, language)
+    assert translator.reverse_translate(translated, 'AUTO') == translator.reverse_translate(translated, language)
+
+
+def test_reverse_translate_auto_errors():
+    """Test automatic reverse translation of empty and undetectable text."""
+    translator = Translator()
+    assert translator.reverse_translate('') == ''
+    with pytest.raises(ValueError, match="Could not detect"):
+        translator.reverse_translate("plain English")
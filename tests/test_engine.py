@@ -0,0 +1,62 @@
+"""Test suite for the compiled translation-table engine."""
+
+import pytest
+from src.languages import LANGUAGE_TRANSFORMERS
+from src.languages.engine import SHARED_WORDS_MIN_CHARS, SharedScan, TranslationTable, case_variants
+
+
+def test_single_character_table():
+    """Test that a table of single characters translates every occurrence."""
+    table = TranslationTable({'a': '1a01', 'b': '0b01'})
+    assert table.translate("abc ba") == "1a010b01c 0b011a01"
+
+
+def test_longest_key_wins():
+    """Test that multi-character keys take precedence over their prefixes."""
+    table = TranslationTable({'t': 'T', 'h': 'H', 'th': 'ð', 'thr': 'Þ'})
+    assert table.translate("the three th") == "ðe Þee ð"
+
+
+@pytest.mark.parametrize("key", ['ᚺ', '\U0001F600'])
+def test_non_ascii_keys(key):
+    """Test keys inside and outside the dense codepoint range."""
+    table = TranslationTable({key: 'x', 'ab': 'y'})
+    assert table.translate(f"{key}ab{key}a") == "xyxa"
+
+
+def test_empty_table_is_identity():
+    """Test that an empty table leaves text unchanged."""
+    assert TranslationTable({}).translate("unchanged") == "unchanged"
+
+
+def test_codes_sharing_a_prefix():
+    """Test decoding of codes that share prefixes, as the Insectoid codes do."""
+    table = TranslationTable({'tzz': 't', 'thkk': 'th', 'hzz': 'h', 'zzz': 'z'})
+    assert table.translate("thkkzzztzzhzz thk") == "thzth thk"
+
+
+def test_case_variants():
+    """Test that every case spelling of a digraph is listed once."""
+    assert case_variants('th') == ['th', 'tH', 'Th', 'TH']
+    assert case_variants('q1') == ['q1', 'Q1']
+
+
+def test_shared_scan_matches_each_table():
+    """Test that one shared scan gives every table's own translation."""
+    transformers = [LANGUAGE_TRANSFORMERS[language]() for language in sorted(LANGUAGE_TRANSFORMERS)]
+    scan = SharedScan(
+        [transformer.pack.forward_table for transformer in transformers],
+        [transformer.pack.fold_case for transformer in transformers],
+    )
+    prose = "The THREE shy Thieves chased a ShHh-ing thrush. "
+    # Long text whose words never repeat is translated by each table on its own
+    unique = " ".join(f"th{i:x}Sh" for i in range(SHARED_WORDS_MIN_CHARS // 6))
+    repeated = prose * (SHARED_WORDS_MIN_CHARS // len(prose) + 1)
+    for text in ["", "Hello", "The t", "ΣΟΦΙΑ", "ThHt hth chch", "x\x00th", "ΣΟΦΙΑ the Ωth", repeated, unique]:
+        assert scan.translate(text) == [transformer.transform(text) for transformer in transformers]
+
+
+def test_shared_scan_overlapping_keys():
+    """Test tables whose keys overlap another table's keys."""
+    tables = [TranslationTable({'ab': '1', 'a': 'x'}), TranslationTable({'bc': '2', 'c': 'y'})]
+    assert SharedScan(tables).translate("abc bcab") == [table.translate("abc bcab") for table in tables]
@@ -0,0 +1,36 @@
+"""Test suite for the import-time budget."""
+
+import os
+
+import pytest
+from benchmarks.imports import IMPORT_BUDGETS_MS, REQUIREMENTS, available, check_budgets, parse_importtime
+
+# Wall-clock budgets depend on the machine's load, so they are only checked on request
+BENCHMARKS_ENV_VAR = 'LANGGEN_BENCHMARKS'
+
+
+def test_parse_importtime():
+    """Test that the report's header is skipped and cumulative times are read."""
+    output = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       120 |        120 |   _abc\n"
+        "import time:       300 |       4500 | src.languages\n"
+    )
+    assert parse_importtime(output) == {'_abc': 120, 'src.languages': 4500}
+
+
+@pytest.mark.parametrize("module", sorted(IMPORT_BUDGETS_MS))
+def test_no_heavy_imports(module):
+    """Test that entry points import without heavy dependencies."""
+    if not available(module):
+        pytest.skip(f"requires {', '.join(REQUIREMENTS[module])}")
+    assert check_budgets([module], repeats=1, timed=False) == []
+
+
+@pytest.mark.skipif(not os.environ.get(BENCHMARKS_ENV_VAR), reason=f"set {BENCHMARKS_ENV_VAR}=1 to check import times")
+@pytest.mark.parametrize("module", sorted(IMPORT_BUDGETS_MS))
+def test_import_budget(module):
+    """Test that entry points import within their time budgets."""
+    if not available(module):
+        pytest.skip(f"requires {', '.join(REQUIREMENTS[module])}")
+    assert check_budgets([module]) == []
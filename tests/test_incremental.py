@@ -0,0 +1,126 @@
+"""Test suite for incremental re-translation."""
+
+import random
+import timeit
+
+import pytest
+from src.incremental import DocumentTranslation, IncrementalTranslation, split_paragraphs, split_segments
+from src.languages import LANGUAGE_TRANSFORMERS
+
+WORDS = ["the", "Thief", "SHH", "thrush", "chat", "ᚦorn", "😀", "qu", "\n", "  ", "ph"]
+
+
+def _utf16(text):
+    return text.encode('utf-16-le', 'surrogatepass')
+
+
+def _splice(output, edit, utf16):
+    start, removed, inserted = edit
+    if utf16:
+        units = _utf16(output)
+        return (units[:2 * start] + _utf16(inserted) + units[2 * (start + removed):]).decode('utf-16-le')
+    return output[:start] + inserted + output[start + removed:]
+
+
+def test_split_segments():
+    """Test that segments rejoin into the text and end just before a word."""
+    text = " ".join(f"word{i}" for i in range(500)) + "  \n end"
+    segments = split_segments(text, 50)
+    assert "".join(segments) == text
+    assert all(segment[-1].isspace() for segment in segments[:-1])
+    assert split_segments("") == [""]
+
+
+@pytest.mark.parametrize("language", sorted(LANGUAGE_TRANSFORMERS))
+@pytest.mark.parametrize("utf16", [False, True])
+def test_random_edits_match_full_translation(language, utf16):
+    """Test that splicing each edit's output gives the translation of the edited text."""
+    transformer = LANGUAGE_TRANSFORMERS[language]()
+    rng = random.Random(language)
+    text = " ".join(rng.choice(WORDS) for _ in range(400))
+    translation = IncrementalTranslation(transformer, text, utf16=utf16)
+    output = translation.output
+    assert output == transformer.transform(text)
+
+    for _ in range(200):
+        start = rng.randint(0, len(text))
+        end = start + rng.randint(0, min(5, len(text) - start))
+        inserted = rng.choice(["", "t", "h", " ", "Th", "😀", "shh the "])
+        if utf16:
+            position, removed = len(_utf16(text[:start])) // 2, len(_utf16(text[start:end])) // 2
+        else:
+            position, removed = start, end - start
+        text = text[:start] + inserted + text[end:]
+        output = _splice(output, translation.apply_edit(position, removed, inserted), utf16)
+        assert translation.text == text
+        assert output == transformer.transform(text)
+
+
+def test_edit_outside_text():
+    """Test that edits past the end are rejected."""
+    translation = IncrementalTranslation(LANGUAGE_TRANSFORMERS['elvish'](), "short")
+    with pytest.raises(ValueError):
+        translation.apply_edit(3, 5, "")
+
+
+def test_split_paragraphs():
+    """Test that documents split after paragraph breaks and rejoin exactly."""
+    text = "First line\nsame paragraph\n\nSecond\n \n\n\nThird " + "word " * 100
+    segments = split_paragraphs(text, 64)
+    assert "".join(segments) == text
+    assert segments[:2] == ["First line\nsame paragraph\n\n", "Second\n \n\n\n"]
+    assert all(len(segment) < 80 for segment in segments)
+
+
+@pytest.mark.parametrize("language", sorted(LANGUAGE_TRANSFORMERS))
+def test_document_update_retranslates_changed_paragraphs(language):
+    """Test that updates reuse unchanged paragraphs and match a full translation."""
+    transformer = LANGUAGE_TRANSFORMERS[language]()
+    paragraphs = [f"The thief {i} said SHH to the thrush.\n\n" for i in range(50)]
+    document = DocumentTranslation(transformer, "".join(paragraphs))
+    assert document.output == transformer.transform("".join(paragraphs))
+
+    converted = []
+    original = document._convert_many
+    document._convert_many = lambda texts: converted.extend(texts) or original(texts)
+    paragraphs[10] = "A changed paragraph with theth in it.\n\n"
+    paragraphs.insert(0, "New opening.\n\n")
+    text = "".join(paragraphs)
+    assert document.update(text) == transformer.transform(text)
+    assert converted == [paragraphs[0], paragraphs[11]]
+
+    start = text.index("changed")
+    edit = document.apply_edit(start, len("changed"), "edited")
+    text = text.replace("changed", "edited")
+    assert document.text == text
+    assert document.output == transformer.transform(text)
+    assert edit[1] < len(document.output) // 10
+
+
+def test_edit_cost_does_not_grow_with_document_size():
+    """Test that an edit in a 100 times larger document costs about the same."""
+    transformer = LANGUAGE_TRANSFORMERS['elvish']()
+    paragraph = "The ranger listened for the thrush.\n\n"
+
+    def edit_seconds(paragraphs):
+        document = DocumentTranslation(transformer, paragraph * paragraphs)
+        position = len(paragraph) * (paragraphs // 2) + 4
+        edit = lambda: (document.apply_edit(position, 6, "walker"), document.apply_edit(position, 6, "ranger"))
+        return min(timeit.repeat(edit, number=50, repeat=5))
+
+    small, large = edit_seconds(1_000), edit_seconds(100_000)
+    assert large < small * 5
+
+
+def test_translator_open_document():
+    """Test the Translator's document API in both directions."""
+    from src.translator import Translator
+
+    translator = Translator()
+    text = "Para one.\n\nPara two with th.\n"
+    document = translator.open_document(text, "Insectoid")
+    assert document.output == translator.translate(text, "insectoid")
+    back = translator.open_document(document.output, "insectoid", reverse=True)
+    assert back.output == translator.reverse_translate(document.output, "insectoid")
+    with pytest.raises(ValueError):
+        translator.open_document(text, "klingon")
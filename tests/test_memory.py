@@ -0,0 +1,66 @@
+"""Test suite for the persistent translation memory."""
+
+import sqlite3
+
+import pytest
+from src.languages import LANGUAGE_TRANSFORMERS
+from src.memory import TranslationMemory, language_version, memory_key
+
+
+def test_bulk_round_trip(tmp_path):
+    """Test storing and looking up more texts than fit in one query."""
+    path = tmp_path / 'memory.db'
+    texts = [f"text {i}" for i in range(2500)]
+    with TranslationMemory(path) as memory:
+        memory.put_many('elvish', False, 'v1', ((text, text.upper()) for text in texts[:2000]))
+        found = memory.get_many('elvish', False, 'v1', texts)
+    assert found == [text.upper() for text in texts[:2000]] + [None] * 500
+
+    # A new process sees the same entries
+    with TranslationMemory(path) as memory:
+        assert memory.get('elvish', False, 'v1', 'text 7') == 'TEXT 7'
+        assert len(memory) == 2000
+        assert memory.get('elvish', True, 'v1', 'text 7') is None
+        assert memory.get('elvish', False, 'v2', 'text 7') is None
+
+    assert sqlite3.connect(str(path)).execute("PRAGMA journal_mode").fetchone()[0] == 'wal'
+
+
+def test_lone_surrogates_are_stored(tmp_path):
+    """Test that a translation SQLite cannot encode does not fail its batch."""
+    translator_module = pytest.importorskip("src.translator")
+    pairs = [('plain', 'PLAIN'), ('broken \ud800', 'BROKEN \ud800')]
+    with TranslationMemory(tmp_path / 'memory.db') as memory:
+        memory.put_many('elvish', False, 'v1', pairs)
+        assert memory.get_many('elvish', False, 'v1', [text for text, _ in pairs]) == ['PLAIN', 'BROKEN \ud800']
+
+        translator = translator_module.Translator(memory=memory)
+        translation = translator.translate('lone \udc80 surrogate', 'elvish')
+        assert memory.get('elvish', False, language_version(translator.get_transformer('elvish')),
+                          'lone \udc80 surrogate') == translation
+
+
+def test_key_depends_on_every_part():
+    """Test that language, direction, version and text all change the key."""
+    base = memory_key('elvish', False, 'v1', 'hi')
+    assert len(base) == 16
+    assert len({base, memory_key('dwarvish', False, 'v1', 'hi'), memory_key('elvish', True, 'v1', 'hi'),
+                memory_key('elvish', False, 'v2', 'hi'), memory_key('elvish', False, 'v1', 'ho')}) == 5
+
+
+def test_language_version_tracks_pack_content():
+    """Test that pack languages are versioned by their content hash."""
+    transformer = LANGUAGE_TRANSFORMERS['elvish']()
+    assert transformer.pack.digest in language_version(transformer)
+
+
+def test_translator_uses_memory(tmp_path):
+    """Test that batch translation only translates texts the memory lacks."""
+    translator_module = pytest.importorskip("src.translator")
+    with TranslationMemory(tmp_path / 'memory.db') as memory:
+        translator = translator_module.Translator(memory=memory)
+        expected = translator_module.Translator().translate_many(["a", "b"], "elvish", workers=1)
+        memory.put('elvish', False, language_version(translator.get_transformer('elvish')), 'a', 'remembered')
+        assert translator.translate_many(["a", "b"], "elvish", workers=1) == ['remembered', expected[1]]
+        assert translator.translate("b", "elvish") == expected[1]
+        assert len(memory) == 2
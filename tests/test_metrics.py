@@ -0,0 +1,111 @@
+"""Test suite for the metrics registry and Prometheus export."""
+
+import urllib.request
+
+import pytest
+from src.cache import TranslationCache
+from src.metrics import CACHE_LOOKUPS, REGISTRY, MetricsRegistry, start_http_server, utf8_length
+
+
+@pytest.fixture
+def registry():
+    registry = MetricsRegistry(enabled=True)
+    yield registry
+
+
+@pytest.fixture
+def global_registry():
+    REGISTRY.reset()
+    REGISTRY.enable()
+    yield REGISTRY
+    REGISTRY.disable()
+    REGISTRY.reset()
+
+
+def test_render_counter_and_histogram(registry):
+    """Test the Prometheus text format of both metric types."""
+    counter = registry.counter('requests_total', 'Requests.', ('language',))
+    histogram = registry.histogram('duration_seconds', 'Duration.', ('language',), buckets=(0.1, 1))
+    counter.inc('elvish')
+    counter.inc('elvish', amount=2)
+    counter.inc('say "hi"')
+    histogram.observe(0.05, 'elvish')
+    histogram.observe(0.5, 'elvish')
+    histogram.observe(5, 'elvish')
+
+    lines = registry.render().splitlines()
+    assert '# TYPE requests_total counter' in lines
+    assert 'requests_total{language="elvish"} 3' in lines
+    assert 'requests_total{language="say \\"hi\\""} 1' in lines
+    assert '# TYPE duration_seconds histogram' in lines
+    assert 'duration_seconds_bucket{language="elvish",le="0.1"} 1' in lines
+    assert 'duration_seconds_bucket{language="elvish",le="1"} 2' in lines
+    assert 'duration_seconds_bucket{language="elvish",le="+Inf"} 3' in lines
+    assert 'duration_seconds_sum{language="elvish"} 5.55' in lines
+    assert 'duration_seconds_count{language="elvish"} 3' in lines
+
+
+def test_duplicate_metric_rejected(registry):
+    """Test that a metric name can only be registered once."""
+    registry.counter('a_total', 'A.')
+    with pytest.raises(ValueError):
+        registry.counter('a_total', 'A again.')
+
+
+def test_file_dump_and_http(registry, tmp_path):
+    """Test both export paths."""
+    registry.counter('hits_total', 'Hits.').inc()
+    path = tmp_path / 'translations.prom'
+    registry.write_file(path)
+    assert 'hits_total 1' in path.read_text()
+
+    server = start_http_server(0, registry=registry)
+    try:
+        url = f"http://127.0.0.1:{server.server_address[1]}/metrics"
+        with urllib.request.urlopen(url) as response:
+            assert response.headers['Content-Type'].startswith('text/plain')
+            assert 'hits_total 1' in response.read().decode('utf-8')
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_disabled_registry_records_nothing():
+    """Test that instrumented code skips recording while disabled."""
+    REGISTRY.reset()
+    cache = TranslationCache()
+    cache.get_or_translate('elvish', False, 'hi', str.upper)
+    assert CACHE_LOOKUPS.value('miss') == 0
+
+
+def test_cache_lookups_recorded(global_registry):
+    """Test that cache hits and misses are counted when enabled."""
+    cache = TranslationCache()
+    for _ in range(3):
+        cache.get_or_translate('elvish', False, 'hi', str.upper)
+    assert (CACHE_LOOKUPS.value('hit'), CACHE_LOOKUPS.value('miss')) == (2, 1)
+
+
+def test_translator_instrumented(global_registry):
+    """Test request, byte, latency and error metrics from the translator."""
+    translator_module = pytest.importorskip("src.translator")
+    from src.metrics import BYTES_IN, LATENCY, TRANSLATION_ERRORS, TRANSLATIONS
+
+    translator = translator_module.Translator()
+    translator.translate("héllo", "Elvish")
+    translator.reverse_translate_many(iter(["a", "b"]), "elvish", workers=1)
+    with pytest.raises(ValueError):
+        translator.translate("x", "klingon")
+
+    assert TRANSLATIONS.value('elvish', 'forward') == 1
+    assert TRANSLATIONS.value('elvish', 'reverse') == 2
+    assert BYTES_IN.value('elvish', 'forward') == 6
+    assert LATENCY.count('elvish', 'forward') == 1
+    assert TRANSLATION_ERRORS.value('unknown', 'forward') == 1
+
+
+def test_utf8_length():
+    """Test byte counts for ASCII, non-ASCII and lone surrogate text."""
+    assert utf8_length("hello") == 5
+    assert utf8_length("héllo ᚠ") == 10
+    assert utf8_length("\ud800") == 3
@@ -0,0 +1,51 @@
+"""Test suite for language packs and their compiled tables."""
+
+import json
+
+import pytest
+from src.languages.pack import LanguagePack, PackTransformer, load_compiled_pack
+
+CUSTOM_PACK = {
+    "name": "buzzing",
+    "version": "2.1",
+    "case": "title",
+    "consonants": {"b": "ƀ", "z": "ʑ"},
+    "vowels": {"u": "ʊ"},
+    "digraphs": {"zz": "ʒ"},
+}
+
+
+@pytest.fixture
+def custom_pack_path(tmp_path):
+    """Write a small custom pack to disk."""
+    path = tmp_path / "buzzing.json"
+    path.write_text(json.dumps(CUSTOM_PACK, ensure_ascii=False), encoding="utf-8")
+    return path
+
+
+def test_compiled_pack_is_shared(custom_pack_path):
+    """Test that a pack is compiled once per process and tracks its content."""
+    compiled = load_compiled_pack(str(custom_pack_path))
+    assert load_compiled_pack(str(custom_pack_path)) is compiled
+    assert compiled.forward["b"] == "ƀ"
+
+    # Editing the pack changes its hash
+    custom_pack_path.write_text(json.dumps({**CUSTOM_PACK, "version": "2.2"}), encoding="utf-8")
+    load_compiled_pack.cache_clear()
+    assert load_compiled_pack(str(custom_pack_path)).digest != compiled.digest
+
+
+def test_custom_pack_transformer(custom_pack_path):
+    """Test a transformer built from a pack file outside the package."""
+    transformer = PackTransformer.for_pack(custom_pack_path)()
+    assert type(transformer).__name__ == "BuzzingTransformer"
+    assert transformer.transform("Buzz BUZZ") == "Ƀʊʒ ɃƱƷ"
+    assert transformer.reverse_transform("ƀʊʒ") == "buzz"
+
+
+def test_invalid_pack(tmp_path):
+    """Test that malformed packs are rejected."""
+    path = tmp_path / "broken.json"
+    path.write_text(json.dumps({"name": "broken", "case": "sideways"}), encoding="utf-8")
+    with pytest.raises(ValueError):
+        LanguagePack.from_file(path)
@@ -0,0 +1,67 @@
+"""Test suite for chunked file and pipe translation."""
+
+import io
+
+import pytest
+from src.languages import LANGUAGE_TRANSFORMERS
+from src.pipeline import line_blocks, read_chunks, translate_file, write_chunks
+
+TEXT = "Thé quick brown fox — ᚦ runes, 0b01 codes and emoji 😀 everywhere.\n" * 50
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 4096])
+def test_read_chunks_splits_multibyte_characters(tmp_path, chunk_size):
+    """Test that characters split across chunks are decoded whole."""
+    path = tmp_path / "input.txt"
+    path.write_text(TEXT, encoding="utf-8")
+    assert "".join(read_chunks(str(path), chunk_size)) == TEXT
+    assert "".join(read_chunks(io.BytesIO(TEXT.encode("utf-8")), chunk_size)) == TEXT
+
+
+def test_read_empty_file(tmp_path):
+    """Test that an empty file, which cannot be mapped, yields nothing."""
+    path = tmp_path / "empty.txt"
+    path.write_bytes(b"")
+    assert list(read_chunks(str(path))) == []
+
+
+def test_invalid_utf8_survives_round_trip():
+    """Test that undecodable bytes are passed through unchanged."""
+    data = b"abc\xff\xfedef"
+    output = io.BytesIO()
+    write_chunks(read_chunks(io.BytesIO(data), 2), output)
+    assert output.getvalue() == data
+
+
+@pytest.mark.parametrize("language_name,transformer_class", LANGUAGE_TRANSFORMERS.items())
+def test_translate_file_matches_transform(tmp_path, language_name, transformer_class):
+    """Test file-to-file translation in both directions with small chunks."""
+    transformer = transformer_class()
+    source, translated, restored = (tmp_path / name for name in ("in.txt", "out.txt", "back.txt"))
+    source.write_text(TEXT, encoding="utf-8")
+
+    characters, written = translate_file(str(source), str(translated), transformer.transform_stream, chunk_size=5)
+    expected = transformer.transform(TEXT)
+    assert characters == len(TEXT)
+    assert written == len(expected.encode("utf-8"))
+    assert translated.read_text(encoding="utf-8") == expected
+
+    translate_file(str(translated), str(restored), transformer.reverse_transform_stream, chunk_size=5)
+    assert restored.read_text(encoding="utf-8") == transformer.reverse_transform(expected)
+
+
+def test_line_blocks():
+    """Test that chunks are regrouped into blocks of whole lines."""
+    assert list(line_blocks(["ab\nc", "d", "e\nf\ng"])) == ["ab\n", "cde\nf\n", "g"]
+    assert "".join(line_blocks(TEXT[i:i + 7] for i in range(0, len(TEXT), 7))) == TEXT
+
+
+def test_line_blocks_cap_long_lines():
+    """Test that a line longer than the cap is cut between words instead of buffered whole."""
+    text = "word " * 1000
+    blocks = list(line_blocks((text[i:i + 64] for i in range(0, len(text), 64)), size=100))
+    assert "".join(blocks) == text
+    assert max(map(len, blocks)) <= 100
+    assert all(block.endswith(" ") for block in blocks)
+    assert list(line_blocks(["x" * 250], size=100)) == ["x" * 100, "x" * 100, "x" * 50]
+    assert list(line_blocks(["ab\n" + "x" * 150], size=100)) == ["ab\n", "x" * 100, "x" * 50]
@@ -0,0 +1,96 @@
+"""Test suite for the lazy language registry."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from src.languages import registry
+from src.languages.base import BaseTransformer
+from src.languages.registry import BUILTIN_LANGUAGES, LanguageRegistry
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+
+class ShoutTransformer(BaseTransformer):
+    """A minimal third-party style transformer."""
+
+    def transform(self, text: str) -> str:
+        return text.upper()
+
+    def reverse_transform(self, text: str) -> str:
+        return text.lower()
+
+
+class FakeEntryPoint:
+    """Stand-in for an ``importlib.metadata.EntryPoint``."""
+
+    def __init__(self, name, value):
+        self.name = name
+        self.value = value
+        self.loads = 0
+
+    def load(self):
+        self.loads += 1
+        return self.value
+
+
+def test_listing_languages_imports_no_transformers():
+    """Test that names are available without importing language modules."""
+    code = (
+        "import sys\n"
+        "from src.languages import LANGUAGE_TRANSFORMERS, get_available_languages\n"
+        "names = get_available_languages()\n"
+        "before = sorted(m for m in sys.modules if m.startswith('src.languages.'))\n"
+        "LANGUAGE_TRANSFORMERS['necrotic']\n"
+        "after = sorted(m for m in sys.modules if m.startswith('src.languages.'))\n"
+        "print(names, before, after)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=PROJECT_ROOT, capture_output=True, text=True, check=True
+    )
+    names, before, after = result.stdout.strip().split("] [")
+    assert "'necrotic'" in names
+    assert "src.languages.elvish" not in before and "src.languages.necrotic" not in before
+    assert "src.languages.necrotic" in after and "src.languages.elvish" not in after
+
+
+def test_entry_point_languages(monkeypatch):
+    """Test that entry points add languages without shadowing built-ins."""
+    shout = FakeEntryPoint("Shout", ShoutTransformer)
+    shadow = FakeEntryPoint("elvish", ShoutTransformer)
+    monkeypatch.setattr(registry, "_iter_entry_points", lambda: [shout, shadow])
+    languages = LanguageRegistry(BUILTIN_LANGUAGES)
+
+    assert "shout" in languages
+    assert shout.loads == 0
+    assert languages["shout"] is ShoutTransformer
+    assert languages["shout"] is ShoutTransformer
+    assert shout.loads == 1
+    assert languages["elvish"].__name__ == "ElvishTransformer"
+    assert len(languages) == len(BUILTIN_LANGUAGES) + 1
+
+
+def test_builtin_lookup_skips_entry_points(monkeypatch):
+    """Test that resolving a built-in language never scans entry points."""
+    def fail():
+        raise AssertionError("entry points scanned")
+
+    monkeypatch.setattr(registry, "_iter_entry_points", fail)
+    languages = LanguageRegistry(BUILTIN_LANGUAGES)
+    assert languages["cybernetic"].__name__ == "CyberneticTransformer"
+    assert languages.is_loaded("cybernetic")
+
+
+def test_register_and_invalid_languages(monkeypatch):
+    """Test explicit registration and lookups that must fail."""
+    monkeypatch.setattr(registry, "_iter_entry_points", lambda: [])
+    languages = LanguageRegistry({})
+    languages.register("Shout", ShoutTransformer)
+    languages.register("broken", lambda: dict)
+
+    assert languages["shout"]().transform("hi") == "HI"
+    with pytest.raises(TypeError):
+        languages["broken"]
+    with pytest.raises(KeyError):
+        languages["missing"]
@@ -0,0 +1,182 @@
+"""Test suite for the asyncio HTTP translation service."""
+
+import asyncio
+import json
+
+import pytest
+from src.languages import LANGUAGE_TRANSFORMERS
+from src.metrics import REGISTRY
+from src.server import MicroBatcher, TranslationServer
+
+
+async def _request(port, method, path, payload=None):
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    body = json.dumps(payload).encode('utf-8') if payload is not None else b''
+    writer.write(
+        f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nContent-Length: {len(body)}\r\n"
+        "Connection: close\r\n\r\n".encode('latin-1') + body
+    )
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, body = response.partition(b'\r\n\r\n')
+    status = int(head.split()[1])
+    return status, json.loads(body)
+
+
+def _serve(test, **batcher_options):
+    async def main():
+        server = TranslationServer(port=0, batcher=MicroBatcher(workers=1, **batcher_options))
+        await server.start()
+        try:
+            return await test(server)
+        finally:
+            await server.close()
+    return asyncio.run(main())
+
+
+@pytest.mark.parametrize("language", sorted(LANGUAGE_TRANSFORMERS))
+def test_translate_and_reverse(language):
+    """Test both endpoints against the transformer for every language."""
+    transformer = LANGUAGE_TRANSFORMERS[language]()
+    text = "The three shy thieves"
+
+    async def test(server):
+        status, forward = await _request(server.port, 'POST', '/translate', {'text': text, 'language': language})
+        assert status == 200
+        assert forward['translation'] == transformer.transform(text)
+        status, back = await _request(server.port, 'POST', '/reverse',
+                                      {'text': forward['translation'], 'language': language})
+        assert status == 200
+        assert back['translation'] == transformer.reverse_transform(forward['translation'])
+
+    _serve(test)
+
+
+def test_concurrent_requests_are_batched():
+    """Test that concurrent requests share engine calls and keep their own results."""
+    transformer = LANGUAGE_TRANSFORMERS['elvish']()
+    texts = [f"hello number {i}" for i in range(20)]
+
+    async def test(server):
+        responses = await asyncio.gather(*(
+            _request(server.port, 'POST', '/translate', {'text': text, 'language': 'elvish'})
+            for text in texts
+        ))
+        assert [body['translation'] for _, body in responses] == [transformer.transform(t) for t in texts]
+        return server.batcher.stats
+
+    stats = _serve(test, max_batch_delay=0.05)
+    assert stats['requests'] == 20
+    assert stats['batches'] < 20
+
+
+def test_large_payload_is_offloaded():
+    """Test that payloads over the threshold are translated in the process pool."""
+    transformer = LANGUAGE_TRANSFORMERS['cybernetic']()
+    text = "thirty three things " * 100
+
+    async def test(server):
+        status, body = await _request(server.port, 'POST', '/translate', {'text': text, 'language': 'cybernetic'})
+        assert status == 200
+        assert body['translation'] == transformer.transform(text)
+        return server.batcher.stats
+
+    assert _serve(test, offload_chars=1000)['offloaded'] == 1
+
+
+def test_errors():
+    """Test the status codes for bad requests."""
+    async def test(server):
+        assert (await _request(server.port, 'POST', '/translate', {'text': 'x', 'language': 'nope'}))[0] == 400
+        assert (await _request(server.port, 'POST', '/translate', {'text': 1, 'language': 'elvish'}))[0] == 400
+        assert (await _request(server.port, 'GET', '/translate'))[0] == 405
+        assert (await _request(server.port, 'GET', '/missing'))[0] == 404
+        status, body = await _request(server.port, 'GET', '/languages')
+        assert status == 200 and 'elvish' in body['languages']
+
+    _serve(test)
+
+
+@pytest.mark.parametrize("head, status", [
+    (b"Transfer-Encoding: chunked\r\n", 501),
+    (b"".join(b"X-Header-%d: 1\r\n" % i for i in range(150)), 431),
+    (b"X-Long: " + b"x" * 100_000 + b"\r\n", 431),
+])
+def test_unread_requests_close_the_connection(head, status):
+    """Test that an error raised before the body is read closes a keep-alive connection."""
+    async def test(server):
+        reader, writer = await asyncio.open_connection('127.0.0.1', server.port)
+        writer.write(b"POST /translate HTTP/1.1\r\nHost: localhost\r\n" + head + b"\r\n"
+                     b"5\r\nhello\r\n0\r\n\r\n")
+        await writer.drain()
+        response = await asyncio.wait_for(reader.read(), timeout=5)
+        writer.close()
+        return response
+
+    response = _serve(test)
+    assert response.startswith(b"HTTP/1.1 %d " % status)
+    assert b"Connection: close" in response
+    assert response.count(b"HTTP/1.1") == 1
+
+
+def test_request_line_over_the_limit():
+    """Test that a request line longer than the reader's buffer is refused and the connection closed."""
+    async def test(server):
+        reader, writer = await asyncio.open_connection('127.0.0.1', server.port)
+        writer.write(b"GET /" + b"x" * 100_000 + b" HTTP/1.1\r\nHost: localhost\r\n\r\n")
+        await writer.drain()
+        response = await asyncio.wait_for(reader.read(), timeout=5)
+        writer.close()
+        return response
+
+    response = _serve(test)
+    assert response.startswith(b"HTTP/1.1 400 ")
+    assert b"Request line too long" in response
+    assert b"Connection: close" in response
+
+
+def test_large_bodies_are_coded_in_the_pool():
+    """Test that large request and response bodies are handled off the event loop."""
+    transformer = LANGUAGE_TRANSFORMERS['elvish']()
+    text = "thirty three things " * 100
+
+    async def test(server):
+        status, body = await _request(server.port, 'POST', '/translate', {'text': text, 'language': 'elvish'})
+        assert status == 200 and body['translation'] == transformer.transform(text)
+        status, body = await _request(server.port, 'POST', '/translate', {'text': 1, 'language': 'x' * 2000})
+        assert status == 400 and body['error'] == "'text' and 'language' must be strings"
+        return server.batcher._executor is not None
+
+    assert _serve(test, offload_chars=1000)
+
+
+def test_transform_many_matches_transform():
+    """Test that batched engine calls match translating each text on its own."""
+    texts = ["The thief", "", "SHH th", "x\x00y", "  spaced  "]
+    for language in LANGUAGE_TRANSFORMERS:
+        transformer = LANGUAGE_TRANSFORMERS[language]()
+        assert transformer.transform_many(texts) == [transformer.transform(t) for t in texts]
+        encoded = [transformer.transform(t) for t in texts]
+        assert transformer.reverse_transform_many(encoded) == [transformer.reverse_transform(t) for t in encoded]
+
+
+def test_metrics_endpoint():
+    """Test that batches are recorded and served in the Prometheus format."""
+    async def test(server):
+        await _request(server.port, 'POST', '/translate', {'text': 'hi', 'language': 'elvish'})
+        reader, writer = await asyncio.open_connection('127.0.0.1', server.port)
+        writer.write(b"GET /metrics HTTP/1.1\r\nConnection: close\r\n\r\n")
+        response = (await reader.read()).decode('utf-8')
+        writer.close()
+        return response
+
+    REGISTRY.reset()
+    REGISTRY.enable()
+    try:
+        response = _serve(test)
+    finally:
+        REGISTRY.disable()
+        REGISTRY.reset()
+    assert 'langgen_translations_total{language="elvish",direction="forward"} 1' in response
+    assert 'langgen_batch_duration_seconds_count{language="elvish",direction="forward"} 1' in response
@@ -0,0 +1,99 @@
+"""Test suite for streaming transformation."""
+
+import random
+
+import pytest
+from src.languages import LANGUAGE_TRANSFORMERS
+from src.languages.base import BaseTransformer
+
+TEXT = (
+    "The thing shall PHASE through CHURCHES; whales quench Ng THIRST.\n"
+    "Mixed case TeXt with  spaces\tand tabs 0b01 ᚦ ✧ 123 !@#"
+) * 3
+
+
+def chunked(text, sizes):
+    """Split text into consecutive chunks of the given sizes, cycling."""
+    chunks, position, i = [], 0, 0
+    while position < len(text):
+        size = sizes[i % len(sizes)]
+        chunks.append(text[position:position + size])
+        position += size
+        i += 1
+    return chunks
+
+
+@pytest.mark.parametrize("language_name,transformer_class", LANGUAGE_TRANSFORMERS.items())
+@pytest.mark.parametrize("sizes", [[1], [2, 3], [7, 1, 4], [1000]])
+def test_stream_matches_whole_text(language_name, transformer_class, sizes):
+    """Test that streaming in any chunking matches one-shot transformation."""
+    transformer = transformer_class()
+    expected = transformer.transform(TEXT)
+    assert "".join(transformer.transform_stream(chunked(TEXT, sizes))) == expected
+
+    expected_reverse = transformer.reverse_transform(expected)
+    streamed = transformer.reverse_transform_stream(chunked(expected, sizes))
+    assert "".join(streamed) == expected_reverse
+
+
+@pytest.mark.parametrize("language_name,transformer_class", LANGUAGE_TRANSFORMERS.items())
+def test_stream_random_chunks(language_name, transformer_class):
+    """Test random chunk boundaries against random text."""
+    rng = random.Random(language_name)
+    alphabet = "thcspngwqukTHCSPNGWQUK aeiou0b1\n"
+    transformer = transformer_class()
+    for _ in range(20):
+        text = "".join(rng.choice(alphabet) for _ in range(200))
+        sizes = [rng.randint(1, 9) for _ in range(5)]
+        encoded = transformer.transform(text)
+        assert "".join(transformer.transform_stream(chunked(text, sizes))) == encoded
+        streamed = transformer.reverse_transform_stream(chunked(encoded, sizes))
+        assert "".join(streamed) == transformer.reverse_transform(encoded)
+
+
+@pytest.mark.parametrize("language_name,chunks,expected", [
+    ("elvish", ["t", "h"], "ᚦ"),
+    ("cybernetic", ["0b", "01"], "b"),
+    ("insectoid", ["th", "k", "k"], "th"),
+])
+def test_boundary_examples(language_name, chunks, expected):
+    """Test digraphs and codes split across chunks."""
+    transformer = LANGUAGE_TRANSFORMERS[language_name]()
+    if language_name == "elvish":
+        assert "".join(transformer.transform_stream(chunks)) == expected
+    else:
+        assert "".join(transformer.reverse_transform_stream(chunks)) == expected
+
+
+@pytest.mark.parametrize("chunks", [
+    ["ΑΣ", "Β"],
+    ["ΑΣ", ""],
+    ["Α", "Σ", "Β"],
+    ["Α", "Σ"],
+    ["ΑΣ'", "Β"],
+    ["ΑΣ ", "Β"],
+    ["ΟΔΥΣΣΕΥΣ", " ΚΑΙ ΣΑΣ"],
+])
+def test_fold_case_final_sigma(chunks):
+    """Test that a capital sigma at a chunk end lower-cases as in the whole text."""
+    transformer = LANGUAGE_TRANSFORMERS["dwarvish"]()
+    text = "".join(chunks)
+    assert "".join(transformer.transform_stream(chunks)) == transformer.transform(text)
+    assert "".join(transformer.reverse_transform_stream(chunks)) == transformer.reverse_transform(text)
+    output, consumed = transformer.transform_partial(chunks[0])
+    assert output + transformer.transform(chunks[0][consumed:] + "".join(chunks[1:])) == transformer.transform(text)
+
+
+def test_default_stream_splits_on_whitespace():
+    """Test the word-based fallback used by hand-written transformers."""
+    class Reverser(BaseTransformer):
+        def transform(self, text):
+            return " ".join(word[::-1] for word in text.split(" "))
+
+        def reverse_transform(self, text):
+            return self.transform(text)
+
+    transformer = Reverser()
+    output = list(transformer.transform_stream(["hel", "lo wor", "ld", " again"]))
+    assert "".join(output) == "olleh dlrow niaga"
+    assert output[0] == "olleh "
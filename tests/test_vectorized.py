@@ -0,0 +1,40 @@
+"""Test suite for the optional NumPy translation backend."""
+
+import pytest
+from src.languages import LANGUAGE_TRANSFORMERS
+from src.languages.engine import VECTOR_MIN_CHARS, TranslationTable
+
+pytest.importorskip("numpy")
+from src.languages.vectorized import VectorTable  # noqa: E402
+
+SAMPLE = "The quick brown fox ᚠ jumps 🦊 over\tthe lazy dog. \ud800 Ünïcödé!\n"
+
+
+@pytest.mark.parametrize("language", ['celestial', 'necrotic', 'cybernetic', 'dwarvish'])
+def test_matches_str_translate(language):
+    """Test fixed- and variable-width tables against str.translate."""
+    table = LANGUAGE_TRANSFORMERS[language]()._forward_table
+    vector = VectorTable.build(table._singles)
+    text = SAMPLE * 50
+    assert vector.translate(text) == text.translate(table._singles)
+    assert vector.translate('') == ''
+
+
+def test_variable_width_with_empty_replacements():
+    """Test replacements of length zero, one and several."""
+    vector = VectorTable.build(TranslationTable({'a': '', 'b': 'xyz', 'c': 'q'})._singles)
+    assert not vector.fixed_width
+    assert vector.translate("abcd€ba") == "xyzqd€xyz"
+
+
+def test_large_fixed_width_input_uses_backend():
+    """Test that large inputs of one-to-one tables go through the backend."""
+    table = LANGUAGE_TRANSFORMERS['celestial']()._forward_table
+    text = SAMPLE * (VECTOR_MIN_CHARS // len(SAMPLE) + 1)
+    assert table.translate(text) == text.translate(table._singles)
+    assert table._vector is not None
+
+    # Variable-width tables stay on str.translate
+    table = LANGUAGE_TRANSFORMERS['cybernetic']()._forward_table
+    assert table.translate(text) == text.translate(table._singles)
+    assert table._vector is None
@@ -0,0 +1,107 @@
+"""Test suite for round-trip verification."""
+
+import pytest
+from src import verify
+from src.languages import LANGUAGE_TRANSFORMERS
+from src.pipeline import line_blocks
+from src.verify import RoundTripVerifier, round_trip_matches
+
+TEXT = "The three Shy thieves\nsaid HELLO\n\nto the thrush\n"
+
+
+@pytest.mark.parametrize("language", sorted(LANGUAGE_TRANSFORMERS))
+def test_round_trips_verify_cleanly(language):
+    """Test that every language's own translations pass, ignoring case."""
+    translated = LANGUAGE_TRANSFORMERS[language]().transform(TEXT)
+    verifier = RoundTripVerifier(language, workers=1)
+    verifier.add(TEXT, translated)
+    verifier.finish()
+    assert (verifier.lines, verifier.checked, verifier.mismatches) == (4, 4, 0)
+
+
+def test_long_line_parts_count_once():
+    """Test that a line cut into several blocks is numbered and counted as one line."""
+    transformer = LANGUAGE_TRANSFORMERS['elvish']()
+    verifier = RoundTripVerifier('elvish', workers=1)
+    for block in line_blocks(["the thief sat " * 100 + "\nend\n"], size=200):
+        verifier.add(block, transformer.transform(block))
+    verifier.finish()
+    assert (verifier.lines, verifier.checked, verifier.mismatches) == (2, 2, 0)
+
+
+@pytest.mark.parametrize("language", sorted(LANGUAGE_TRANSFORMERS))
+@pytest.mark.parametrize("reverse", [False, True])
+def test_verified_long_line_without_whitespace(language, reverse, tmp_path):
+    """Test that cutting a line with no whitespace in a key does not change its translation."""
+    from src.cli import _pipe
+
+    text = "x" + "th" * 200 + "\n" + "SHH" * 100
+    if reverse:
+        text = LANGUAGE_TRANSFORMERS[language]().transform(text)
+    source = tmp_path / "in.txt"
+    source.write_text(text, encoding='utf-8')
+    outputs = []
+    for verify_mode in ('off', 'full'):
+        output = tmp_path / f"{verify_mode}.txt"
+        _pipe(str(source), str(output), language, reverse, chunk_size=100, verify=verify_mode)
+        outputs.append(output.read_text(encoding='utf-8'))
+    assert outputs[0] == outputs[1]
+
+
+def test_mismatches_are_reported_by_line():
+    """Test that a damaged line is found and numbered."""
+    transformer = LANGUAGE_TRANSFORMERS['cybernetic']()
+    verifier = RoundTripVerifier('cybernetic', workers=1)
+    verifier.add("good\n", transformer.transform("good\n"))
+    verifier.add("fine\nbad\n", transformer.transform("fine\n") + "@@@\n")
+    verifier.finish()
+    assert verifier.mismatches == 1
+    assert verifier.examples[0][:2] == (3, "bad")
+    assert "1 mismatched" in verifier.summary()
+
+
+def test_sampling_and_off():
+    """Test that sampling checks a share of the lines and off checks none."""
+    transformer = LANGUAGE_TRANSFORMERS['elvish']()
+    lines = "".join(f"line {i}\n" for i in range(1000))
+    translated = transformer.transform(lines)
+
+    sampled = RoundTripVerifier('elvish', mode='sample', sample_rate=0.1, workers=1, seed=1)
+    sampled.add(lines, translated)
+    sampled.finish()
+    assert 50 < sampled.checked < 150 and sampled.mismatches == 0
+
+    off = RoundTripVerifier('elvish', mode='off')
+    off.add(lines, translated)
+    off.finish()
+    assert not off.enabled and off.checked == 0 and off.lines == 1000
+
+
+def test_parallel_verification(monkeypatch):
+    """Test that checks sent to worker processes are collected."""
+    monkeypatch.setattr(verify, 'MIN_PARALLEL_CHARS', 100)
+    transformer = LANGUAGE_TRANSFORMERS['insectoid']()
+    verifier = RoundTripVerifier('insectoid', workers=2)
+    for i in range(20):
+        block = f"block {i} of the thin things\n" * 10
+        verifier.add(block, transformer.transform(block) if i != 7 else "?\n" * 10)
+    verifier.finish()
+    assert verifier.checked == 200
+    assert verifier.mismatches == 10
+    assert verifier.examples[0][0] == 71
+
+
+def test_invalid_options():
+    """Test that unknown modes and rates outside 0 to 1 are rejected."""
+    with pytest.raises(ValueError):
+        RoundTripVerifier('elvish', mode='some')
+    with pytest.raises(ValueError):
+        RoundTripVerifier('elvish', mode='sample', sample_rate=2)
+    assert round_trip_matches("The Thief", "the thief")
+
+
+def test_parallel_threshold_matches_batch():
+    """Test that the verifier's copy of the parallel threshold stays in step."""
+    from src.batch import MIN_PARALLEL_CHARS
+
+    assert verify.MIN_PARALLEL_CHARS == MIN_PARALLEL_CHARS